@@ -1,28 +1,56 @@
 import arcade
 import math
 import random
-from scripts.mechanics.bullet import Bullet
+from functools import lru_cache
+from scripts.mechanics.bullet import cull_bullets
+from scripts.mechanics.bullet_patterns import BULLET_PATTERNS, emit_volley
+from scripts.utils.constants import ARENA_WIDTH, ARENA_HEIGHT
+from scripts.mechanics.collision import BOX
+from scripts.utils.pipeline import LazySpriteList
 
 ENEMY_SPEED = 100
 WANDER_SPEED = 80
 
+@lru_cache(maxsize=None)
+def enemy_texture():
+    return arcade.make_soft_square_texture(32, arcade.color.RED, outer_alpha=255)
+
+
 class Enemy(arcade.Sprite):
-    def __init__(self, start_x, start_y, target_sprite, behavior="chaser"):
+    collision_shape = BOX
+
+    def __init__(self, start_x, start_y, target_sprite, behavior="chaser", flow_field=None, pattern="aimed"):
         super().__init__()
-        self.texture = arcade.make_soft_square_texture(32, arcade.color.RED, outer_alpha=255)
+        self.texture = enemy_texture()
         self.center_x = start_x
         self.center_y = start_y
+        # Where the last collision test saw it, for swept hits
+        self.last_x = start_x
+        self.last_y = start_y
         self.target_sprite = target_sprite
         self.behavior = behavior
-        self.bullets = arcade.SpriteList()
+        self.flow_field = flow_field
+        self.bullets = LazySpriteList()
 
         # Wanderer direction
         self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
 
-        # Shooter cooldown
+        # Shooter pattern and cooldown
+        self.pattern = pattern
         self.bullet_timer = 0
+        self.volleys_fired = 0
+
+        # Last frame's movement in px/s, read by neighbours for alignment
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+
+        # Time owed to this enemy while its updates are being throttled
+        self.pending_dt = 0.0
 
     def update(self, delta_time: float = 1 / 60):
+        start_x = self.center_x
+        start_y = self.center_y
+
         if self.behavior == "chaser":
             self._follow_player(delta_time)
         elif self.behavior == "wander":
@@ -30,9 +58,23 @@ class Enemy(arcade.Sprite):
         elif self.behavior == "shooter":
             self._shoot(delta_time)
 
-        self.bullets.update()
+        if delta_time > 0:
+            self.velocity_x = (self.center_x - start_x) / delta_time
+            self.velocity_y = (self.center_y - start_y) / delta_time
+
+        # Bullets are moved once per tick by the game loop, with the tick's real delta
+        if self.bullets:
+            cull_bullets(self.bullets)
 
     def _follow_player(self, dt):
+        # Shared flow field: one lookup, and it routes around obstacles
+        if self.flow_field is not None:
+            direction = self.flow_field.sample(self.center_x, self.center_y)
+            if direction is not None:
+                self.center_x += direction[0] * ENEMY_SPEED * dt
+                self.center_y += direction[1] * ENEMY_SPEED * dt
+                return
+
         dx = self.target_sprite.center_x - self.center_x
         dy = self.target_sprite.center_y - self.center_y
         distance = math.hypot(dx, dy)
@@ -46,21 +88,20 @@ class Enemy(arcade.Sprite):
         self.center_x += dx * WANDER_SPEED * dt
         self.center_y += dy * WANDER_SPEED * dt
 
-        # Bounce off screen edges
-        if self.left < 0 or self.right > 800:
+        # Bounce off the arena edges
+        if self.left < 0 or self.right > ARENA_WIDTH:
             self.direction = (-self.direction[0], self.direction[1])
-        if self.bottom < 0 or self.top > 600:
+        if self.bottom < 0 or self.top > ARENA_HEIGHT:
             self.direction = (self.direction[0], -self.direction[1])
 
     def _shoot(self, dt):
+        pattern = BULLET_PATTERNS[self.pattern]
         self.bullet_timer += dt
-        if self.bullet_timer >= 1.5:
+        if self.bullet_timer >= pattern.wait(self.volleys_fired):
             self.bullet_timer = 0
-            bullet = Bullet(
-                self.center_x,
-                self.center_y,
-                self.target_sprite.center_x,
-                self.target_sprite.center_y,
-                source=self
-            )
-            self.bullets.append(bullet)
+            heading = 0.0
+            if pattern.aimed:
+                heading = math.atan2(self.target_sprite.center_y - self.center_y,
+                                     self.target_sprite.center_x - self.center_x)
+            emit_volley(self.bullets, pattern, self.center_x, self.center_y, heading, self.volleys_fired, source=self)
+            self.volleys_fired += 1
@@ -1,15 +1,20 @@
 import arcade
 import math
+import random
 
-from scripts.views.game_over_view import GameOverView
-from scripts.utils.resource_helper import resource_path
-
-damage_sound = arcade.load_sound(resource_path("assets/audio/damage.wav"))
+from scripts.utils.registry import VIEWS
+from scripts.mechanics.modifiers import StatSheet
+from scripts.utils.mixer import play_sfx
+from scripts.utils.particles import emit_particles
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from scripts.mechanics.collision import BOX
 
 PLAYER_SPEED = 300
 DASH_DISTANCE = 150
 
 class Player(arcade.Sprite):
+    collision_shape = BOX
+
     def __init__(self, start_x, start_y):
         super().__init__()
         self.texture = arcade.make_soft_square_texture(32, arcade.color.CYAN, outer_alpha=255)
@@ -17,20 +22,20 @@ class Player(arcade.Sprite):
         self.center_y = start_y
         self.target_x = start_x
         self.target_y = start_y
+        # Position at the last collision check; the swept test covers everything since then
+        self.last_x = start_x
+        self.last_y = start_y
         self.can_dash = False
         self.dash_timer = 0
         self.invincible = False
         self.invincibility_timer = 0
         self.blink_state = True
-        self.max_slots = 3
+        # speed_bonus, multiplier, cooldown, cooldown_factor, max_slots, ... come from the sheet
+        self.stats = StatSheet(self)
         self.current_hearts = 3.0
         self.gold_hearts = 0
-        self.speed_bonus = 1.0
-        self.multiplier = 1.0
         self.shield = False
-        self.mult_timer = 0
-        self.cooldown_factor = 1.0
-        self.cooldown = 1.0
+        self.revives = 0
         self.artifacts = []
         self.active_orbs = []
         self.vision_blur = False
@@ -53,12 +58,9 @@ class Player(arcade.Sprite):
             self.target_y = y
 
     def update(self, delta_time: float = 1 / 60):
-        self.dash_timer += delta_time * self.cooldown_factor
-
-        if self.mult_timer > 0:
-            self.mult_timer -= delta_time
-            if self.mult_timer <= 0:
-                self.multiplier = 1.0
+        # Same recovery rate as the artifacts, so cooldown buffs and debuffs agree
+        self.dash_timer += delta_time * self.cooldown_rate
+        self.stats.tick(delta_time)
 
         for orb in self.active_orbs:
             orb[1] -= delta_time
@@ -71,7 +73,7 @@ class Player(arcade.Sprite):
 
         for artifact in self.artifacts:
             if hasattr(artifact, "cooldown_timer") and artifact.cooldown_timer < artifact.cooldown:
-                artifact.cooldown_timer += delta_time
+                artifact.cooldown_timer += delta_time * self.cooldown_rate
 
         if self.target_x and self.target_y:
             dx = self.target_x - self.center_x
@@ -106,27 +108,33 @@ class Player(arcade.Sprite):
             self.big_hitbox_timer -= delta_time
             if self.big_hitbox_timer <= 0:
                 self.width, self.height = self.original_size
-                self.set_hit_box(self.texture.hit_box_points)
 
     def try_dash(self):
         for artifact in self.artifacts:
             if artifact.name == "Dash":
                 if artifact.cooldown_timer >= artifact.cooldown:
-                    self.perform_dash()
-                    artifact.cooldown_timer = 0
+                    if self.perform_dash():
+                        artifact.cooldown_timer = 0
                 else:
                     print("❌ Dash on cooldown.")
 
     def perform_dash(self):
+        # Standing still there's no direction to dash in; keep the charge
+        if self.target_x is None or self.target_y is None:
+            return False
         dx = self.target_x - self.center_x
         dy = self.target_y - self.center_y
         distance = math.hypot(dx, dy)
         if distance > 0:
             direction_x = dx / distance
             direction_y = dy / distance
+            # Trail sprays backwards from where the dash started
+            emit_particles("dash", self.center_x, self.center_y, math.atan2(-dy, -dx))
             self.center_x += direction_x * DASH_DISTANCE
             self.center_y += direction_y * DASH_DISTANCE
             self.dash_timer = 0
+            return True
+        return False
 
     def take_damage(self, amount: float):
         if self.invincible:
@@ -134,8 +142,12 @@ class Player(arcade.Sprite):
         if self.shield:
             self.shield = False
             return
+        if self.absorb_chance and random.random() < self.absorb_chance:
+            print("💥 Hit absorbed!")
+            return
 
-        arcade.play_sound(damage_sound)
+        play_sfx("damage")
+        emit_particles("damage", self.center_x, self.center_y)
         self.invincible = True
         self.invincibility_timer = 0
         while amount > 0:
@@ -148,8 +160,15 @@ class Player(arcade.Sprite):
             else:
                 break
         if self.current_hearts + self.gold_hearts <= 0:
+            if self.revives > 0:
+                self.revives -= 1
+                self.current_hearts = 1.0
+                print("💖 Second Chance! Revived with 1 heart")
+                return
             if self.window and self.parent_view:
-                self.window.show_view(GameOverView(self.parent_view.score))
+                wave_manager = getattr(self.parent_view, "wave_manager", None)
+                wave = wave_manager.wave if wave_manager else None
+                self.window.show_view(VIEWS["game_over"](self.parent_view.score, wave))
 
     def draw(self):
         if not self.invincible or self.blink_state:
@@ -168,7 +187,7 @@ class Player(arcade.Sprite):
             x = x_start + (self.max_slots + i) * 40
             arcade.draw_text("💛", x, y, arcade.color.GOLD, 30)
 
-    def draw_orb_status(self, screen_width=800, screen_height=600):
+    def draw_orb_status(self, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
         x = screen_width - 220
         y = screen_height - 30
         line_height = 20
@@ -0,0 +1,152 @@
+import math
+from contextlib import contextmanager
+
+import arcade
+
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, ARENA_WIDTH, ARENA_HEIGHT
+
+CHUNK_SIZE = 200
+# Chunks this far past the camera edge stay live: more than a dash, so the player never
+# reaches anything that was skipped
+CULL_MARGIN = 200
+CAMERA_FOLLOW = 8.0  # 1/s; higher catches up with the player faster
+GRID_COLOR = (40, 40, 60)
+BORDER_COLOR = (90, 90, 140)
+
+
+class Camera:
+    """Scrolls the logical screen over the arena, following the player and clamped to the edges."""
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, arena_width=ARENA_WIDTH,
+                 arena_height=ARENA_HEIGHT, follow=CAMERA_FOLLOW):
+        self.width = width
+        self.height = height
+        self.arena_width = arena_width
+        self.arena_height = arena_height
+        self.follow_rate = follow
+        self.left = 0.0
+        self.bottom = 0.0
+
+    def _clamp(self):
+        self.left = min(max(self.left, 0.0), max(0.0, self.arena_width - self.width))
+        self.bottom = min(max(self.bottom, 0.0), max(0.0, self.arena_height - self.height))
+
+    def center_on(self, x, y):
+        self.left = x - self.width / 2
+        self.bottom = y - self.height / 2
+        self._clamp()
+
+    def follow(self, x, y, dt):
+        # Exponential ease toward centring (x, y), independent of the tick rate
+        t = 1.0 - math.exp(-self.follow_rate * dt)
+        self.left += (x - self.width / 2 - self.left) * t
+        self.bottom += (y - self.height / 2 - self.bottom) * t
+        self._clamp()
+
+    def to_world(self, x, y):
+        return x + self.left, y + self.bottom
+
+    def to_screen(self, x, y):
+        return x - self.left, y - self.bottom
+
+    def rect(self, margin=0.0):
+        return (self.left - margin, self.bottom - margin,
+                self.left + self.width + margin, self.bottom + self.height + margin)
+
+
+@contextmanager
+def world_projection(ctx, left, bottom, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """Draw in world coordinates with the screen's lower left corner at (left, bottom)."""
+    # Whole pixels, so sprites don't shimmer while the camera eases
+    left = round(left)
+    bottom = round(bottom)
+    previous = ctx.projection_2d
+    ctx.projection_2d = (left, left + width, bottom, bottom + height)
+    try:
+        yield
+    finally:
+        ctx.projection_2d = previous
+
+
+class ChunkCuller:
+    """
+    Splits the arena into CHUNK_SIZE squares and tracks the live ones: those under the
+    camera plus CULL_MARGIN.
+
+    The player is always on screen, so anything in another chunk can't touch it this
+    tick; the game loop skips those sprites' collision tests and their draws. Live
+    chunks always form a rectangle, so a test is a chunk lookup and two range checks.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE, margin=CULL_MARGIN):
+        self.chunk_size = chunk_size
+        self.margin = margin
+        self.live = (0, 0, -1, -1)  # first col, first row, last col, last row
+
+    def update(self, camera):
+        left, bottom, right, top = camera.rect(self.margin)
+        size = self.chunk_size
+        self.live = (int(left // size), int(bottom // size), int(right // size), int(top // size))
+
+    def is_live(self, x, y):
+        size = self.chunk_size
+        col0, row0, col1, row1 = self.live
+        return col0 <= x // size <= col1 and row0 <= y // size <= row1
+
+    def visible(self, sprites):
+        is_live = self.is_live
+        return [sprite for sprite in sprites if is_live(sprite.center_x, sprite.center_y)]
+
+    def grid_lines(self, arena_width=ARENA_WIDTH, arena_height=ARENA_HEIGHT):
+        """Chunk boundaries inside the live area, as point pairs for arcade.draw_lines."""
+        size = self.chunk_size
+        col0, row0, col1, row1 = self.live
+        bottom, top = max(0, row0 * size), min(arena_height, (row1 + 1) * size)
+        left, right = max(0, col0 * size), min(arena_width, (col1 + 1) * size)
+        points = []
+        for col in range(max(1, col0), col1 + 1):
+            if col * size < arena_width:
+                points += [(col * size, bottom), (col * size, top)]
+        for row in range(max(1, row0), row1 + 1):
+            if row * size < arena_height:
+                points += [(left, row * size), (right, row * size)]
+        return points
+
+
+class CulledLayer:
+    """
+    Draw list holding only the live part of a simulation sprite list.
+
+    Rebuilding it every frame would cost an append per sprite, so it is synced by
+    difference: only sprites that crossed the live boundary, spawned or died since the
+    last frame are added or removed. Members are an insertion-ordered dict, so newcomers
+    join in source order and the draw order stays put from frame to frame.
+    """
+
+    def __init__(self):
+        self.sprites = arcade.SpriteList()
+        self.members = {}
+
+    def sync(self, live):
+        live = dict.fromkeys(live)
+        members = self.members
+        sprites = self.sprites
+        for sprite in members.keys() - live.keys():
+            sprites.remove(sprite)
+        for sprite in live:
+            if sprite not in members:
+                sprites.append(sprite)
+        self.members = live
+
+    def draw(self):
+        self.sprites.draw()
+
+
+def draw_arena(grid_lines, arena_width=ARENA_WIDTH, arena_height=ARENA_HEIGHT):
+    # Faint chunk grid so scrolling reads as movement, plus the arena's edge. A single-screen
+    # arena never scrolls, so it keeps its original look.
+    if arena_width <= SCREEN_WIDTH and arena_height <= SCREEN_HEIGHT:
+        return
+    if grid_lines:
+        arcade.draw_lines(grid_lines, GRID_COLOR, 1)
+    arcade.draw_lrtb_rectangle_outline(0, arena_width, arena_height, 0, BORDER_COLOR, 3)
@@ -6,8 +6,8 @@ class DashArtifact:
 
     def apply_effect(self, player, *_):
         if self.cooldown_timer >= self.cooldown:
-            player.perform_dash()
-            self.cooldown_timer = 0
-            print("⚡ Dash used!")
+            if player.perform_dash():
+                self.cooldown_timer = 0
+                print("⚡ Dash used!")
         else:
             print("❌ Dash on cooldown.")
@@ -1,24 +1,100 @@
 import arcade
 import math
+from functools import lru_cache
+
+from scripts.utils.constants import ARENA_WIDTH, ARENA_HEIGHT
 
 BULLET_SPEED = 250
+# Bullets this far past the arena edge are dropped and kept for reuse
+BULLET_CULL_MARGIN = 50
+MAX_POOLED_BULLETS = 2048
+
+# Toggled by the quality governor; plain discs are cheaper to blend than soft glows
+bullet_glow = True
+
+
+@lru_cache(maxsize=None)
+def bullet_texture(glow=True):
+    if glow:
+        return arcade.make_soft_circle_texture(10, arcade.color.YELLOW, outer_alpha=255)
+    return arcade.make_circle_texture(10, arcade.color.YELLOW)
+
+
+def set_bullet_glow(enabled, bullet_lists=()):
+    global bullet_glow
+    bullet_glow = enabled
+    texture = bullet_texture(enabled)
+    for bullets in bullet_lists:
+        for bullet in bullets:
+            bullet.texture = texture
 
 class Bullet(arcade.Sprite):
     def __init__(self, start_x, start_y, target_x, target_y, source=None):
         super().__init__()
-        self.texture = arcade.make_soft_circle_texture(10, arcade.color.YELLOW, outer_alpha=255)
-        self.center_x = start_x
-        self.center_y = start_y
-        self.age = 0
-        self.source = source
-
         dx = target_x - start_x
         dy = target_y - start_y
         dist = math.hypot(dx, dy)
+        self.launch(start_x, start_y, dx / dist * BULLET_SPEED, dy / dist * BULLET_SPEED, source)
 
-        self.velocity = (dx / dist * BULLET_SPEED, dy / dist * BULLET_SPEED)
+    def launch(self, x, y, velocity_x, velocity_y, source=None):
+        """(Re)fire from (x, y); pooled bullets go through here instead of a new sprite."""
+        texture = bullet_texture(bullet_glow)
+        if self.texture is not texture:
+            self.texture = texture
+        self.position = (x, y)
+        self.last_x = x
+        self.last_y = y
+        self.age = 0
+        self.source = source
+        self.velocity = (velocity_x, velocity_y)
 
     def update(self, delta_time: float = 1 / 60):
         self.age += delta_time
-        self.center_x += self.velocity[0] * delta_time
-        self.center_y += self.velocity[1] * delta_time
+        # One position write instead of two: each pushes the change to every sprite list
+        x, y = self.position
+        self.position = (x + self.velocity[0] * delta_time, y + self.velocity[1] * delta_time)
+
+
+class BulletPool:
+    """
+    Bullets that left the arena, handed back out by the next volley.
+
+    Building a sprite costs several times more than re-aiming one, and a volley can be
+    hundreds of bullets, so emitters take a whole batch from here at once.
+    """
+
+    def __init__(self, limit=MAX_POOLED_BULLETS):
+        self.free = []
+        self.limit = limit
+
+    def acquire(self, count):
+        free = self.free
+        reused = free[len(free) - min(count, len(free)):]
+        del free[len(free) - len(reused):]
+        reused.extend(Bullet(0, 0, 1, 0) for _ in range(count - len(reused)))
+        return reused
+
+    def reserve(self, count):
+        """Build bullets ahead of time, at a wave start rather than mid-fight."""
+        count = min(count, self.limit) - len(self.free)
+        if count > 0:
+            self.free.extend(Bullet(0, 0, 1, 0) for _ in range(count))
+
+    def release(self, bullets):
+        room = self.limit - len(self.free)
+        if room > 0:
+            self.free.extend(bullets[:room])
+
+
+bullet_pool = BulletPool()
+
+
+def cull_bullets(bullets, margin=BULLET_CULL_MARGIN):
+    """Drop bullets that flew out of the arena from the list and return them to the pool."""
+    gone = [
+        b for b in bullets
+        if not (-margin < b.center_x < ARENA_WIDTH + margin and -margin < b.center_y < ARENA_HEIGHT + margin)
+    ]
+    for bullet in gone:
+        bullets.remove(bullet)
+    bullet_pool.release(gone)
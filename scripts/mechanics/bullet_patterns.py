@@ -0,0 +1,67 @@
+import math
+
+from scripts.mechanics.bullet import BULLET_SPEED, bullet_pool
+
+
+class BulletPattern:
+    """
+    A shooter's volley shape, precomputed into a velocity table.
+
+    The table holds one (vx, vy) per bullet for a heading of 0 rad: count bullets fanned
+    over spread (evenly around the circle when spread is a full turn), repeated at each
+    speed for rings that travel outwards together. Firing only rotates the table to the
+    volley's heading, so no per-bullet trig runs in the game loop.
+    """
+
+    def __init__(self, count=1, spread=0.0, speeds=(BULLET_SPEED,), volleys=1, volley_gap=0.0,
+                 interval=1.5, spin=0.0, aimed=True):
+        self.volleys = volleys        # volleys per sequence, volley_gap seconds apart
+        self.volley_gap = volley_gap
+        self.interval = interval      # seconds between sequences
+        self.spin = spin              # heading added per volley fired, for spirals
+        self.aimed = aimed            # heading starts at the player, else at 0 rad
+
+        if spread >= math.tau:
+            angles = [math.tau * i / count for i in range(count)]
+        elif count > 1:
+            angles = [spread * (i / (count - 1) - 0.5) for i in range(count)]
+        else:
+            angles = [0.0]
+        self.table_x = tuple(math.cos(a) * speed for speed in speeds for a in angles)
+        self.table_y = tuple(math.sin(a) * speed for speed in speeds for a in angles)
+
+    def __len__(self):
+        return len(self.table_x)
+
+    def wait(self, volleys_fired):
+        """Seconds before the next volley, given how many this shooter has fired so far."""
+        return self.volley_gap if volleys_fired % self.volleys else self.interval
+
+    def velocities(self, heading):
+        c = math.cos(heading)
+        s = math.sin(heading)
+        return [(vx * c - vy * s, vx * s + vy * c) for vx, vy in zip(self.table_x, self.table_y)]
+
+
+# In unlock order; generate_wave makes one more available every WAVE_TUNING["pattern_every"] waves
+BULLET_PATTERNS = {
+    "aimed": BulletPattern(),
+    "spread": BulletPattern(count=5, spread=0.9, interval=1.8),
+    "burst": BulletPattern(volleys=4, volley_gap=0.12, interval=2.0, speeds=(300,)),
+    "ring": BulletPattern(count=24, spread=math.tau, interval=2.5, spin=math.tau / 48, aimed=False),
+    "spiral": BulletPattern(count=6, spread=math.tau, volleys=12, volley_gap=0.1, interval=1.5,
+                            spin=0.22, speeds=(200,), aimed=False),
+    "storm": BulletPattern(count=72, spread=math.tau, speeds=(170, 220, 270), interval=3.5,
+                           spin=math.tau / 144, aimed=False),
+}
+PATTERN_NAMES = list(BULLET_PATTERNS)
+
+
+def emit_volley(bullets, pattern, x, y, heading, volleys_fired=0, source=None):
+    """Fire one volley of pattern from (x, y) into the bullets sprite list in a single batch."""
+    velocities = pattern.velocities(heading + pattern.spin * volleys_fired)
+    batch = bullet_pool.acquire(len(velocities))
+    for bullet, (vx, vy) in zip(batch, velocities):
+        bullet.launch(x, y, vx, vy, source)
+    bullets.extend(batch)
+    return batch
@@ -1,18 +1,26 @@
 import arcade
+from functools import lru_cache
 from arcade import AnimationKeyframe
-from scripts.utils.resource_helper import resource_path
+from scripts.utils.resource_helper import load_spritesheet
+
+
+@lru_cache(maxsize=None)
+def coin_textures():
+    # Decoded once and shared by every coin
+    return load_spritesheet(
+        "assets/items/coin2_20x20.png",  # Adjust path as needed
+        sprite_width=20,
+        sprite_height=20,
+        columns=9,
+        count=9
+    )
+
 
 class Coin(arcade.AnimatedTimeBasedSprite):
     def __init__(self, x, y):
         super().__init__()
 
-        texture_list = arcade.load_spritesheet(
-            resource_path("assets/items/coin2_20x20.png"),  # Adjust path as needed
-            sprite_width=20,
-            sprite_height=20,
-            columns=9,
-            count=9
-        )
+        texture_list = coin_textures()
 
         for i, texture in enumerate(texture_list):
             self.frames.append(AnimationKeyframe(i, 100, texture))  # 100 ms per frame
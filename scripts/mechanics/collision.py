@@ -0,0 +1,117 @@
+# Shape descriptors: sprites set `collision_shape` as a class attribute; anything without
+# one is treated as a circle. Sizes always come from the live width/height, so scaling a
+# sprite (the big_hitbox debuff) resizes its shape with no hit box to rebuild.
+CIRCLE = "circle"
+BOX = "box"
+
+
+def collision_radius(sprite):
+    return min(sprite.width, sprite.height) / 2
+
+
+def circle_circle(ax, ay, ar, bx, by, br):
+    dx = ax - bx
+    dy = ay - by
+    reach = ar + br
+    return dx * dx + dy * dy <= reach * reach
+
+
+def circle_box(cx, cy, radius, bx, by, half_w, half_h):
+    # Distance from the circle centre to the closest point of the box
+    dx = max(abs(cx - bx) - half_w, 0.0)
+    dy = max(abs(cy - by) - half_h, 0.0)
+    return dx * dx + dy * dy <= radius * radius
+
+
+def box_box(ax, ay, a_half_w, a_half_h, bx, by, b_half_w, b_half_h):
+    return abs(ax - bx) <= a_half_w + b_half_w and abs(ay - by) <= a_half_h + b_half_h
+
+
+def shape_of(sprite):
+    """(kind, half_w, half_h) for a sprite; circles use half_w as the radius."""
+    if getattr(sprite, "collision_shape", CIRCLE) == BOX:
+        return BOX, sprite.width / 2, sprite.height / 2
+    radius = collision_radius(sprite)
+    return CIRCLE, radius, radius
+
+
+def _test(kind, x, y, half_w, half_h, other):
+    other_kind, other_w, other_h = shape_of(other)
+    ox = other.center_x
+    oy = other.center_y
+    if kind == CIRCLE:
+        if other_kind == CIRCLE:
+            return circle_circle(x, y, half_w, ox, oy, other_w)
+        return circle_box(x, y, half_w, ox, oy, other_w, other_h)
+    if other_kind == CIRCLE:
+        return circle_box(ox, oy, other_w, x, y, half_w, half_h)
+    return box_box(x, y, half_w, half_h, ox, oy, other_w, other_h)
+
+
+def overlaps(a, b):
+    """Exact shape test between two sprites, the analytic stand-in for arcade.check_for_collision."""
+    kind, half_w, half_h = shape_of(a)
+    return _test(kind, a.center_x, a.center_y, half_w, half_h, b)
+
+
+def collide_many(sprite, others):
+    """
+    Everything in `others` that overlaps `sprite`, as a list so callers can remove hits
+    from the sprite list while walking the result. The query shape is resolved once and
+    each candidate first goes through a cheap bounding-square reject.
+    """
+    kind, half_w, half_h = shape_of(sprite)
+    x = sprite.center_x
+    y = sprite.center_y
+    hits = []
+    for other in others:
+        # Half extents of the other sprite bound both shapes, so this never rejects a hit
+        reach_x = half_w + other.width / 2
+        reach_y = half_h + other.height / 2
+        if abs(other.center_x - x) > reach_x or abs(other.center_y - y) > reach_y:
+            continue
+        if _test(kind, x, y, half_w, half_h, other):
+            hits.append(other)
+    return hits
+
+
+def swept_circle_hit(ax0, ay0, ax1, ay1, bx0, by0, bx1, by1, radius):
+    """
+    Continuous circle test: True if A (moving from a0 to a1) and B (moving from b0 to b1)
+    come within `radius` (the sum of both radii) at any point during the step.
+    """
+    # In B's frame A travels a straight segment and B sits at the origin
+    sx = ax0 - bx0
+    sy = ay0 - by0
+    dx = (ax1 - bx1) - sx
+    dy = (ay1 - by1) - sy
+
+    length_sq = dx * dx + dy * dy
+    t = 0.0
+    if length_sq > 0:
+        t = max(0.0, min(1.0, -(sx * dx + sy * dy) / length_sq))
+
+    cx = sx + dx * t
+    cy = sy + dy * t
+    return cx * cx + cy * cy <= radius * radius
+
+
+def sprite_swept_hit(mover, target):
+    """
+    Swept test between two sprites using the positions recorded at the previous check
+    (last_x/last_y). The sweep treats both as circles; the exact shapes are tested where
+    they ended up, so box corners still count.
+    """
+    return overlaps(mover, target) or swept_circle_hit(
+        getattr(mover, "last_x", mover.center_x), getattr(mover, "last_y", mover.center_y),
+        mover.center_x, mover.center_y,
+        getattr(target, "last_x", target.center_x), getattr(target, "last_y", target.center_y),
+        target.center_x, target.center_y,
+        collision_radius(mover) + collision_radius(target),
+    )
+
+
+def mark_checked(sprite):
+    """Record the current position as the start of the next swept test."""
+    sprite.last_x = sprite.center_x
+    sprite.last_y = sprite.center_y
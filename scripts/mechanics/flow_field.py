@@ -0,0 +1,157 @@
+import math
+from collections import deque
+
+CELL_SIZE = 32
+
+# 8-way neighbours with integer step costs (10 straight, 14 diagonal)
+NEIGHBOURS = [
+    (1, 0, 10), (-1, 0, 10), (0, 1, 10), (0, -1, 10),
+    (1, 1, 14), (1, -1, 14), (-1, 1, 14), (-1, -1, 14),
+]
+UNREACHABLE = 1 << 30
+
+
+class FlowField:
+    """
+    Grid of steering directions toward a target, shared by every chaser.
+
+    The field is rebuilt only when the target moves into another cell (or obstacles
+    change); after that each chaser's pathing is a single cell lookup, whatever the
+    number of enemies. Cells that can see the target point straight at it, the rest
+    follow the cheapest neighbour around obstacles.
+    """
+
+    def __init__(self, width, height, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = math.ceil(width / cell_size)
+        self.rows = math.ceil(height / cell_size)
+        self.blocked = set()
+        self.cost = [UNREACHABLE] * (self.cols * self.rows)
+        self.dir_x = [0.0] * (self.cols * self.rows)
+        self.dir_y = [0.0] * (self.cols * self.rows)
+        self.target_cell = None
+        self.rebuilds = 0
+
+    def cell_of(self, x, y):
+        col = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        row = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return col, row
+
+    def add_obstacle(self, left, bottom, right, top):
+        c0, r0 = self.cell_of(left, bottom)
+        c1, r1 = self.cell_of(right, top)
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                self.blocked.add((col, row))
+        self.target_cell = None  # force a rebuild
+
+    def clear_obstacles(self):
+        self.blocked.clear()
+        self.target_cell = None
+
+    def update(self, target_x, target_y):
+        """Rebuild if the target changed cell; returns True when a rebuild happened."""
+        cell = self.cell_of(target_x, target_y)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        self._build(cell)
+        self.rebuilds += 1
+        return True
+
+    def _build(self, target):
+        cols, rows = self.cols, self.rows
+        if not self.blocked:
+            # Open arena: every cell sees the target, no search needed
+            self.cost = [0] * (cols * rows)
+            self._build_directions(target)
+            return
+
+        cost = [UNREACHABLE] * (cols * rows)
+        tc, tr = target
+        cost[tr * cols + tc] = 0
+
+        # Dial's algorithm: the step costs are small integers, so a bucket queue is enough
+        buckets = {0: deque([target])}
+        current = 0
+        pending = 1
+        while pending:
+            while current not in buckets or not buckets[current]:
+                buckets.pop(current, None)
+                current += 1
+            col, row = buckets[current].popleft()
+            pending -= 1
+            if cost[row * cols + col] < current:
+                continue
+            for dc, dr, step in NEIGHBOURS:
+                nc, nr = col + dc, row + dr
+                if not (0 <= nc < cols and 0 <= nr < rows) or (nc, nr) in self.blocked:
+                    continue
+                # No corner cutting past blocked cells
+                if dc and dr and ((col + dc, row) in self.blocked or (col, row + dr) in self.blocked):
+                    continue
+                new_cost = current + step
+                index = nr * cols + nc
+                if new_cost < cost[index]:
+                    cost[index] = new_cost
+                    buckets.setdefault(new_cost, deque()).append((nc, nr))
+                    pending += 1
+
+        self.cost = cost
+        self._build_directions(target)
+
+    def _build_directions(self, target):
+        cols, rows = self.cols, self.rows
+        tc, tr = target
+        for row in range(rows):
+            for col in range(cols):
+                index = row * cols + col
+                if self.cost[index] == UNREACHABLE or (col, row) == target:
+                    self.dir_x[index] = self.dir_y[index] = 0.0
+                    continue
+
+                if not self.blocked or self._line_of_sight(col, row, tc, tr):
+                    dx, dy = tc - col, tr - row
+                else:
+                    best = min(
+                        ((col + dc, row + dr) for dc, dr, _ in NEIGHBOURS
+                         if 0 <= col + dc < cols and 0 <= row + dr < rows),
+                        key=lambda c: self.cost[c[1] * cols + c[0]],
+                    )
+                    dx, dy = best[0] - col, best[1] - row
+
+                length = math.hypot(dx, dy)
+                self.dir_x[index] = dx / length
+                self.dir_y[index] = dy / length
+
+    def _line_of_sight(self, c0, r0, c1, r1):
+        # Bresenham walk between cell centres
+        dc, dr = abs(c1 - c0), -abs(r1 - r0)
+        sc = 1 if c0 < c1 else -1
+        sr = 1 if r0 < r1 else -1
+        err = dc + dr
+        while (c0, r0) != (c1, r1):
+            if (c0, r0) in self.blocked:
+                return False
+            e2 = 2 * err
+            if e2 >= dr:
+                err += dr
+                c0 += sc
+            if e2 <= dc:
+                err += dc
+                r0 += sr
+        return True
+
+    def sample(self, x, y):
+        """Steering direction at (x, y), or None near the target where chasers should aim directly."""
+        col, row = self.cell_of(x, y)
+        if self.target_cell is None:
+            return None
+        if abs(col - self.target_cell[0]) <= 1 and abs(row - self.target_cell[1]) <= 1:
+            return None
+        index = row * self.cols + col
+        dx = self.dir_x[index]
+        dy = self.dir_y[index]
+        if dx == 0.0 and dy == 0.0:
+            return None
+        return dx, dy
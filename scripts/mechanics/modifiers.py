@@ -0,0 +1,117 @@
+ADD = "add"
+MUL = "mul"
+SET = "set"
+OPS = [ADD, MUL, SET]
+
+BASE_STATS = {
+    "speed_bonus": 1.0,
+    "multiplier": 1.0,       # score multiplier
+    "cooldown": 1.0,         # artifact cooldown length, 0.8 = 20% shorter
+    "cooldown_factor": 1.0,  # debuff on top of cooldown, 2.0 = twice as long
+    "max_slots": 3,
+    "absorb_chance": 0.0,    # chance a hit is negated outright
+    "orb_rate": 1.0,
+    "coin_rate": 1.0,
+}
+
+# Stats computed from the folded ones, cached the same way
+DERIVED_STATS = {
+    "cooldown_rate": lambda s: 1.0 / (s["cooldown"] * s["cooldown_factor"]),
+}
+
+# Shop effect prefix -> (stat, amount per point), e.g. "speed_5" adds 0.05 to speed_bonus
+UPGRADE_STATS = {
+    "speed": ("speed_bonus", 0.01),
+    "hp": ("max_slots", 1),
+    "orb": ("orb_rate", 0.01),
+    "coin": ("coin_rate", 0.01),
+    "absorb": ("absorb_chance", 0.01),
+}
+
+
+class Modifier:
+    def __init__(self, stat, op, value, source, duration=None):
+        self.stat = stat
+        self.op = op
+        self.value = value
+        self.source = source      # tag like "upgrade:speed_5" or "orb:slow", used for removal
+        self.duration = duration  # seconds left, or None for permanent
+
+
+class StatSheet:
+    """
+    Base stats plus a stack of tagged modifiers, folded into plain attributes on the owner.
+
+    Adds are summed, then multipliers applied, then sets override (latest wins). The fold
+    only runs when the stack changes, so hot paths like movement just read
+    player.speed_bonus.
+    """
+
+    def __init__(self, owner, base=BASE_STATS):
+        self.owner = owner
+        self.base = dict(base)
+        self.modifiers = []
+        self.timed = 0
+        self.recomputes = 0
+        self.recompute()
+
+    def add(self, stat, op, value, source, duration=None, replace=False):
+        """Push a modifier; with replace=True any modifier from the same source is dropped first."""
+        if replace:
+            self.modifiers = [m for m in self.modifiers if m.source != source]
+        self.modifiers.append(Modifier(stat, op, value, source, duration))
+        self.recompute()
+
+    def remove(self, source):
+        count = len(self.modifiers)
+        self.modifiers = [m for m in self.modifiers if m.source != source]
+        if len(self.modifiers) != count:
+            self.recompute()
+
+    def has(self, source):
+        return any(m.source == source for m in self.modifiers)
+
+    def tick(self, delta_time):
+        if not self.timed:
+            return
+        expired = False
+        for modifier in self.modifiers:
+            if modifier.duration is not None:
+                modifier.duration -= delta_time
+                expired = expired or modifier.duration <= 0
+        if expired:
+            self.modifiers = [m for m in self.modifiers if m.duration is None or m.duration > 0]
+            self.recompute()
+
+    def recompute(self):
+        stats = dict(self.base)
+        for op in OPS:
+            for modifier in self.modifiers:
+                if modifier.op != op:
+                    continue
+                if op == ADD:
+                    stats[modifier.stat] += modifier.value
+                elif op == MUL:
+                    stats[modifier.stat] *= modifier.value
+                else:
+                    stats[modifier.stat] = modifier.value
+        for name, value in self.base.items():
+            if isinstance(value, int):
+                stats[name] = round(stats[name])  # counts like max_slots stay whole
+        for name, derive in DERIVED_STATS.items():
+            stats[name] = derive(stats)
+
+        for name, value in stats.items():
+            setattr(self.owner, name, value)
+        self.timed = sum(1 for m in self.modifiers if m.duration is not None)
+        self.recomputes += 1
+
+
+def apply_upgrade(player, effect):
+    """Add the modifier for a permanent shop upgrade; owning one twice has no extra effect."""
+    prefix, _, amount = effect.rpartition("_")
+    if prefix not in UPGRADE_STATS:
+        return False
+    stat, per_point = UPGRADE_STATS[prefix]
+    player.stats.add(stat, ADD, int(amount) * per_point, f"upgrade:{effect}", replace=True)
+    return True
@@ -1,4 +1,5 @@
 import arcade
+from scripts.mechanics.modifiers import ADD, MUL, SET
 
 class BuffOrb(arcade.Sprite):
     def __init__(self, x, y, orb_type="gray"):
@@ -42,7 +43,7 @@ class BuffOrb(arcade.Sprite):
 
     def apply_effect(self, player):
         if self.orb_type == "gray":
-            player.max_slots += 1
+            player.stats.add("max_slots", ADD, 1, "orb:gray")
             print(self.message)
         elif self.orb_type == "red":
             if player.current_hearts < player.max_slots:
@@ -54,30 +55,28 @@ class BuffOrb(arcade.Sprite):
             player.gold_hearts += 1
             print(self.message)
         elif self.orb_type == "speed_10":
-            player.speed_bonus += 0.10
+            player.stats.add("speed_bonus", ADD, 0.10, "orb:speed_10", duration=45)
             player.active_orbs.append(["⚡ Speed +10%", 45])
             print(self.message)
         elif self.orb_type == "speed_20":
-            player.speed_bonus += 0.20
+            player.stats.add("speed_bonus", ADD, 0.20, "orb:speed_20", duration=40)
             player.active_orbs.append(["⚡ Speed +20%", 40])
             print(self.message)
         elif self.orb_type == "speed_35":
-            player.speed_bonus += 0.35
+            player.stats.add("speed_bonus", ADD, 0.35, "orb:speed_35", duration=30)
             player.active_orbs.append(["⚡ Speed +35%", 30])
             print(self.message)
         elif self.orb_type == "mult_1_5":
-            player.multiplier = 1.5
-            player.mult_timer = 30
+            player.stats.add("multiplier", SET, 1.5, "orb:multiplier", duration=30, replace=True)
             player.active_orbs.append(["Score x1.5", 30])
             print(self.message)
         elif self.orb_type == "mult_2":
-            player.multiplier = 2.0
-            player.mult_timer = 30
+            player.stats.add("multiplier", SET, 2.0, "orb:multiplier", duration=30, replace=True)
             player.active_orbs.append(["Score x2", 30])
             print(self.message)
         elif self.orb_type == "cooldown":
             self.message = "🔁 Cooldown reduced! (20%)"
-            player.cooldown *= 0.8
+            player.stats.add("cooldown", MUL, 0.8, "orb:cooldown")
             print(self.message)
         elif self.orb_type == "shield":
             player.shield = True
@@ -1,4 +1,5 @@
 import arcade
+from scripts.mechanics.modifiers import ADD, SET
 
 class DebuffOrb(arcade.Sprite):
     def __init__(self, x, y, orb_type="inverse"):
@@ -36,7 +37,7 @@ class DebuffOrb(arcade.Sprite):
     def apply_effect(self, player):
         if self.orb_type == "slow":
             self.message = "🐢 Speed -20%"
-            player.speed_bonus -= 0.2
+            player.stats.add("speed_bonus", ADD, -0.2, "orb:slow", duration=30)
             player.active_orbs.append(["🐢 Speed -20%", 30])
             print(self.message)
         elif self.orb_type == "big_hitbox":
@@ -45,24 +46,21 @@ class DebuffOrb(arcade.Sprite):
                 player.original_size = (player.width, player.height)
             player.width = player.original_size[0] * 1.5
             player.height = player.original_size[1] * 1.5
-            player.set_hit_box(player.texture.hit_box_points)
             player.active_orbs.append(["⬛ Big Hitbox", 30])
             print(self.message)
         elif self.orb_type == "mult_down_0_5":
             self.message = "💥 Score x0.5 for 30s"
-            player.multiplier = 0.5
-            player.mult_timer = 30
+            player.stats.add("multiplier", SET, 0.5, "orb:multiplier", duration=30, replace=True)
             player.active_orbs.append(["Score x0.5", 30])
             print(self.message)
         elif self.orb_type == "mult_down_0_25":
             self.message = "💥 Score x0.25 for 30s"
-            player.multiplier = 0.25
-            player.mult_timer = 30
+            player.stats.add("multiplier", SET, 0.25, "orb:multiplier", duration=30, replace=True)
             player.active_orbs.append(["Score x0.25", 30])
             print(self.message)
         elif self.orb_type == "cooldown_up":
             self.message = "🔁 Cooldown increased!"
-            player.cooldown_factor = 2.0
+            player.stats.add("cooldown_factor", SET, 2.0, "orb:cooldown_up", duration=15, replace=True)
             player.active_orbs.append(["⏱️ Cooldown ↑", 15])
             print(self.message)
         elif self.orb_type == "inverse_move":
@@ -0,0 +1,80 @@
+import math
+
+# (max distance from the player, ticks between updates); the last band catches the rest
+LOD_BANDS = (
+    (200, 1),
+    (400, 2),
+    (None, 4),
+)
+# Enemies that could close into the first band within this many seconds stay at full rate
+THREAT_HORIZON = 1.0
+# Behaviours that always update every tick: shooters' volleys are timed to the tick
+FULL_RATE_BEHAVIORS = ("shooter",)
+
+
+class SimLOD:
+    """
+    Level-of-detail scheduler for enemy updates.
+
+    Each tick enemies are banded by distance to the player. Near ones update every tick.
+    Bands further out update every few ticks with the time they were owed, staggered by
+    list position so each tick only updates a slice of them. An enemy closing in on the
+    near band, or a shooter, is treated as a threat and keeps its full rate. The governor
+    can stretch the reduced bands further through `scale`.
+    """
+
+    def __init__(self, bands=LOD_BANDS, horizon=THREAT_HORIZON):
+        self.bands = bands
+        self.horizon = horizon
+        self.tick = 0
+        self.band_counts = [0] * len(bands)  # enemies per band on the last tick
+        self.updates = 0                     # enemy updates since the last report
+        self.ticks = 0
+
+    def interval(self, enemy, px, py):
+        """Ticks between updates for this enemy, before scaling; also counts its band."""
+        if enemy.behavior in FULL_RATE_BEHAVIORS:
+            self.band_counts[0] += 1
+            return 1
+        dx = px - enemy.center_x
+        dy = py - enemy.center_y
+        distance = math.hypot(dx, dy)
+        if distance > 0:
+            # Closing speed from last update's velocity, positive when heading at the player
+            closing = (enemy.velocity_x * dx + enemy.velocity_y * dy) / distance
+            distance -= max(0.0, closing) * self.horizon
+        for i, (limit, interval) in enumerate(self.bands):
+            if limit is None or distance <= limit:
+                self.band_counts[i] += 1
+                return interval
+        self.band_counts[-1] += 1
+        return self.bands[-1][1]
+
+    def update(self, enemies, player, delta_time, scale=1):
+        """Update the enemies due this tick; returns {enemy: step} for the ones that moved."""
+        self.tick += 1
+        self.ticks += 1
+        self.band_counts = [0] * len(self.bands)
+        px = player.center_x
+        py = player.center_y
+        steps = {}
+        for i, enemy in enumerate(enemies):
+            interval = self.interval(enemy, px, py)
+            enemy.pending_dt += delta_time
+            if interval > 1 and (self.tick + i) % (interval * scale):
+                continue
+            step = enemy.pending_dt
+            enemy.pending_dt = 0.0
+            enemy.update(step)
+            steps[enemy] = step
+        self.updates += len(steps)
+        return steps
+
+    def report(self):
+        if not self.ticks:
+            return "🔭 LOD: no ticks"
+        text = (f"🔭 LOD: {self.updates / self.ticks:.1f} enemy updates per tick, bands "
+                f"{'/'.join(str(count) for count in self.band_counts)}")
+        self.updates = 0
+        self.ticks = 0
+        return text
@@ -0,0 +1,273 @@
+import math
+import struct
+from array import array
+from itertools import chain
+
+from scripts.characters.enemy import Enemy
+from scripts.mechanics.bullet import bullet_pool
+from scripts.mechanics.bullet_patterns import PATTERN_NAMES
+from scripts.mechanics.coins.coin import Coin
+from scripts.mechanics.orbs.buff_orbs import BuffOrb
+from scripts.mechanics.orbs.debuff_orbs import DebuffOrb
+from scripts.utils.registry import ARTIFACTS
+from scripts.utils.spawner import DashArtifactPickup
+from scripts.mechanics.modifiers import OPS, Modifier
+
+# Binary layout, little endian, all sections back to back:
+#   header | game | player | player strings | modifiers | enemies (+ their bullets) | orbs | coins | pickup
+# Bump SNAPSHOT_VERSION whenever a field list below changes.
+SNAPSHOT_MAGIC = b"NDSS"
+SNAPSHOT_VERSION = 6
+HEADER = struct.Struct("<4sH")
+
+GAME_FIELDS = [
+    ("score", "d"), ("level_timer", "f"), ("wave_duration", "f"), ("in_wave", "?"), ("wave_pause", "?"),
+    ("wave_pause_timer", "f"), ("wave_message_alpha", "h"), ("orb_spawn_timer", "f"),
+    ("artifact_spawn_timer", "f"), ("coins_to_spawn", "H"), ("coin_spawn_timer", "f"),
+]
+PLAYER_FIELDS = [
+    ("center_x", "f"), ("center_y", "f"), ("target_x", "f"), ("target_y", "f"), ("last_x", "f"), ("last_y", "f"),
+    ("change_x", "f"), ("change_y", "f"), ("width", "f"), ("height", "f"),
+    ("can_dash", "?"), ("dash_timer", "f"), ("invincible", "?"), ("invincibility_timer", "f"), ("blink_state", "?"),
+    ("current_hearts", "f"), ("gold_hearts", "H"), ("shield", "?"), ("revives", "H"), ("vision_blur", "?"),
+    ("vision_timer", "f"), ("inverse_move", "?"), ("big_hitbox_timer", "f"),
+]
+# Coins aren't stored: they persist through the SaveStore, and rewinding or loading an older
+# snapshot must not take back or hand out coins again
+# Stats like speed_bonus and multiplier aren't stored: they are refolded from the saved modifiers
+# Player attributes that may be None (target) or missing until a debuff sets them
+NULLABLE_PLAYER_FIELDS = {"target_x", "target_y"}
+OPTIONAL_PLAYER_FIELDS = {"big_hitbox_timer": 0.0}
+
+GAME = struct.Struct("<" + "".join(fmt for _, fmt in GAME_FIELDS) + "H")  # + wave number
+PLAYER = struct.Struct("<" + "".join(fmt for _, fmt in PLAYER_FIELDS) + "ff")  # + original_size
+COUNT = struct.Struct("<I")
+FLOAT = struct.Struct("<f")
+ENEMY = struct.Struct("<BffbbffffIBI")
+BULLET_FLOATS = 7  # x, y, vx, vy, age, last_x, last_y
+ORB = struct.Struct("<?fff")
+POINT = struct.Struct("<ff")
+PICKUP = struct.Struct("<?ff")
+MODIFIER = struct.Struct("<Bff")  # op, value, duration (NaN when permanent)
+
+BEHAVIORS = ["chaser", "wander", "shooter"]
+
+
+def _pack_str(out, text):
+    data = text.encode("utf-8")
+    out.append(COUNT.pack(len(data)))
+    out.append(data)
+
+
+class _Reader:
+    def __init__(self, data):
+        self.view = memoryview(data)
+        self.pos = 0
+
+    def unpack(self, fmt):
+        values = fmt.unpack_from(self.view, self.pos)
+        self.pos += fmt.size
+        return values
+
+    def count(self):
+        return self.unpack(COUNT)[0]
+
+    def string(self):
+        length = self.count()
+        text = bytes(self.view[self.pos:self.pos + length]).decode("utf-8")
+        self.pos += length
+        return text
+
+    def floats(self, n):
+        values = array("f")
+        values.frombytes(self.view[self.pos:self.pos + n * 4])
+        self.pos += n * 4
+        return values
+
+
+def save_snapshot(game):
+    """Serialize a NeododgeGame's simulation state to bytes."""
+    out = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION)]
+    out.append(GAME.pack(*(getattr(game, name) for name, _ in GAME_FIELDS), game.wave_manager.wave))
+    _pack_str(out, game.wave_message)
+
+    player = game.player
+    values = []
+    for name, _ in PLAYER_FIELDS:
+        value = getattr(player, name, OPTIONAL_PLAYER_FIELDS.get(name))
+        values.append(math.nan if value is None else value)
+    original = getattr(player, "original_size", (0.0, 0.0))
+    out.append(PLAYER.pack(*values, *original))
+
+    out.append(COUNT.pack(len(player.active_orbs)))
+    for label, time_left in player.active_orbs:
+        _pack_str(out, label)
+        out.append(FLOAT.pack(time_left))
+    out.append(COUNT.pack(len(player.artifacts)))
+    for artifact in player.artifacts:
+        _pack_str(out, artifact.name)
+        out.append(FLOAT.pack(getattr(artifact, "cooldown_timer", 0.0)))
+    out.append(COUNT.pack(len(player.stats.modifiers)))
+    for modifier in player.stats.modifiers:
+        _pack_str(out, modifier.stat)
+        _pack_str(out, modifier.source)
+        duration = math.nan if modifier.duration is None else modifier.duration
+        out.append(MODIFIER.pack(OPS.index(modifier.op), modifier.value, duration))
+
+    out.append(COUNT.pack(len(game.enemies)))
+    for enemy in game.enemies:
+        out.append(ENEMY.pack(
+            BEHAVIORS.index(enemy.behavior), enemy.center_x, enemy.center_y, enemy.direction[0], enemy.direction[1],
+            enemy.bullet_timer, enemy.pending_dt, enemy.velocity_x, enemy.velocity_y, len(enemy.bullets),
+            PATTERN_NAMES.index(enemy.pattern), enemy.volleys_fired,
+        ))
+        flat = array("f")
+        for b in enemy.bullets:
+            flat.extend((b.center_x, b.center_y, b.velocity[0], b.velocity[1], b.age, b.last_x, b.last_y))
+        out.append(flat.tobytes())
+
+    out.append(COUNT.pack(len(game.orbs)))
+    for orb in game.orbs:
+        out.append(ORB.pack(isinstance(orb, DebuffOrb), orb.center_x, orb.center_y, orb.age))
+        _pack_str(out, orb.orb_type)
+
+    out.append(COUNT.pack(len(game.coins)))
+    out.extend(POINT.pack(coin.center_x, coin.center_y) for coin in game.coins)
+
+    pickup = game.dash_artifact
+    out.append(PICKUP.pack(pickup is not None, pickup.center_x if pickup else 0.0, pickup.center_y if pickup else 0.0))
+    return b"".join(out)
+
+
+def restore_snapshot(game, data):
+    """Load bytes from save_snapshot into an already set-up NeododgeGame, reusing its sprites."""
+    reader = _Reader(data)
+    magic, version = reader.unpack(HEADER)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a Neododge snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Snapshot version {version} is not supported (expected {SNAPSHOT_VERSION})")
+
+    *game_values, wave = reader.unpack(GAME)
+    for (name, _), value in zip(GAME_FIELDS, game_values):
+        setattr(game, name, value)
+    game.wave_manager.wave = wave
+    game.wave_message = reader.string()
+
+    player = game.player
+    *player_values, original_w, original_h = reader.unpack(PLAYER)
+    for (name, _), value in zip(PLAYER_FIELDS, player_values):
+        if name in NULLABLE_PLAYER_FIELDS and math.isnan(value):
+            value = None
+        setattr(player, name, value)
+    if original_w:
+        player.original_size = (original_w, original_h)
+    player.active_orbs = [[reader.string(), reader.unpack(FLOAT)[0]] for _ in range(reader.count())]
+
+    owned = {artifact.name: artifact for artifact in player.artifacts}
+    artifacts = []
+    for _ in range(reader.count()):
+        name = reader.string()
+        artifact = owned.get(name) or ARTIFACTS[name]()
+        artifact.name = name
+        artifact.cooldown_timer = reader.unpack(FLOAT)[0]
+        artifacts.append(artifact)
+    player.artifacts = artifacts
+
+    modifiers = []
+    for _ in range(reader.count()):
+        stat, source = reader.string(), reader.string()
+        op, value, duration = reader.unpack(MODIFIER)
+        modifiers.append(Modifier(stat, OPS[op], value, source, None if math.isnan(duration) else duration))
+    player.stats.modifiers = modifiers
+    player.stats.recompute()
+
+    _restore_enemies(game, reader)
+    _restore_orbs(game, reader)
+
+    coin_count = reader.count()
+    _resize(game.coins, coin_count, lambda: Coin(0, 0))
+    for coin in game.coins:
+        coin.center_x, coin.center_y = reader.unpack(POINT)
+
+    has_pickup, x, y = reader.unpack(PICKUP)
+    if not has_pickup:
+        game.dash_artifact = None
+    elif game.dash_artifact is None:
+        game.dash_artifact = DashArtifactPickup(x, y)
+    else:
+        game.dash_artifact.center_x, game.dash_artifact.center_y = x, y
+
+
+def _resize(sprite_list, count, factory):
+    """Grow or shrink sprite_list to count sprites; returns the ones it dropped."""
+    # Reuse sprites in place: clearing a SpriteList reallocates its GL buffers
+    removed = sprite_list.truncate(count)
+    sprite_list.extend([factory() for _ in range(count - len(sprite_list))])
+    return removed
+
+
+def _restore_enemies(game, reader):
+    removed = _resize(game.enemies, reader.count(), lambda: Enemy(0, 0, game.player, flow_field=game.flow_field))
+    for enemy in removed:
+        bullet_pool.release(enemy.bullets.truncate(0))
+
+    for enemy in game.enemies:
+        (behavior, x, y, dir_x, dir_y, bullet_timer, pending_dt, vel_x, vel_y, bullet_count,
+         pattern, volleys_fired) = reader.unpack(ENEMY)
+        enemy.behavior = BEHAVIORS[behavior]
+        enemy.pattern = PATTERN_NAMES[pattern]
+        enemy.volleys_fired = volleys_fired
+        enemy.center_x, enemy.center_y = x, y
+        enemy.last_x, enemy.last_y = x, y
+        enemy.direction = (dir_x, dir_y)
+        enemy.bullet_timer = bullet_timer
+        enemy.pending_dt = pending_dt
+        enemy.velocity_x, enemy.velocity_y = vel_x, vel_y
+
+        # Bullets go back to and come from the pool, as they do in a fight
+        bullets = enemy.bullets
+        bullet_pool.release(bullets.truncate(bullet_count))
+        added = bullet_pool.acquire(max(0, bullet_count - len(bullets)))
+        flat = reader.floats(bullet_count * BULLET_FLOATS)
+        for i, bullet in enumerate(chain(bullets, added)):
+            bx, by, vx, vy, age, last_x, last_y = flat[i * BULLET_FLOATS:(i + 1) * BULLET_FLOATS]
+            bullet.launch(bx, by, vx, vy, enemy)
+            bullet.age = age
+            bullet.last_x, bullet.last_y = last_x, last_y
+        # Positioned before joining the list, so each is written to its buffers once
+        bullets.extend(added)
+
+
+def _restore_orbs(game, reader):
+    orbs = []
+    for _ in range(reader.count()):
+        is_debuff, x, y, age = reader.unpack(ORB)
+        orbs.append((DebuffOrb if is_debuff else BuffOrb, x, y, age, reader.string()))
+
+    # Orbs only get reused when the type matches, since the type decides texture and effect
+    existing = list(game.orbs)
+    for i, (orb_class, x, y, age, orb_type) in enumerate(orbs):
+        if i < len(existing) and type(existing[i]) is orb_class and existing[i].orb_type == orb_type:
+            orb = existing[i]
+            orb.center_x, orb.center_y = x, y
+        else:
+            orb = orb_class(x, y, orb_type)
+            if i < len(existing):
+                game.orbs[i] = orb
+            else:
+                game.orbs.append(orb)
+        orb.age = age
+    game.orbs.truncate(len(orbs))
+
+
+def write_snapshot(path, game):
+    data = save_snapshot(game)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def read_snapshot(path, game):
+    with open(path, "rb") as f:
+        restore_snapshot(game, f.read())
@@ -0,0 +1,34 @@
+class SpatialGrid:
+    """
+    Uniform bucket grid for neighbour queries.
+
+    Rebuilt from scratch each frame (one dict insert per sprite); a query only looks at
+    the 3x3 block of cells around a point, so with cell_size >= the query radius the
+    cost per query stays constant as the crowd grows.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def rebuild(self, sprites):
+        self.cells.clear()
+        size = self.cell_size
+        for sprite in sprites:
+            key = (int(sprite.center_x // size), int(sprite.center_y // size))
+            bucket = self.cells.get(key)
+            if bucket is None:
+                self.cells[key] = [sprite]
+            else:
+                bucket.append(sprite)
+
+    def query(self, x, y):
+        """Sprites in the cells touching (x, y); callers still check the exact distance."""
+        cx = int(x // self.cell_size)
+        cy = int(y // self.cell_size)
+        cells = self.cells
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                bucket = cells.get((gx, gy))
+                if bucket:
+                    yield from bucket
@@ -0,0 +1,67 @@
+import math
+
+from scripts.mechanics.spatial_grid import SpatialGrid
+
+FLOCKING_BEHAVIORS = ("chaser", "wander")
+NEIGHBOUR_RADIUS = 40
+SEPARATION_SPEED = 120   # px/s push when two enemies overlap completely
+ALIGNMENT_WEIGHT = 0.3   # fraction of the neighbours' average velocity difference to adopt
+MAX_STEER = 150
+
+
+class FlockSteering:
+    """Boids-style separation and alignment for chasers and wanderers, backed by a spatial grid."""
+
+    def __init__(self, radius=NEIGHBOUR_RADIUS):
+        self.radius = radius
+        self.grid = SpatialGrid(radius)
+
+    def apply(self, enemies, dt, steps=None):
+        """Steer every flocker by dt, or with steps ({enemy: step}) only those that moved this tick."""
+        flockers = [enemy for enemy in enemies if enemy.behavior in FLOCKING_BEHAVIORS]
+        self.grid.rebuild(flockers)
+        radius = self.radius
+        radius_sq = radius * radius
+
+        # Compute every offset first so the result doesn't depend on iteration order
+        offsets = []
+        for enemy in flockers:
+            step = dt if steps is None else steps.get(enemy)
+            if step is None:
+                continue
+            x = enemy.center_x
+            y = enemy.center_y
+            sep_x = sep_y = 0.0
+            vel_x = vel_y = 0.0
+            count = 0
+            for other in self.grid.query(x, y):
+                if other is enemy:
+                    continue
+                dx = x - other.center_x
+                dy = y - other.center_y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= radius_sq:
+                    continue
+                if dist_sq == 0:
+                    # Exactly stacked: split them along an arbitrary but stable axis
+                    dx = 1.0 if id(enemy) > id(other) else -1.0
+                    dist_sq = 1.0
+                sep_x += dx / dist_sq
+                sep_y += dy / dist_sq
+                vel_x += other.velocity_x
+                vel_y += other.velocity_y
+                count += 1
+
+            if not count:
+                continue
+            steer_x = sep_x * radius * SEPARATION_SPEED + (vel_x / count - enemy.velocity_x) * ALIGNMENT_WEIGHT
+            steer_y = sep_y * radius * SEPARATION_SPEED + (vel_y / count - enemy.velocity_y) * ALIGNMENT_WEIGHT
+            length = math.hypot(steer_x, steer_y)
+            if length > MAX_STEER:
+                steer_x *= MAX_STEER / length
+                steer_y *= MAX_STEER / length
+            offsets.append((enemy, steer_x * step, steer_y * step))
+
+        for enemy, ox, oy in offsets:
+            enemy.center_x += ox
+            enemy.center_y += oy
@@ -2,48 +2,59 @@ import random
 from scripts.characters.enemy import Enemy
 from scripts.mechanics.orbs.buff_orbs import BuffOrb
 from scripts.mechanics.orbs.debuff_orbs import DebuffOrb
-from scripts.mechanics.artifacts.dash_artifact import DashArtifact
-from scripts.mechanics.artifacts.magnet_pulse import MagnetPulseArtifact
-from scripts.mechanics.artifacts.slow_field import SlowFieldArtifact
-from scripts.mechanics.artifacts.bullet_time import BulletTimeArtifact
-from scripts.mechanics.artifacts.clone_dash import CloneDashArtifact
 from scripts.mechanics.coins.coin import Coin
+from scripts.mechanics.bullet import bullet_pool
+from scripts.mechanics.bullet_patterns import BULLET_PATTERNS, PATTERN_NAMES
+from scripts.utils.registry import ARTIFACTS
+
+# Difficulty knobs for generate_wave; tools/balance_sim.py sweeps over these
+WAVE_TUNING = {
+    "base_enemies": 3,         # enemies on wave 0, plus one per wave
+    "bonus_enemy_every": 3,    # an extra enemy every N waves
+    "max_enemies": 25,
+    "shooter_wave": 5,         # first wave shooters can appear
+    "pattern_every": 3,        # shooters learn the next bullet pattern every N waves after that
+    "rest_every": 6,           # every Nth wave is a rest wave
+    "rest_enemies": 2,
+    "orb_thresholds": (5, 10, 15),  # one more orb per wave from each of these waves on
+    "artifact_every": 5,
+}
 
 class WaveManager:
-    def __init__(self, player):
+    def __init__(self, player, tuning=None, flow_field=None):
         self.wave = 1
         self.player = player
+        self.flow_field = flow_field
+        self.tuning = {**WAVE_TUNING, **(tuning or {})}
 
     def generate_wave(self, wave_number):
-        num_enemies = min(3 + wave_number + wave_number // 3, 25)
+        t = self.tuning
+        num_enemies = min(t["base_enemies"] + wave_number + wave_number // t["bonus_enemy_every"], t["max_enemies"])
         enemy_types = ["chaser", "wander"]
-        if wave_number >= 5:
+        if wave_number >= t["shooter_wave"]:
             enemy_types.append("shooter")
 
-        if wave_number % 6 == 0:
+        if wave_number % t["rest_every"] == 0:
             return {
                 "type": "rest",
-                "enemies": 2,
+                "enemies": t["rest_enemies"],
                 "enemy_types": ["wander"],
+                "patterns": [None] * t["rest_enemies"],
                 "orbs": 0,
                 "artifact": False
             }
 
-        if wave_number < 5:
-            orb_count = 0
-        elif wave_number < 10:
-            orb_count = 1
-        elif wave_number < 15:
-            orb_count = 2
-        else:
-            orb_count = 3
+        orb_count = sum(1 for threshold in t["orb_thresholds"] if wave_number >= threshold)
 
-        spawn_artifact = (wave_number % 5 == 0)
+        spawn_artifact = (wave_number % t["artifact_every"] == 0)
 
+        types = random.choices(enemy_types, k=num_enemies)
+        unlocked = PATTERN_NAMES[:1 + max(0, wave_number - t["shooter_wave"]) // t["pattern_every"]]
         return {
             "type": "normal",
             "enemies": num_enemies,
-            "enemy_types": random.choices(enemy_types, k=num_enemies),
+            "enemy_types": types,
+            "patterns": [random.choice(unlocked) if kind == "shooter" else None for kind in types],
             "orbs": orb_count,
             "artifact": spawn_artifact,
         }
@@ -52,10 +63,13 @@ class WaveManager:
         sprite_list.clear()
         wave_info = self.generate_wave(self.wave)
 
-        for behavior in wave_info["enemy_types"]:
+        for behavior, pattern in zip(wave_info["enemy_types"], wave_info["patterns"]):
             x = random.randint(50, screen_width - 50)
             y = random.randint(50, screen_height - 50)
-            sprite_list.append(Enemy(x, y, self.player, behavior=behavior))
+            sprite_list.append(Enemy(x, y, self.player, behavior=behavior, flow_field=self.flow_field,
+                                     pattern=pattern or "aimed"))
+        # Enough bullets for every shooter's first volley
+        bullet_pool.reserve(sum(len(BULLET_PATTERNS[pattern]) for pattern in wave_info["patterns"] if pattern))
 
         # Coin spawning logic
         num_coins = random.randint(1, 5)
@@ -86,20 +100,12 @@ class WaveManager:
         if current_artifact is not None:
             return None
 
-        all_types = {
-            "Dash": DashArtifact,
-            "Magnet Pulse": MagnetPulseArtifact,
-            "Slow Field": SlowFieldArtifact,
-            "Bullet Time": BulletTimeArtifact,
-            "Clone Dash": CloneDashArtifact
-        }
-
-        available = [name for name in all_types if name not in player_artifacts]
+        available = [name for name in ARTIFACTS if name not in player_artifacts]
         if not available:
             return None
 
         name = random.choice(available)
-        artifact_class = all_types[name]
+        artifact_class = ARTIFACTS[name]
         art = artifact_class()
         art.center_x = random.randint(50, screen_width - 50)
         art.center_y = random.randint(50, screen_height - 50)
@@ -0,0 +1,150 @@
+import hashlib
+import io
+import mmap
+import struct
+from pathlib import Path
+
+# Pack layout (little endian):
+#   header:  magic "NDPK", format version (u16), entry count (u32)
+#   index:   per entry -> name length (u16), utf-8 name, offset (u64), size (u64), blake2b-128 digest
+#   data:    raw file contents, each blob aligned to DATA_ALIGNMENT bytes
+PACK_MAGIC = b"NDPK"
+PACK_VERSION = 1
+DATA_ALIGNMENT = 16
+HEADER = struct.Struct("<4sHI")
+NAME_LEN = struct.Struct("<H")
+ENTRY = struct.Struct("<QQ16s")
+
+
+def asset_digest(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class PackEntry:
+    __slots__ = ("name", "offset", "size", "digest")
+
+    def __init__(self, name, offset, size, digest):
+        self.name = name
+        self.offset = offset
+        self.size = size
+        self.digest = digest
+
+
+class AssetPack:
+    """Read-only view over a packed asset archive, backed by a single mmap."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self.entries = self._read_index()
+
+    def _read_index(self):
+        magic, version, count = HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{self.path} is not an asset pack")
+        if version != PACK_VERSION:
+            raise ValueError(f"{self.path} has pack version {version}, expected {PACK_VERSION}")
+
+        entries = {}
+        pos = HEADER.size
+        for _ in range(count):
+            (name_len,) = NAME_LEN.unpack_from(self._map, pos)
+            pos += NAME_LEN.size
+            name = bytes(self._map[pos:pos + name_len]).decode("utf-8")
+            pos += name_len
+            offset, size, digest = ENTRY.unpack_from(self._map, pos)
+            pos += ENTRY.size
+            entries[name] = PackEntry(name, offset, size, digest)
+        return entries
+
+    def __contains__(self, name):
+        return _normalize(name) in self.entries
+
+    def get(self, name):
+        """Zero-copy memoryview of an asset's bytes."""
+        entry = self.entries[_normalize(name)]
+        return self._view[entry.offset:entry.offset + entry.size]
+
+    def open(self, name):
+        """Seekable file object over an asset, for decoders that want a stream."""
+        return PackFile(self.get(name), _normalize(name))
+
+    def verify(self, name=None):
+        """Check stored digests; returns the names that don't match."""
+        names = [_normalize(name)] if name else list(self.entries)
+        return [n for n in names if asset_digest(self.get(n)) != self.entries[n].digest]
+
+    def close(self):
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+
+class PackFile(io.RawIOBase):
+    """Read-only stream over a memoryview; reads copy straight into the caller's buffer."""
+
+    def __init__(self, buffer, name=""):
+        super().__init__()
+        self._buffer = buffer
+        self._pos = 0
+        self.name = name
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        end = min(self._pos + len(b), len(self._buffer))
+        n = end - self._pos
+        b[:n] = self._buffer[self._pos:end]
+        self._pos = end
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+
+def _normalize(name):
+    return Path(name).as_posix()
+
+
+def build_pack(source_dir, output_path, prefix="assets"):
+    """Pack every file under source_dir into output_path; names are stored as prefix/relative/path."""
+    source_dir = Path(source_dir)
+    files = sorted(p for p in source_dir.rglob("*") if p.is_file())
+    names = [f"{prefix}/{p.relative_to(source_dir).as_posix()}" for p in files]
+
+    index_size = HEADER.size + sum(NAME_LEN.size + len(n.encode("utf-8")) + ENTRY.size for n in names)
+    offset = _align(index_size)
+
+    index = [HEADER.pack(PACK_MAGIC, PACK_VERSION, len(files))]
+    blobs = []
+    for name, path in zip(names, files):
+        data = path.read_bytes()
+        encoded = name.encode("utf-8")
+        index.append(NAME_LEN.pack(len(encoded)) + encoded + ENTRY.pack(offset, len(data), asset_digest(data)))
+        blobs.append((offset, data))
+        offset = _align(offset + len(data))
+
+    with open(output_path, "wb") as out:
+        out.write(b"".join(index))
+        for blob_offset, data in blobs:
+            out.write(b"\0" * (blob_offset - out.tell()))
+            out.write(data)
+    return names
+
+
+def _align(value):
+    return (value + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
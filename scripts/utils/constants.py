@@ -1,3 +1,17 @@
+import os
+
+# Logical screen size. Gameplay, spawning and layout all use these; the window itself can be any size.
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-SCREEN_TITLE = "NeoDodge"
\ No newline at end of file
+# Internal resolution of the world as a fraction of the logical size (0.5 renders 400x300 and upscales)
+RENDER_SCALE = float(os.environ.get("NEODODGE_RENDER_SCALE", "1.0"))
+SCREEN_TITLE = "NeoDodge"
+
+# The world the camera scrolls over, in screens per side. Wave tuning assumes the single-screen
+# arena, so anything larger is opt-in: spawns spread over more room and the game gets easier.
+ARENA_SCALE = float(os.environ.get("NEODODGE_ARENA_SCALE", "1"))
+ARENA_WIDTH = round(SCREEN_WIDTH * ARENA_SCALE)
+ARENA_HEIGHT = round(SCREEN_HEIGHT * ARENA_SCALE)
+
+# Simulation ticks per second. Collisions are swept, so 30 stays hit-accurate on slow machines.
+SIM_TICK_RATE = 60
\ No newline at end of file
@@ -0,0 +1,89 @@
+from contextlib import contextmanager
+
+import arcade
+
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_SCALE
+from scripts.utils.pipeline import run_on_main_thread
+
+MOUSE_EVENTS = {"on_mouse_press", "on_mouse_release", "on_mouse_motion", "on_mouse_drag", "on_mouse_scroll"}
+
+
+def letterbox(window, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """Largest (x, y, w, h) framebuffer area with the logical aspect ratio, centered in the window."""
+    fb_width, fb_height = window.get_framebuffer_size()
+    scale = min(fb_width / width, fb_height / height)
+    w, h = max(1, round(width * scale)), max(1, round(height * scale))
+    return (fb_width - w) // 2, (fb_height - h) // 2, w, h
+
+
+class GameWindow(arcade.Window):
+    """
+    Window whose drawing and mouse coordinates are always SCREEN_WIDTH x SCREEN_HEIGHT.
+
+    Any window size maps onto the logical screen through a letterboxed viewport, so views
+    lay things out against the constants and never against the window's real size.
+    """
+
+    def on_resize(self, width, height):
+        # pyglet dispatches a resize from the constructor, before the context exists
+        if hasattr(self, "_ctx"):
+            self.ctx.screen.viewport = letterbox(self)
+            self.ctx.projection_2d = (0, SCREEN_WIDTH, 0, SCREEN_HEIGHT)
+
+    def to_logical(self, x, y):
+        # Mouse positions come in window points, which differ from framebuffer pixels on high-DPI screens
+        ratio = self.get_pixel_ratio()
+        left, bottom, w, h = letterbox(self)
+        return (x * ratio - left) * SCREEN_WIDTH / w, (y * ratio - bottom) * SCREEN_HEIGHT / h
+
+    def show_view(self, new_view):
+        # A pipelined simulation can end the game from its worker; views only change on the main thread
+        run_on_main_thread(super().show_view, new_view)
+
+    def close(self):
+        # Cached programs, buffers and framebuffers go while their context is still current
+        from scripts.utils.shaders import release_gl_cache
+
+        if hasattr(self, "_ctx"):
+            release_gl_cache(self.ctx)
+        super().close()
+
+    def dispatch_event(self, event_type, *args):
+        if event_type in MOUSE_EVENTS:
+            args = (*self.to_logical(args[0], args[1]), *args[2:])
+        return super().dispatch_event(event_type, *args)
+
+
+class RenderTarget:
+    """
+    Offscreen texture the world is drawn into at RENDER_SCALE of the logical size.
+
+    present() stretches it over the window's letterboxed area, so fill cost follows the
+    internal resolution rather than the window size or display density. The HUD is drawn
+    afterwards straight to the window to keep text sharp.
+    """
+
+    def __init__(self, window, scale=RENDER_SCALE):
+        from scripts.utils.shaders import gl_cache, load_blit_shader, create_vision_geometry
+
+        self.ctx = window.ctx
+        self.window = window
+        self.size = (max(1, round(SCREEN_WIDTH * scale)), max(1, round(SCREEN_HEIGHT * scale)))
+        self.fbo = gl_cache(self.ctx).framebuffer("world", self.size, filter=(self.ctx.LINEAR, self.ctx.LINEAR))
+        self.texture = self.fbo.color_attachments[0]
+        self.program = load_blit_shader(window)
+        self.geometry = create_vision_geometry(window)
+
+    @contextmanager
+    def activate(self):
+        # projection_2d is left alone: it already maps the logical screen onto whatever is bound
+        with self.fbo.activate():
+            self.fbo.clear(self.window.background_color)
+            yield self
+
+    def present(self):
+        # The target is opaque, so skip blending and copy it straight over the letterbox
+        self.ctx.disable(self.ctx.BLEND)
+        self.texture.use(0)
+        self.geometry.render(self.program)
+        self.ctx.enable(self.ctx.BLEND)
@@ -0,0 +1,137 @@
+import math
+import os
+import time
+from collections import deque
+
+import pyglet
+
+from scripts.utils.constants import SIM_TICK_RATE
+from scripts.utils.quality_governor import TARGET_FPS
+
+# mode -> (vsync, software limiter)
+PACING_MODES = {
+    "vsync": (True, False),       # let the driver block in flip on the display's refresh
+    "uncapped": (False, False),   # as fast as possible, for benchmarking
+    "limiter": (False, True),     # sleep most of the frame, spin the last stretch
+}
+PACING_MODE = os.environ.get("NEODODGE_PACING", "limiter")
+# time.sleep can overshoot by a scheduler tick, so stop sleeping this long before the deadline and spin
+SPIN_MARGIN = 0.002
+PACING_SAMPLES = 600
+# A loop running at the tick rate wakes a hair early now and then; don't skip the tick for that
+UPDATE_SLACK = 0.001
+
+
+class PacingStats:
+    """Rolling frame-to-frame intervals measured right after each buffer swap."""
+
+    def __init__(self, target_interval=None, size=PACING_SAMPLES):
+        self.target_interval = target_interval
+        self.intervals = deque(maxlen=size)
+        self.wake_errors = deque(maxlen=size)  # limiter only: how late we left the wait
+        self.last = None
+
+    def record(self, now):
+        if self.last is not None:
+            self.intervals.append(now - self.last)
+        self.last = now
+
+    def summary(self):
+        if len(self.intervals) < 2:
+            return None
+        ordered = sorted(self.intervals)
+        mean = sum(ordered) / len(ordered)
+        jitter = math.sqrt(sum((i - mean) ** 2 for i in ordered) / len(ordered))
+        # A hitch is a frame taking 1.5x the intended interval (or the average when uncapped)
+        expected = self.target_interval or mean
+        summary = {
+            "frames": len(ordered),
+            "fps": 1.0 / mean,
+            "mean_ms": mean * 1000,
+            "jitter_ms": jitter * 1000,
+            "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+            "max_ms": ordered[-1] * 1000,
+            "hitches": sum(1 for i in ordered if i > expected * 1.5),
+        }
+        if self.wake_errors:
+            summary["wake_error_ms"] = sum(self.wake_errors) / len(self.wake_errors) * 1000
+        return summary
+
+    def report(self, mode):
+        s = self.summary()
+        if s is None:
+            return f"⏲️ Pacing ({mode}): not enough frames"
+        text = (f"⏲️ Pacing ({mode}): {s['fps']:.1f} fps, jitter {s['jitter_ms']:.2f} ms, "
+                f"p99 {s['p99_ms']:.2f} ms, max {s['max_ms']:.2f} ms, {s['hitches']} hitches")
+        if "wake_error_ms" in s:
+            text += f", wakes {s['wake_error_ms']:.3f} ms late"
+        return text
+
+
+def wait_until(deadline, spin_margin=SPIN_MARGIN):
+    remaining = deadline - time.perf_counter()
+    if remaining > spin_margin:
+        time.sleep(remaining - spin_margin)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class FramePacer:
+    """
+    Main loop replacing arcade.run() with a selectable pacing mode.
+
+    Events, the simulation tick (owned here instead of arcade's update_rate, so create the
+    window with update_rate=None) and a draw + flip run once per iteration; what happens
+    between frames depends on the mode. Frame intervals are sampled after every flip so
+    each mode's jitter can be compared on the same machine.
+    """
+
+    def __init__(self, window, mode=PACING_MODE, target_fps=TARGET_FPS, tick_rate=SIM_TICK_RATE):
+        if mode not in PACING_MODES:
+            raise ValueError(f"Unknown pacing mode {mode!r}, expected one of {', '.join(PACING_MODES)}")
+        self.window = window
+        self.mode = mode
+        self.vsync, self.limited = PACING_MODES[mode]
+        self.frame_interval = 1.0 / target_fps
+        self.update_interval = 1.0 / tick_rate
+        self.last_update = None
+        self.stats = PacingStats(self.frame_interval if self.vsync or self.limited else None)
+        window.pacer = self
+
+    def run(self, duration=None):
+        window = self.window
+        window.set_vsync(self.vsync)
+
+        # Same setup pyglet.app.run does before its loop
+        pyglet.window.Window._enable_event_queue = False
+        window.switch_to()
+        window.dispatch_pending_events()
+
+        start = deadline = self.last_update = time.perf_counter()
+        while window.context and not window.has_exit:
+            window.dispatch_events()
+            pyglet.clock.tick()
+            if not window.context or window.has_exit:
+                break
+            now = time.perf_counter()
+            if now - self.last_update >= self.update_interval - UPDATE_SLACK:
+                window.dispatch_event("on_update", now - self.last_update)
+                self.last_update = now
+            window.switch_to()
+            window.dispatch_event("on_draw")
+            window.flip()
+            now = time.perf_counter()
+            self.stats.record(now)
+
+            if duration is not None and now - start >= duration:
+                break
+            if self.limited:
+                deadline += self.frame_interval
+                if deadline < now:
+                    # Fell more than a frame behind: don't try to catch up with a burst of frames
+                    deadline = now
+                    continue
+                wait_until(deadline)
+                self.stats.wake_errors.append(time.perf_counter() - deadline)
+
+        print(self.stats.report(self.mode))
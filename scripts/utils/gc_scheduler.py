@@ -0,0 +1,69 @@
+import gc
+import time
+
+# During a wave only young (gen 0) collections may run on their own; they're cheap.
+# gen 1/2 are pushed out to the pauses between waves and the shop.
+WAVE_THRESHOLDS = (700, 1_000_000, 1_000_000)
+
+
+class GCScheduler:
+    """
+    Moves expensive garbage collections out of active waves.
+
+    Long-lived objects are frozen once assets are loaded, before the first game view
+    exists, since frozen objects are never collected. Older-generation collection is
+    held back while a wave runs, and a full collection is forced when the wave pause or
+    the shop starts. A gc callback times every collection so mid-wave pauses are visible.
+    """
+
+    def __init__(self):
+        self.default_thresholds = gc.get_threshold()
+        self.in_wave = False
+        self.frozen = False
+        self.events = []  # (generation, duration_ms, in_wave)
+        self._started = None
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            duration_ms = (time.perf_counter() - self._started) * 1000
+            self.events.append((info["generation"], duration_ms, self.in_wave))
+            self._started = None
+
+    def freeze_after_load(self):
+        # Everything alive now (modules, textures, sounds) never needs scanning again
+        if self.frozen:
+            return
+        gc.collect()
+        gc.freeze()
+        self.frozen = True
+
+    def enter_wave(self):
+        self.in_wave = True
+        self.events.clear()
+        gc.set_threshold(*WAVE_THRESHOLDS)
+
+    def enter_pause(self):
+        """Wave pause, shop or game over: restore normal GC and collect everything now."""
+        was_in_wave = self.in_wave
+        self.in_wave = False
+        gc.set_threshold(*self.default_thresholds)
+        gc.collect()
+        if was_in_wave:
+            print(self.report())
+            self.events.clear()
+
+    def midwave_collections(self, generation=2):
+        return [e for e in self.events if e[2] and e[0] >= generation]
+
+    def report(self):
+        wave_events = [e for e in self.events if e[2]]
+        by_gen = [sum(1 for e in wave_events if e[0] == gen) for gen in range(3)]
+        longest = max((e[1] for e in wave_events), default=0.0)
+        return (f"🧹 GC during wave: gen0={by_gen[0]} gen1={by_gen[1]} gen2={by_gen[2]}, "
+                f"longest pause {longest:.2f} ms")
+
+
+gc_scheduler = GCScheduler()
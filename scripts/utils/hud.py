@@ -1,12 +1,16 @@
+import copy
+
 import arcade
 from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
 def draw_score(score):
     arcade.draw_text(f"Score: {int(score)}", 30, SCREEN_HEIGHT - 60, arcade.color.WHITE, 16)
 
-def draw_pickup_texts(pickup_texts):
+def draw_pickup_texts(pickup_texts, camera=(0, 0)):
+    # Texts sit at world positions; the HUD is drawn in screen space
+    left, bottom = camera
     for text, x, y, _ in pickup_texts:
-        arcade.draw_text(text, x, y + 20, arcade.color.WHITE, 14, anchor_x="center")
+        arcade.draw_text(text, x - left, y - bottom + 20, arcade.color.WHITE, 14, anchor_x="center")
 
 def draw_wave_timer(level_timer, wave_duration):
     time_left = max(0, int(wave_duration - level_timer))
@@ -38,4 +42,71 @@ def draw_wave_number(current_wave):
     )
 
 def draw_coin_count(player_coins):
-    arcade.draw_text(f"Coins: {player_coins}", SCREEN_WIDTH - 100, 30, arcade.color.GOLD, 18)
\ No newline at end of file
+    arcade.draw_text(f"Coins: {player_coins}", SCREEN_WIDTH - 100, 30, arcade.color.GOLD, 18)
+
+class HudState:
+    """
+    The values the game view's HUD reads. With detach=True the player is shallow-copied
+    along with the lists the simulation mutates in place, so the HUD can be drawn while
+    the next tick runs.
+    """
+
+    def __init__(self, game, detach=False):
+        player = game.player
+        pickup_texts = game.pickup_texts
+        if detach:
+            player = copy.copy(player)
+            player.sprite_lists = []
+            player.artifacts = [copy.copy(artifact) for artifact in player.artifacts]
+            player.active_orbs = [tuple(orb) for orb in player.active_orbs]
+            pickup_texts = [tuple(text) for text in pickup_texts]
+        self.player = player
+        self.pickup_texts = pickup_texts
+        self.score = game.score
+        self.level_timer = game.level_timer
+        self.wave_duration = game.wave_duration
+        self.wave_pause = game.wave_pause
+        self.in_wave = game.in_wave
+        self.wave_message = game.wave_message
+        self.wave_message_alpha = game.wave_message_alpha
+        self.wave = game.wave_manager.wave
+        self.camera = (round(game.camera.left), round(game.camera.bottom))
+
+
+class HudLayer:
+    """
+    Renders the HUD into an offscreen texture at a limited rate and composites it every frame.
+
+    Text drawing is the expensive part of the HUD, so under load the governor lowers
+    `refresh_hz` and most frames just blit the cached texture.
+    """
+
+    def __init__(self, window):
+        from scripts.utils.shaders import gl_cache, load_blit_shader, create_vision_geometry
+        from scripts.utils.display import letterbox
+
+        self.ctx = window.ctx
+        self.fbo = gl_cache(self.ctx).framebuffer("hud", letterbox(window)[2:])
+        self.texture = self.fbo.color_attachments[0]
+        self.program = load_blit_shader(window)
+        self.geometry = create_vision_geometry(window)
+        self.last_refresh = None
+
+    def draw(self, draw_fn, now, refresh_hz=None):
+        if refresh_hz is None:
+            draw_fn()
+            self.last_refresh = None
+            return
+
+        if self.last_refresh is None or now - self.last_refresh >= 1.0 / refresh_hz:
+            with self.fbo.activate():
+                self.fbo.clear()
+                draw_fn()
+            self.last_refresh = now
+
+        # Text was alpha-blended onto a transparent target, so its colors are premultiplied
+        blend_func = self.ctx.blend_func
+        self.ctx.blend_func = self.ctx.BLEND_PREMULTIPLIED_ALPHA
+        self.texture.use(0)
+        self.geometry.render(self.program)
+        self.ctx.blend_func = blend_func
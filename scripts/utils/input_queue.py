@@ -0,0 +1,84 @@
+import time
+from collections import deque
+
+LATENCY_SAMPLES = 512
+
+
+class InputEvent:
+    def __init__(self, kind, time, x=0.0, y=0.0, value=None):
+        self.kind = kind    # "target", "stop", "dash", "artifact", "steer"
+        self.time = time
+        self.x = x
+        self.y = y
+        self.value = value  # artifact slot for "artifact"
+
+
+class InputQueue:
+    """
+    Timestamped gameplay input, applied by the simulation at the start of the next tick.
+
+    Event handlers only record; the game view drains the queue in on_update and applies
+    every event, in order, before stepping the player. Every applied event then waits for
+    the next drawn frame, which closes its input-to-display latency sample. Timestamps are
+    taken when pyglet hands us the event, the closest point we can observe.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.events = deque()
+        self.held = set()  # steering keys currently down
+        self.awaiting_frame = []
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)  # ms
+
+    def push(self, kind, x=0.0, y=0.0, value=None):
+        self.events.append(InputEvent(kind, self.clock(), x, y, value))
+
+    def press(self, key):
+        self.held.add(key)
+        self.push("steer")
+
+    def release(self, key):
+        if key in self.held:
+            self.held.discard(key)
+            self.push("steer")
+
+    def drain(self):
+        # popleft rather than copy-and-clear: handlers may push from another thread meanwhile
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+    def applied(self, event):
+        self.awaiting_frame.append(event.time)
+
+    def take_applied(self):
+        applied, self.awaiting_frame = self.awaiting_frame, []
+        return applied
+
+    def frame_presented(self, applied=None):
+        """Close the samples for `applied` (default: everything applied since the last frame)."""
+        if applied is None:
+            applied = self.take_applied()
+        if applied:
+            now = self.clock()
+            self.latencies.extend((now - t) * 1000 for t in applied)
+
+    def latency_stats(self):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return {
+            "count": len(ordered),
+            "mean_ms": sum(ordered) / len(ordered),
+            "p50_ms": ordered[len(ordered) // 2],
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max_ms": ordered[-1],
+        }
+
+    def report(self):
+        stats = self.latency_stats()
+        if stats is None:
+            return "🎮 Input latency: no input yet"
+        return (f"🎮 Input latency over {stats['count']} events: p50 {stats['p50_ms']:.1f} ms, "
+                f"p95 {stats['p95_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
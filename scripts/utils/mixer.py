@@ -0,0 +1,136 @@
+import time
+
+from pyglet import media
+
+from scripts.utils.resource_helper import load_sound
+from scripts.utils.pipeline import run_on_main_thread
+
+VOICE_COUNT = 8
+
+
+class SoundSpec:
+    def __init__(self, path, volume=1.0, max_instances=2, min_interval=0.05, priority=1):
+        self.path = path
+        self.volume = volume
+        self.max_instances = max_instances  # simultaneous copies of this sound
+        self.min_interval = min_interval    # seconds before the same sound may retrigger
+        self.priority = priority            # higher steals voices from lower
+
+
+SFX = {
+    "coin": SoundSpec("assets/audio/coin.flac", max_instances=2, min_interval=0.06, priority=1),
+    "buff": SoundSpec("assets/audio/buff.wav", max_instances=2, min_interval=0.08, priority=2),
+    "debuff": SoundSpec("assets/audio/debuff.wav", volume=0.1, max_instances=2, min_interval=0.08, priority=2),
+    "damage": SoundSpec("assets/audio/damage.wav", max_instances=1, min_interval=0.1, priority=3),
+    "start_click": SoundSpec("assets/audio/start_click.wav", max_instances=1, min_interval=0.2, priority=3),
+}
+
+
+class Voice:
+    def __init__(self):
+        self.player = None
+        self.sound_name = None
+        self.priority = 0
+        self.started_at = 0.0
+        self.ends_at = 0.0
+
+    def is_busy(self, now):
+        return self.sound_name is not None and now < self.ends_at
+
+    def start(self, name, spec, sound, now):
+        if self.player is None:
+            self.player = media.Player()
+        else:
+            self.player.pause()
+            if self.player.source is not None:
+                self.player.next_source()
+        self.player.volume = spec.volume
+        self.player.queue(sound.source)
+        self.player.play()
+
+        self.sound_name = name
+        self.priority = spec.priority
+        self.started_at = now
+        self.ends_at = now + (sound.source.duration or 0.0)
+
+    def stop(self):
+        if self.player is not None:
+            self.player.pause()
+        self.sound_name = None
+        self.ends_at = 0.0
+
+
+class SoundMixer:
+    """
+    Plays short effects on a fixed pool of reusable pyglet players.
+
+    Each sound has a cap on simultaneous instances and a minimum retrigger interval, and
+    when every voice is busy a new sound may steal the lowest-priority voice. However many
+    pickups land on one frame, at most VOICE_COUNT players ever exist.
+    """
+
+    def __init__(self, sounds, voice_count=VOICE_COUNT, clock=time.perf_counter):
+        self.specs = dict(sounds)
+        self.voices = [Voice() for _ in range(voice_count)]
+        self.clock = clock
+        self._sounds = {}
+        self._last_played = {}
+        self.dropped = 0
+
+    def _get_sound(self, name):
+        if name not in self._sounds:
+            self._sounds[name] = load_sound(self.specs[name].path)
+        return self._sounds[name]
+
+    def preload(self, *names):
+        for name in names or self.specs:
+            self._get_sound(name)
+
+    def play(self, name):
+        spec = self.specs[name]
+        now = self.clock()
+
+        if now - self._last_played.get(name, -spec.min_interval) < spec.min_interval:
+            self.dropped += 1
+            return None
+
+        voice = self._pick_voice(name, spec, now)
+        if voice is None:
+            self.dropped += 1
+            return None
+
+        voice.start(name, spec, self._get_sound(name), now)
+        self._last_played[name] = now
+        return voice
+
+    def _pick_voice(self, name, spec, now):
+        # Over the per-sound cap: retrigger the oldest copy of the same sound
+        same = [v for v in self.voices if v.sound_name == name and v.is_busy(now)]
+        if len(same) >= spec.max_instances:
+            return min(same, key=lambda v: v.started_at)
+
+        for voice in self.voices:
+            if not voice.is_busy(now):
+                return voice
+
+        # Every voice busy: steal the lowest-priority, oldest one we outrank or match
+        victim = min(self.voices, key=lambda v: (v.priority, v.started_at))
+        if victim.priority <= spec.priority:
+            return victim
+        return None
+
+    def active_voices(self):
+        now = self.clock()
+        return sum(1 for v in self.voices if v.is_busy(now))
+
+    def stop_all(self):
+        for voice in self.voices:
+            voice.stop()
+
+
+mixer = SoundMixer(SFX)
+
+
+def play_sfx(name):
+    # Sounds triggered by a pipelined simulation tick start on the main thread at the hand-off
+    return run_on_main_thread(mixer.play, name)
@@ -0,0 +1,138 @@
+import pyglet
+from pyglet import media
+
+from scripts.utils.resource_helper import load_sound
+
+CROSSFADE_SECONDS = 1.5
+FADE_STEP = 1 / 30
+
+
+class MusicSpec:
+    def __init__(self, path, volume=0.5):
+        self.path = path
+        self.volume = volume
+
+
+MUSIC = {
+    "start": MusicSpec("assets/audio/themev1.mp3", volume=0.4),
+    # No gameplay track yet: the theme carries on underneath, quieter
+    "game": MusicSpec("assets/audio/themev1.mp3", volume=0.25),
+    "shop": MusicSpec("assets/audio/shop.mp3", volume=0.5),
+}
+
+
+class Deck:
+    """One looping streamed track and the volume ramp it's on."""
+
+    def __init__(self):
+        self.player = None
+        self.path = None
+        self.start_volume = 0.0
+        self.target_volume = 0.0
+        self.fade_length = 0.0
+        self.fade_time = 0.0
+
+    def load(self, path):
+        # Streaming: only the header is read here; pyglet's media thread decodes a few
+        # buffers ahead of the play position from then on
+        source = load_sound(path, streaming=True).source
+        self.stop()
+        self.player = media.Player()
+        self.player.loop = True
+        self.player.volume = 0.0
+        self.player.queue(source)
+        self.player.play()
+        self.path = path
+
+    def fade(self, volume, seconds):
+        self.start_volume = self.player.volume
+        self.target_volume = volume
+        self.fade_length = seconds
+        self.fade_time = 0.0
+
+    def step(self, dt):
+        """Advance the ramp; False once it has finished."""
+        if self.player is None:
+            return False
+        self.fade_time += dt
+        t = min(1.0, self.fade_time / self.fade_length) if self.fade_length > 0 else 1.0
+        self.player.volume = self.start_volume + (self.target_volume - self.start_volume) * t
+        if t < 1.0:
+            return True
+        if self.target_volume <= 0.0:
+            self.stop()
+        return False
+
+    def stop(self):
+        if self.player is not None:
+            self.player.pause()
+            # Drops the stream and its file handle
+            self.player.delete()
+        self.player = None
+        self.path = None
+
+
+class MusicPlayer:
+    """
+    Background music streamed from disk, crossfading between tracks.
+
+    Tracks are opened as streaming sources, so memory stays the same whatever the track
+    length and a view switch only reads a file header instead of decoding the whole
+    song. Two decks alternate: the incoming track fades in on the spare deck while the
+    outgoing one fades out and is closed. Tracks sharing a file just ramp their volume.
+    """
+
+    def __init__(self, tracks=MUSIC, crossfade=CROSSFADE_SECONDS):
+        self.tracks = dict(tracks)
+        self.crossfade = crossfade
+        self.live = Deck()
+        self.spare = Deck()
+        self.current = None
+        self.scheduled = False
+
+    def play(self, name):
+        if name == self.current:
+            return
+        spec = self.tracks[name]
+        self.current = name
+        if self.spare.player is not None and self.spare.path == spec.path:
+            # Switching back before the old track has faded out: bring it up again
+            self.live, self.spare = self.spare, self.live
+        elif self.live.player is None or self.live.path != spec.path:
+            try:
+                self.spare.load(spec.path)
+            except Exception as e:
+                print(f"🎵 Failed to load music {spec.path}: {e}")
+                self.stop()
+                return
+            self.live, self.spare = self.spare, self.live
+        self.live.fade(spec.volume, self.crossfade)
+        if self.spare.player is not None:
+            self.spare.fade(0.0, self.crossfade)
+        self._schedule()
+
+    def stop(self, seconds=None):
+        self.current = None
+        for deck in (self.live, self.spare):
+            if deck.player is not None:
+                deck.fade(0.0, self.crossfade if seconds is None else seconds)
+        self._schedule()
+
+    def _schedule(self):
+        if not self.scheduled:
+            pyglet.clock.schedule_interval(self._tick, FADE_STEP)
+            self.scheduled = True
+
+    def _tick(self, dt):
+        fading = self.live.step(dt)
+        fading = self.spare.step(dt) or fading
+        if not fading:
+            pyglet.clock.unschedule(self._tick)
+            self.scheduled = False
+
+
+music = MusicPlayer()
+
+
+def play_music(name):
+    music.play(name)
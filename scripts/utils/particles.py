@@ -0,0 +1,246 @@
+import math
+import random
+import struct
+import threading
+
+import arcade
+
+from scripts.utils.constants import SCREEN_WIDTH
+from scripts.utils.shaders import gl_cache
+
+MAX_PARTICLES = 65536
+DRAG = 3.0  # velocity falls off as exp(-DRAG * t)
+
+# Per particle: pos (2f), vel (2f), color (4f), life (4f: age, lifetime, size, speed)
+PARTICLE_FORMAT = "2f 2f 4f 4f"
+PARTICLE_ATTRIBUTES = ["in_pos", "in_vel", "in_color", "in_life"]
+PARTICLE = struct.Struct("<12f")
+
+
+class ParticleEffect:
+    def __init__(self, color, count, speed, life, size, spread=math.tau):
+        self.color = tuple(c / 255 for c in color[:3]) + (1.0,)
+        self.count = count
+        self.speed = speed    # max launch speed; each particle gets 30-100% of it
+        self.life = life      # max lifetime in seconds; each particle gets 60-100% of it
+        self.size = size      # point size in logical pixels, shrinking to 0 over the lifetime
+        self.spread = spread  # radians around the heading
+
+
+EFFECTS = {
+    "damage": ParticleEffect(arcade.color.RED, count=48, speed=260, life=0.6, size=7),
+    "buff": ParticleEffect(arcade.color.LIGHT_GREEN, count=32, speed=180, life=0.5, size=5),
+    "debuff": ParticleEffect(arcade.color.ORCHID, count=32, speed=180, life=0.5, size=5),
+    "coin": ParticleEffect(arcade.color.GOLD, count=24, speed=140, life=0.45, size=5),
+    "dash": ParticleEffect(arcade.color.CYAN, count=40, speed=200, life=0.35, size=6, spread=0.8),
+}
+
+TRANSFORM_SHADER = """
+#version 330
+uniform float dt;
+uniform float drag;
+uniform float seed;
+in vec2 in_pos;
+in vec2 in_vel;
+in vec4 in_color;
+in vec4 in_life;
+out vec2 out_pos;
+out vec2 out_vel;
+out vec4 out_color;
+out vec4 out_life;
+
+float hash(float n) {
+    return fract(sin(n) * 43758.5453123);
+}
+
+void main() {
+    vec2 pos = in_pos;
+    vec2 vel = in_vel;
+    vec4 life = in_life;
+    if (life.x < 0.0) {
+        // Just emitted: vel holds (heading, spread), randomize the launch here instead of in Python
+        float id = float(gl_VertexID) * 0.618 + seed;
+        float angle = vel.x + (hash(id) - 0.5) * vel.y;
+        vel = vec2(cos(angle), sin(angle)) * life.w * mix(0.3, 1.0, hash(id + 17.0));
+        life.y *= mix(0.6, 1.0, hash(id + 31.0));
+        life.x = 0.0;
+    } else if (life.x < life.y) {
+        life.x += dt;
+        vel *= exp(-drag * dt);
+        pos += vel * dt;
+    }
+    out_pos = pos;
+    out_vel = vel;
+    out_color = in_color;
+    out_life = life;
+}
+"""
+
+RENDER_VERTEX_SHADER = """
+#version 330
+uniform Projection {
+    uniform mat4 matrix;
+} proj;
+uniform float point_scale;
+in vec2 in_pos;
+in vec4 in_color;
+in vec4 in_life;
+out vec4 v_color;
+
+void main() {
+    float t = in_life.x / max(in_life.y, 0.0001);
+    if (in_life.x < 0.0 || t >= 1.0) {
+        // Dead or unborn: push outside the clip volume
+        gl_Position = vec4(2.0, 2.0, 0.0, 1.0);
+        gl_PointSize = 0.0;
+        v_color = vec4(0.0);
+        return;
+    }
+    gl_Position = proj.matrix * vec4(in_pos, 0.0, 1.0);
+    gl_PointSize = in_life.z * (1.0 - t) * point_scale;
+    v_color = vec4(in_color.rgb, in_color.a * (1.0 - t));
+}
+"""
+
+RENDER_FRAGMENT_SHADER = """
+#version 330
+in vec4 v_color;
+out vec4 fragColor;
+
+void main() {
+    float falloff = 1.0 - smoothstep(0.2, 0.5, length(gl_PointCoord - 0.5));
+    // Additive: alpha is left at 0 so the (opaque) world target stays opaque
+    fragColor = vec4(v_color.rgb * v_color.a * falloff, 0.0);
+}
+"""
+
+
+class ParticleSystem:
+    """
+    Particles that live entirely in GPU buffers.
+
+    Two buffers are ping-ponged through a transform-feedback shader that ages and moves
+    every particle, so a frame costs the same few GL calls whether 10 or 60k particles
+    are alive; only the part of the ring written since it was last empty is processed.
+    Emitting only writes one template record per particle into a ring; directions,
+    speeds and lifetimes are randomized on the GPU. Nothing runs while no particle is
+    alive, and emit() is a no-op until attach() has a GL context.
+    """
+
+    def __init__(self, effects, capacity=MAX_PARTICLES):
+        self.effects = effects
+        self.capacity = capacity
+        self.ctx = None
+        self.cursor = 0
+        self.used = 0  # slots [0, used) have been written since the ring was last empty
+        self.pending = []  # (slot, bytes) waiting to be uploaded on the next update
+        self.time = 0.0
+        self.active_until = 0.0
+        self.emitted = 0
+        # emit() may come from a pipelined simulation thread while update() uploads on the main one
+        self.lock = threading.Lock()
+
+    def attach(self, ctx):
+        if self.ctx is ctx:
+            return
+        self.ctx = ctx
+        cache = gl_cache(ctx)
+        size = self.capacity * PARTICLE.size
+        # The cache owns the ping-pong pair and deletes it with the context; detach() then
+        # drops our references so nothing writes into deleted buffers
+        streams = [
+            cache.stream_geometry(f"particles{i}", size, PARTICLE_FORMAT, PARTICLE_ATTRIBUTES, mode=ctx.POINTS)
+            for i in range(2)
+        ]
+        self.geometries = [geometry for geometry, _ in streams]
+        self.buffers = [buffer for _, buffer in streams]
+        cache.on_release(self.detach)
+        self.transform_program = cache.program(
+            vertex_shader=TRANSFORM_SHADER,
+            varyings=["out_pos", "out_vel", "out_color", "out_life"],
+        )
+        self.render_program = cache.program(vertex_shader=RENDER_VERTEX_SHADER, fragment_shader=RENDER_FRAGMENT_SHADER)
+        self.current = 0
+        self.clear()
+
+    def detach(self):
+        with self.lock:
+            self.ctx = None
+            self.buffers = self.geometries = []
+            self.pending.clear()
+
+    def clear(self):
+        self.pending.clear()
+        self.cursor = 0
+        self.used = 0
+        self.active_until = 0.0
+        if self.ctx is not None:
+            for buffer in self.buffers:
+                buffer.write(bytes(buffer.size))
+
+    def emit(self, name, x, y, heading=0.0):
+        if self.ctx is None:
+            return
+        effect = self.effects[name]
+        record = PARTICLE.pack(x, y, heading, effect.spread, *effect.color, -1.0, effect.life, effect.size, effect.speed)
+        count = min(effect.count, self.capacity)
+        with self.lock:
+            self._queue(record, count, effect.life)
+
+    def _queue(self, record, count, life):
+        # Split at the end of the ring so every write is contiguous
+        first = min(count, self.capacity - self.cursor)
+        self.pending.append((self.cursor, record * first))
+        if count > first:
+            self.pending.append((0, record * (count - first)))
+        self.used = self.capacity if count > first else max(self.used, self.cursor + count)
+        self.cursor = (self.cursor + count) % self.capacity
+        self.active_until = max(self.active_until, self.time + life)
+        self.emitted += count
+
+    def update(self, delta_time):
+        self.time += delta_time
+        if self.ctx is None:
+            return
+        with self.lock:
+            pending, self.pending = self.pending, []
+            active = self.is_active()
+            if not active:
+                # Everything is dead: start the ring over so the next bursts only touch a few slots
+                self.cursor = self.used = 0
+            used = self.used
+        source = self.buffers[self.current]
+        for slot, data in pending:
+            source.write(data, offset=slot * PARTICLE.size)
+        if not active:
+            return
+
+        self.transform_program["dt"] = delta_time
+        self.transform_program["drag"] = DRAG
+        self.transform_program["seed"] = random.random() * 100.0
+        target = 1 - self.current
+        self.geometries[self.current].transform(self.transform_program, self.buffers[target], vertices=used)
+        self.current = target
+
+    def is_active(self):
+        # A little slack so the longest-lived particles are aged past their lifetime before we stop
+        return self.time <= self.active_until + 0.1
+
+    def draw(self):
+        if self.ctx is None or not self.is_active():
+            return
+        # Point sizes are in framebuffer pixels; scale them to the bound target's resolution
+        self.render_program["point_scale"] = self.ctx.active_framebuffer.viewport[2] / SCREEN_WIDTH
+        self.ctx.enable(self.ctx.PROGRAM_POINT_SIZE)
+        blend_func = self.ctx.blend_func
+        self.ctx.blend_func = self.ctx.BLEND_ADDITIVE
+        self.geometries[self.current].render(self.render_program, vertices=self.used)
+        self.ctx.blend_func = blend_func
+        self.ctx.disable(self.ctx.PROGRAM_POINT_SIZE)
+
+
+particles = ParticleSystem(EFFECTS)
+
+
+def emit_particles(name, x, y, heading=0.0):
+    particles.emit(name, x, y, heading)
@@ -0,0 +1,227 @@
+import os
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+
+import arcade
+
+# Opt-in: the simulation runs one tick ahead on a worker thread while the main thread draws
+PIPELINED = os.environ.get("NEODODGE_PIPELINE", "0") == "1"
+PIPELINE_SAMPLES = 600
+# With a GIL, a Python-bound worker running during draw steals the GIL back after every
+# GL call (they all release it), so it only runs once the frame is drawn: during the buffer
+# swap, the limiter's sleep and event dispatch. Free-threaded builds start it right away.
+FREE_THREADED = hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled()
+
+_main_thread_calls = deque()
+
+
+def run_on_main_thread(fn, *args):
+    """Call now on the main thread; from the simulation worker, queue it for the next hand-off."""
+    if threading.current_thread() is threading.main_thread():
+        return fn(*args)
+    _main_thread_calls.append((fn, args))
+
+
+def run_main_thread_calls():
+    while _main_thread_calls:
+        fn, args = _main_thread_calls.popleft()
+        fn(*args)
+
+
+class LazySpriteList(arcade.SpriteList):
+    """
+    SpriteList for simulation-owned sprites: no GL objects until it is first drawn.
+
+    In pipelined mode these lists are only ever touched by the worker thread and never
+    drawn, so they must not create buffers or grow them through a GL context that isn't
+    current there. arcade keeps every sprite added before initialization in a deferred
+    set and never drops removed or replaced ones from it, so remove(), __setitem__ and
+    truncate() do.
+    """
+
+    def __init__(self):
+        super().__init__(lazy=True)
+
+    def remove(self, sprite):
+        super().remove(sprite)
+        if self._deferred_sprites:
+            self._deferred_sprites.discard(sprite)
+
+    def __setitem__(self, index, sprite):
+        replaced = self.sprite_list[index]
+        super().__setitem__(index, sprite)
+        if self._deferred_sprites is not None and replaced is not sprite:
+            self._deferred_sprites.discard(replaced)
+            self._deferred_sprites.add(sprite)
+
+    def truncate(self, count):
+        """Drop every sprite past the first count and return them."""
+        # One pass over the index buffer: pop() rescans the list and the buffer per sprite
+        removed = self.sprite_list[count:]
+        if not removed:
+            return removed
+        del self.sprite_list[count:]
+        slots = set()
+        for sprite in removed:
+            sprite.sprite_lists.remove(self)
+            slots.add(self.sprite_slot.pop(sprite))
+            if self._deferred_sprites:
+                self._deferred_sprites.discard(sprite)
+            if self.spatial_hash:
+                self.spatial_hash.remove_object(sprite)
+        self._sprite_buffer_free_slots.extend(slots)
+
+        index = self._sprite_index_data
+        used = self._sprite_index_slots
+        kept = [slot for slot in index[:used] if slot not in slots]
+        index[:used] = array(index.typecode, kept + [0] * (used - len(kept)))
+        self._sprite_index_slots = len(kept)
+        self._sprite_index_changed = True
+        return removed
+
+
+class FrameState:
+    """Everything on_draw needs from one simulation tick, copied out so the next tick can run."""
+
+    def __init__(self):
+        self.sprites = []  # (texture, x, y, width, height, alpha) in draw order
+        self.camera = (0.0, 0.0)
+        self.grid_lines = []
+        self.vision_center = None
+        self.hud = None
+        self.inputs = []   # timestamps of inputs applied this tick, for latency samples
+
+    def add_sprites(self, sprites):
+        append = self.sprites.append
+        for sprite in sprites:
+            append((sprite.texture, sprite.center_x, sprite.center_y, sprite.width, sprite.height, sprite.alpha))
+
+
+class FrameRenderer:
+    """Draws a FrameState through a main-thread sprite list of stand-in sprites."""
+
+    def __init__(self):
+        self.sprites = arcade.SpriteList()
+
+    def draw(self, frame):
+        sprites = self.sprites
+        count = len(frame.sprites)
+        while len(sprites) > count:
+            sprites.pop()
+        while len(sprites) < count:
+            sprites.append(arcade.Sprite())
+        for sprite, (texture, x, y, width, height, alpha) in zip(sprites, frame.sprites):
+            sprite.texture = texture
+            sprite.position = (x, y)
+            sprite.width = width
+            sprite.height = height
+            sprite.alpha = alpha
+        sprites.draw()
+
+
+class SimPipeline:
+    """
+    Runs simulation tick N+1 on a worker thread while the main thread presents tick N.
+
+    Two FrameStates are double-buffered: the worker steps the world and captures it into
+    the back buffer, and submit() (the main thread's on_update) waits for that and swaps
+    it to the front. The next tick starts at release(), after the frame is drawn, or
+    straight from submit() on free-threaded builds. The main thread only reads the front
+    buffer and the worker never touches GL. Each tick steps by the previous frame's
+    delta, so the simulation runs one frame behind the clock in exchange.
+    """
+
+    def __init__(self, step, capture):
+        self.step = step        # step(delta_time), on the worker
+        self.capture = capture  # capture(frame_state), on the worker right after each step
+        self.front = FrameState()
+        self.back = FrameState()
+        self.delta_time = 0.0
+        self.queued = False     # a submitted tick is waiting for release()
+        self.calls = deque()    # run on the worker before the next step
+        self.error = None
+        self.running = False
+        self.ready = threading.Event()
+        self.go = threading.Event()
+        self.thread = None
+        self.ticks = 0
+        self.sim_times = deque(maxlen=PIPELINE_SAMPLES)
+        self.wait_times = deque(maxlen=PIPELINE_SAMPLES)
+
+    def start(self):
+        # Nothing is running yet, so both buffers can be filled here
+        self.capture(self.front)
+        self.capture(self.back)
+        self.running = True
+        self.ready.set()
+        self.thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self.ready.wait()
+        self.running = False
+        self.go.set()
+        self.thread.join()
+        print(self.report())
+
+    def call(self, fn):
+        """Run fn on the worker between ticks, for anything else that touches simulation state."""
+        self.calls.append(fn)
+
+    def submit(self, delta_time):
+        start = time.perf_counter()
+        self.ready.wait()
+        self.wait_times.append(time.perf_counter() - start)
+        if self.error is not None:
+            error, self.error = self.error, None
+            self.running = False
+            raise error
+        self.front, self.back = self.back, self.front
+        self.ticks += 1
+
+        # View changes and sounds the last tick asked for; a view change stops us
+        run_main_thread_calls()
+        if not self.running:
+            return
+        self.delta_time = delta_time
+        self.queued = True
+        if FREE_THREADED:
+            self.release()
+
+    def release(self):
+        """Start the submitted tick; called once the frame has been drawn."""
+        if self.queued and self.running:
+            self.queued = False
+            self.ready.clear()
+            self.go.set()
+
+    def _run(self):
+        while True:
+            self.go.wait()
+            self.go.clear()
+            if not self.running:
+                return
+            try:
+                while self.calls:
+                    self.calls.popleft()()
+                start = time.perf_counter()
+                self.step(self.delta_time)
+                self.capture(self.back)
+                self.sim_times.append(time.perf_counter() - start)
+            except BaseException as error:
+                self.error = error
+            self.ready.set()
+
+    def report(self):
+        if not self.sim_times:
+            return "🧵 Pipeline: no ticks"
+        sim = sum(self.sim_times) / len(self.sim_times) * 1000
+        wait = sum(self.wait_times) / len(self.wait_times) * 1000
+        hidden = max(0.0, 1.0 - wait / sim) * 100 if sim else 0.0
+        return (f"🧵 Pipeline over {self.ticks} ticks: sim {sim:.2f} ms on the worker, "
+                f"main thread waited {wait:.2f} ms ({hidden:.0f}% of sim time overlapped)")
@@ -0,0 +1,102 @@
+from collections import deque
+
+TARGET_FPS = 60
+
+# Level 0 is full quality; each step trades a little visual polish for frame time.
+#   vision_smooth_edge: soft falloff on the vision-blur circle
+#   hud_refresh_hz:     how often the HUD is re-rendered (None = every frame)
+#   bullet_glow:        soft glowing bullets vs plain discs
+#   lod_scale:          multiplier on the update interval of far enemies (see SimLOD)
+QUALITY_LEVELS = [
+    {"name": "high", "vision_smooth_edge": True, "hud_refresh_hz": None, "bullet_glow": True, "lod_scale": 1},
+    {"name": "medium", "vision_smooth_edge": False, "hud_refresh_hz": 30, "bullet_glow": True, "lod_scale": 1},
+    {"name": "low", "vision_smooth_edge": False, "hud_refresh_hz": 15, "bullet_glow": False, "lod_scale": 2},
+    {"name": "minimum", "vision_smooth_edge": False, "hud_refresh_hz": 10, "bullet_glow": False, "lod_scale": 2},
+]
+
+
+class FrameGovernor:
+    """
+    Watches rolling frame times and steps the quality level up or down.
+
+    Hysteresis: degrading needs the average over budget for `degrade_after` consecutive
+    checks, recovering needs clear headroom for the longer `recover_after`, and every
+    change is followed by a cooldown so the level doesn't oscillate.
+    """
+
+    def __init__(self, target_fps=TARGET_FPS, window=60, check_every=30,
+                 degrade_ratio=1.10, recover_ratio=0.80, degrade_after=2, recover_after=6, cooldown=3.0):
+        self.budget = 1.0 / target_fps
+        self.frame_times = deque(maxlen=window)
+        self.check_every = check_every
+        self.degrade_ratio = degrade_ratio
+        self.recover_ratio = recover_ratio
+        self.degrade_after = degrade_after
+        self.recover_after = recover_after
+        self.cooldown = cooldown
+
+        self.level = 0
+        self._frames_since_check = 0
+        self._over_checks = 0
+        self._under_checks = 0
+        self._cooldown_timer = 0.0
+
+        # Telemetry
+        self.transitions = 0
+        self.time_at_level = [0.0] * len(QUALITY_LEVELS)
+
+    @property
+    def settings(self):
+        return QUALITY_LEVELS[self.level]
+
+    def record(self, frame_time):
+        """Feed one frame's duration; returns True if the quality level changed."""
+        self.frame_times.append(frame_time)
+        self.time_at_level[self.level] += frame_time
+        self._cooldown_timer = max(0.0, self._cooldown_timer - frame_time)
+
+        self._frames_since_check += 1
+        if self._frames_since_check < self.check_every or len(self.frame_times) < self.frame_times.maxlen:
+            return False
+        self._frames_since_check = 0
+        return self._check()
+
+    def _check(self):
+        average = sum(self.frame_times) / len(self.frame_times)
+        if average > self.budget * self.degrade_ratio:
+            self._over_checks += 1
+            self._under_checks = 0
+        elif average < self.budget * self.recover_ratio:
+            self._under_checks += 1
+            self._over_checks = 0
+        else:
+            self._over_checks = 0
+            self._under_checks = 0
+
+        if self._cooldown_timer > 0:
+            return False
+        if self._over_checks >= self.degrade_after and self.level < len(QUALITY_LEVELS) - 1:
+            self._set_level(self.level + 1)
+            return True
+        if self._under_checks >= self.recover_after and self.level > 0:
+            self._set_level(self.level - 1)
+            return True
+        return False
+
+    def _set_level(self, level):
+        self.level = level
+        self.transitions += 1
+        self._over_checks = 0
+        self._under_checks = 0
+        self._cooldown_timer = self.cooldown
+        print(f"🎚️ Quality -> {self.settings['name']}")
+
+    def stats(self):
+        average = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+        return {
+            "level": self.level,
+            "level_name": self.settings["name"],
+            "avg_frame_ms": average * 1000,
+            "transitions": self.transitions,
+            "time_at_level": {QUALITY_LEVELS[i]["name"]: t for i, t in enumerate(self.time_at_level)},
+        }
@@ -0,0 +1,46 @@
+import importlib
+
+
+class LazyRegistry:
+    """
+    Maps names to "module.path:Attribute" strings and only imports the module the first
+    time the name is looked up, so startup doesn't pay for screens and tools it never opens.
+    """
+
+    def __init__(self, entries):
+        self._entries = dict(entries)
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        if name not in self._loaded:
+            module_path, attr = self._entries[name].split(":")
+            self._loaded[name] = getattr(importlib.import_module(module_path), attr)
+        return self._loaded[name]
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
+
+VIEWS = LazyRegistry({
+    "start": "scripts.views.start_view:StartView",
+    "game": "scripts.views.game_view:NeododgeGame",
+    "shop": "scripts.views.shop_view:ShopView",
+    "game_over": "scripts.views.game_over_view:GameOverView",
+})
+
+ARTIFACTS = LazyRegistry({
+    "Dash": "scripts.mechanics.artifacts.dash_artifact:DashArtifact",
+    "Magnet Pulse": "scripts.mechanics.artifacts.magnet_pulse:MagnetPulseArtifact",
+    "Slow Field": "scripts.mechanics.artifacts.slow_field:SlowFieldArtifact",
+    "Bullet Time": "scripts.mechanics.artifacts.bullet_time:BulletTimeArtifact",
+    "Clone Dash": "scripts.mechanics.artifacts.clone_dash:CloneDashArtifact",
+})
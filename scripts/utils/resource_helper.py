@@ -1,14 +1,77 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import arcade
+import PIL.Image
+from pyglet import media
+
+from scripts.utils.asset_pack import AssetPack
+
+ASSET_PACK_NAME = "assets.pack"
+
+
+@lru_cache(maxsize=None)
+def _base_path():
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        return Path(sys._MEIPASS)
+    except AttributeError:
+        return Path().absolute()
+
+
 def resource_path(relative_path):
     """
     Get the absolute path to a resource, whether we're running from source or from a PyInstaller bundle.
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = Path(sys._MEIPASS)
-    except AttributeError:
-        base_path = Path().absolute()
+    return _base_path() / relative_path
+
+
+@lru_cache(maxsize=None)
+def get_asset_pack():
+    """The bundled asset pack if one was built next to the game, otherwise None (loose files)."""
+    pack_path = resource_path(ASSET_PACK_NAME)
+    if pack_path.is_file():
+        return AssetPack(pack_path)
+    return None
+
+
+def open_resource(relative_path):
+    pack = get_asset_pack()
+    if pack is not None and relative_path in pack:
+        return pack.open(relative_path)
+    return open(resource_path(relative_path), "rb")
+
+
+class PackedSound(arcade.Sound):
+    """arcade.Sound decoded from the asset pack instead of a path on disk."""
+
+    def __init__(self, relative_path, streaming=False):
+        # arcade.Sound.__init__ isn't called: it insists on a real file on disk and loads
+        # from that path. These are the only three attributes it sets.
+        self.file_name = str(relative_path)
+        self.source = media.load(self.file_name, file=open_resource(relative_path), streaming=streaming)
+        self.min_distance = 100000000
+
+
+def load_sound(relative_path, streaming=False):
+    pack = get_asset_pack()
+    if pack is not None and relative_path in pack:
+        return PackedSound(relative_path, streaming=streaming)
+    return arcade.load_sound(resource_path(relative_path), streaming=streaming)
+
+
+def load_spritesheet(relative_path, sprite_width, sprite_height, columns, count):
+    # Same slicing as arcade.load_spritesheet, but PIL reads from the pack stream
+    with open_resource(relative_path) as file:
+        source_image = PIL.Image.open(file).convert("RGBA")
 
-    return base_path / relative_path
\ No newline at end of file
+    textures = []
+    for sprite_no in range(count):
+        row = sprite_no // columns
+        column = sprite_no % columns
+        x = sprite_width * column
+        y = sprite_height * row
+        image = source_image.crop((x, y, x + sprite_width, y + sprite_height))
+        textures.append(arcade.Texture(f"{relative_path}-{sprite_no}", image=image))
+    return textures
@@ -0,0 +1,154 @@
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+SAVE_DIR = Path(os.environ.get("NEODODGE_SAVE_DIR", Path.home() / ".neododge"))
+SAVE_FILE = "save.db"
+BATCH_SIZE = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profile (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS upgrades (
+    effect TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    purchased_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    wave INTEGER,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC);
+"""
+
+_STOP = object()
+
+
+class SaveStore:
+    """
+    Local SQLite save for coins, permanent upgrades and high scores.
+
+    Reads happen once at startup. Writes are queued and applied by a background thread
+    in batched transactions, so saving from inside a frame never touches the disk.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._read_conn = sqlite3.connect(self.path)
+        self._read_conn.executescript(SCHEMA)
+        self._read_conn.execute("PRAGMA journal_mode=WAL")
+        self._read_conn.commit()
+
+        self.coins = self._get_value("coins", 0)
+        self.upgrades = [
+            row[0] for row in self._read_conn.execute("SELECT effect FROM upgrades ORDER BY purchased_at")
+        ]
+
+        self._queue = queue.Queue()
+        self._pending_scores = []
+        self._pending_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._write_loop, name="save-writer", daemon=True)
+        self._writer.start()
+
+    def _get_value(self, key, default):
+        row = self._read_conn.execute("SELECT value FROM profile WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    # --- Writes (non-blocking) ---
+
+    def save_coins(self, coins):
+        self.coins = coins
+        self._queue.put(("coins", coins))
+
+    def add_upgrade(self, effect, name):
+        if effect not in self.upgrades:
+            self.upgrades.append(effect)
+        self._queue.put(("upgrade", (effect, name, time.time())))
+
+    def record_score(self, score, wave=None):
+        entry = (int(score), wave, time.time())
+        with self._pending_lock:
+            self._pending_scores.append(entry)
+        self._queue.put(("score", entry))
+
+    # --- Reads ---
+
+    def top_scores(self, limit=10):
+        """Best scores as (score, wave) pairs, including ones still waiting to be written."""
+        with self._pending_lock:
+            rows = self._read_conn.execute(
+                "SELECT score, wave FROM scores ORDER BY score DESC LIMIT ?", (limit,)
+            ).fetchall()
+            rows += [(score, wave) for score, wave, _ in self._pending_scores]
+        rows.sort(key=lambda row: row[0], reverse=True)
+        return rows[:limit]
+
+    # --- Writer thread ---
+
+    def _write_loop(self):
+        conn = sqlite3.connect(self.path)
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            running = _STOP not in batch
+            ops = [op for op in batch if op is not _STOP]
+            if ops:
+                self._apply(conn, ops)
+            for _ in batch:
+                self._queue.task_done()
+        conn.close()
+
+    def _apply(self, conn, ops):
+        coins = None
+        upgrades = []
+        scores = []
+        for kind, payload in ops:
+            if kind == "coins":
+                coins = payload  # only the latest balance in a batch matters
+            elif kind == "upgrade":
+                upgrades.append(payload)
+            elif kind == "score":
+                scores.append(payload)
+
+        # Held across the commit so top_scores never sees a score both pending and stored
+        with self._pending_lock:
+            with conn:
+                if coins is not None:
+                    conn.execute("INSERT OR REPLACE INTO profile (key, value) VALUES ('coins', ?)", (coins,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO upgrades (effect, name, purchased_at) VALUES (?, ?, ?)", upgrades
+                )
+                conn.executemany("INSERT INTO scores (score, wave, created_at) VALUES (?, ?, ?)", scores)
+            for entry in scores:
+                self._pending_scores.remove(entry)
+
+    def flush(self):
+        """Block until every queued write has been committed."""
+        self._queue.join()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._read_conn.close()
+
+
+@lru_cache(maxsize=None)
+def get_store():
+    store = SaveStore(SAVE_DIR / SAVE_FILE)
+    atexit.register(store.close)
+    return store
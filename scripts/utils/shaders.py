@@ -1,9 +1,125 @@
 import arcade
 import array
+import hashlib
+
+# Full-screen quad, clip-space positions and uvs
+FULLSCREEN_QUAD = array.array(
+    'f', [
+        -1.0, -1.0, 0.0, 0.0,
+         1.0, -1.0, 1.0, 0.0,
+        -1.0,  1.0, 0.0, 1.0,
+         1.0, -1.0, 1.0, 0.0,
+         1.0,  1.0, 1.0, 1.0,
+        -1.0,  1.0, 0.0, 1.0
+    ]
+)
+
+
+def source_key(*parts):
+    """sha1 over shader sources or vertex data plus their layout, used as a cache key."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class GLCache:
+    """
+    Programs, geometries and framebuffers for one GL context, built once and shared by every view.
+
+    Programs and geometries are keyed by a hash of their sources and vertex data, so two
+    callers asking for the same shader get the same compiled program. Framebuffers and
+    writable vertex buffers are keyed by name and size; whoever draws into one owns it for
+    that frame. release() deletes everything and runs the on_release callbacks, and
+    GameWindow calls it before the context goes away.
+    """
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.programs = {}
+        self.geometries = {}
+        self.framebuffers = {}
+        self.streams = {}
+        self.release_callbacks = []
+        self.compiles = 0
+
+    def program(self, **sources):
+        key = source_key(*sorted(sources.items()))
+        program = self.programs.get(key)
+        if program is None:
+            program = self.programs[key] = self.ctx.program(**sources)
+            self.compiles += 1
+        return program
+
+    def geometry(self, data, fmt, attributes, mode=None):
+        key = source_key(data.tobytes(), fmt, attributes, mode)
+        entry = self.geometries.get(key)
+        if entry is None:
+            buffer = self.ctx.buffer(data=data)
+            geometry = self.ctx.geometry([arcade.gl.BufferDescription(buffer, fmt, attributes)], mode=mode)
+            entry = self.geometries[key] = (geometry, buffer)
+        return entry[0]
+
+    def framebuffer(self, name, size, components=4, filter=None):
+        key = (name, tuple(size), components, filter)
+        fbo = self.framebuffers.get(key)
+        if fbo is None:
+            texture = self.ctx.texture(size, components=components, filter=filter)
+            fbo = self.framebuffers[key] = self.ctx.framebuffer(color_attachments=[texture])
+        return fbo
+
+    def stream_geometry(self, name, reserve, fmt, attributes, mode=None):
+        """Geometry over an empty buffer of reserve bytes that the caller writes into; (geometry, buffer)."""
+        key = (name, reserve, fmt, tuple(attributes), mode)
+        entry = self.streams.get(key)
+        if entry is None:
+            buffer = self.ctx.buffer(reserve=reserve)
+            geometry = self.ctx.geometry([arcade.gl.BufferDescription(buffer, fmt, attributes)], mode=mode)
+            entry = self.streams[key] = (geometry, buffer)
+        return entry
+
+    def on_release(self, callback):
+        """Call callback() once this context's objects are deleted, to drop references to them."""
+        self.release_callbacks.append(callback)
+
+    def release(self):
+        for program in self.programs.values():
+            program.delete()
+        for geometry, buffer in (*self.geometries.values(), *self.streams.values()):
+            geometry.flush()
+            buffer.delete()
+        for fbo in self.framebuffers.values():
+            for texture in fbo.color_attachments:
+                texture.delete()
+            fbo.delete()
+        self.programs.clear()
+        self.geometries.clear()
+        self.framebuffers.clear()
+        self.streams.clear()
+        callbacks, self.release_callbacks = self.release_callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+_caches = {}
+
+
+def gl_cache(ctx):
+    cache = _caches.get(ctx)
+    if cache is None:
+        cache = _caches[ctx] = GLCache(ctx)
+    return cache
+
+
+def release_gl_cache(ctx):
+    cache = _caches.pop(ctx, None)
+    if cache is not None:
+        cache.release()
 
 
 def load_vision_shader(window):
-    return window.ctx.program(
+    return gl_cache(window.ctx).program(
         vertex_shader="""
         #version 330
         in vec2 in_vert;
@@ -19,13 +135,19 @@ def load_vision_shader(window):
         uniform vec2 resolution;
         uniform vec2 center;
         uniform float radius;
+        uniform bool smooth_edge;
         in vec2 uv;
         out vec4 fragColor;
 
         void main() {
             vec2 fragCoord = uv * resolution;
             float dist = distance(fragCoord, center);
-            float alpha = 1.0 - smoothstep(radius, radius - 25.0, dist);
+            float alpha;
+            if (smooth_edge) {
+                alpha = 1.0 - smoothstep(radius, radius - 25.0, dist);
+            } else {
+                alpha = dist < radius ? 0.0 : 1.0;
+            }
             fragColor = vec4(0.0, 0.0, 0.0, 1.0 - alpha);
         }
         """
@@ -33,19 +155,29 @@ def load_vision_shader(window):
 
 
 def create_vision_geometry(window):
-    # Create full-screen quad
-    quad = array.array(
-        'f', [
-            -1.0, -1.0, 0.0, 0.0,
-             1.0, -1.0, 1.0, 0.0,
-            -1.0,  1.0, 0.0, 1.0,
-             1.0, -1.0, 1.0, 0.0,
-             1.0,  1.0, 1.0, 1.0,
-            -1.0,  1.0, 0.0, 1.0
-        ]
-    )
+    return gl_cache(window.ctx).geometry(FULLSCREEN_QUAD, "2f 2f", ["in_vert", "in_tex"])
 
-    vbo = window.ctx.buffer(data=quad)
-    return window.ctx.geometry([
-        arcade.gl.BufferDescription(vbo, "2f 2f", ["in_vert", "in_tex"])
-    ])
+
+def load_blit_shader(window):
+    # Draws a texture over the full screen; used to composite cached layers like the HUD
+    return gl_cache(window.ctx).program(
+        vertex_shader="""
+        #version 330
+        in vec2 in_vert;
+        in vec2 in_tex;
+        out vec2 uv;
+        void main() {
+            gl_Position = vec4(in_vert, 0.0, 1.0);
+            uv = in_tex;
+        }
+        """,
+        fragment_shader="""
+        #version 330
+        uniform sampler2D layer;
+        in vec2 uv;
+        out vec4 fragColor;
+        void main() {
+            fragColor = texture(layer, uv);
+        }
+        """
+    )
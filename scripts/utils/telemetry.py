@@ -0,0 +1,147 @@
+import bisect
+import gc
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from scripts.utils.save_store import SAVE_DIR
+
+# Opt-in: set NEODODGE_TELEMETRY=1 to record sessions
+TELEMETRY_ENABLED = os.environ.get("NEODODGE_TELEMETRY", "0") == "1"
+TELEMETRY_DIR = SAVE_DIR / "telemetry"
+# Older session files are deleted when a new session starts
+MAX_SESSIONS = int(os.environ.get("NEODODGE_TELEMETRY_SESSIONS", "20"))
+FORMAT_VERSION = 1
+SAMPLE_INTERVAL = 1.0
+
+# Upper edges of the frame-time histogram bins, in milliseconds; the last bin is open-ended
+FRAME_BINS_MS = [4, 8, 12, 16.7, 20, 25, 33.3, 50, 100]
+
+
+def current_rss():
+    """Resident set size in bytes, or None where it can't be read cheaply."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return None
+
+
+def prune_sessions(keep=MAX_SESSIONS):
+    """Delete all but the newest `keep` session files."""
+    # Names carry the start time, so name order is age order
+    sessions = sorted(TELEMETRY_DIR.glob("session-*.jsonl"))
+    for path in sessions[:max(0, len(sessions) - keep)]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class TelemetryRecorder:
+    """
+    Per-second session samples: frame-time histogram, entity counts, wave, GC and RSS.
+
+    Samples are kept in memory and appended to a JSONL file only when flush() is called
+    (at wave boundaries), so the per-frame cost is a bisect and an increment.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.buffer = []
+        self.hist = [0] * (len(FRAME_BINS_MS) + 1)
+        self.frames = 0
+        self.elapsed = 0.0
+        self.session_time = 0.0
+        self.overhead = 0.0
+        self._header_written = False
+
+    @classmethod
+    def for_new_session(cls):
+        if not TELEMETRY_ENABLED:
+            return None
+        TELEMETRY_DIR.mkdir(parents=True, exist_ok=True)
+        prune_sessions(MAX_SESSIONS - 1)
+        return cls(TELEMETRY_DIR / f"session-{time.strftime('%Y%m%d-%H%M%S')}.jsonl")
+
+    def tick(self, delta_time, game):
+        start = time.perf_counter()
+        self.hist[bisect.bisect_left(FRAME_BINS_MS, delta_time * 1000)] += 1
+        self.frames += 1
+        self.elapsed += delta_time
+        self.session_time += delta_time
+        if self.elapsed >= SAMPLE_INTERVAL:
+            self.buffer.append(self._sample(game))
+            self.hist = [0] * len(self.hist)
+            self.frames = 0
+            self.elapsed = 0.0
+        self.overhead += time.perf_counter() - start
+
+    def _sample(self, game):
+        governor = getattr(game, "governor", None)
+        input_queue = getattr(game, "input_queue", None)
+        latency = input_queue.latency_stats() if input_queue else None
+        pacer = getattr(game.window, "pacer", None)
+        pacing = pacer.stats.summary() if pacer else None
+        sample = {
+            "t": round(self.session_time, 3),
+            "frames": self.frames,
+            "hist": self.hist,
+            "enemies": len(game.enemies),
+            "bullets": sum(len(enemy.bullets) for enemy in game.enemies),
+            "orbs": len(game.orbs),
+            "coins": len(game.coins),
+            "wave": game.wave_manager.wave,
+            "gc": gc.get_count(),
+            "gc_collections": [gen["collections"] for gen in gc.get_stats()],
+            "rss": current_rss(),
+            "quality": governor.level if governor else 0,
+            "input_p95_ms": round(latency["p95_ms"], 2) if latency else None,
+            "jitter_ms": round(pacing["jitter_ms"], 3) if pacing else None,
+            "overhead_us": round(self.overhead * 1e6),
+        }
+        self.overhead = 0.0
+        return sample
+
+    def flush(self):
+        if not self.buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            if not self._header_written:
+                header = {"version": FORMAT_VERSION, "frame_bins_ms": FRAME_BINS_MS, "started": time.time()}
+                f.write(json.dumps(header) + "\n")
+                self._header_written = True
+            f.writelines(json.dumps(sample, separators=(",", ":")) + "\n" for sample in self.buffer)
+        self.buffer.clear()
+
+
+def load_session(path):
+    """Read a session file into NumPy arrays keyed by field (hist is frames x bins)."""
+    import numpy as np
+
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        samples = [json.loads(line) for line in f if line.strip()]
+
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported telemetry version {header.get('version')}")
+
+    arrays = {"frame_bins_ms": np.array(header["frame_bins_ms"], dtype=np.float32)}
+    for key in ("t", "frames", "enemies", "bullets", "orbs", "coins", "wave", "quality", "overhead_us"):
+        arrays[key] = np.array([s[key] for s in samples])
+    # NaN where the session had no input yet / ran without the frame pacer
+    arrays["input_p95_ms"] = np.array([s.get("input_p95_ms") for s in samples], dtype=np.float64)
+    arrays["jitter_ms"] = np.array([s.get("jitter_ms") for s in samples], dtype=np.float64)
+    arrays["rss"] = np.array([s["rss"] if s["rss"] is not None else -1 for s in samples], dtype=np.int64)
+    arrays["hist"] = np.array([s["hist"] for s in samples], dtype=np.int32).reshape(len(samples), -1)
+    arrays["gc"] = np.array([s["gc"] for s in samples], dtype=np.int32).reshape(len(samples), -1)
+    arrays["gc_collections"] = np.array([s["gc_collections"] for s in samples], dtype=np.int64).reshape(len(samples), -1)
+    return arrays
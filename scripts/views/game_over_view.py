@@ -1,28 +1,42 @@
 import arcade
+from scripts.utils.registry import VIEWS
+from scripts.utils.save_store import get_store
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
+HIGH_SCORE_ROWS = 5
 
 class GameOverView(arcade.View):
-    def __init__(self, final_score: int):
+    def __init__(self, final_score: int, wave: int = None):
         super().__init__()
         self.final_score = final_score
+        self.wave = wave
+        self.high_scores = []
 
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
+        store = get_store()
+        store.record_score(self.final_score, self.wave)
+        self.high_scores = store.top_scores(HIGH_SCORE_ROWS)
 
     def on_draw(self):
         self.clear()
-        arcade.draw_text("GAME OVER", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80,
+        arcade.draw_text("GAME OVER", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 160,
                          arcade.color.RED, 48, anchor_x="center", font_name="Kenney Pixel")
-        arcade.draw_text(f"Final Score: {self.final_score}", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20,
+        arcade.draw_text(f"Final Score: {int(self.final_score)}", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100,
                          arcade.color.WHITE, 28, anchor_x="center")
-        arcade.draw_text("Press ENTER to Play Again", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60,
+
+        arcade.draw_text("High Scores", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50,
+                         arcade.color.GOLD, 20, anchor_x="center")
+        for i, (score, wave) in enumerate(self.high_scores):
+            wave_text = f"  (Wave {wave})" if wave else ""
+            arcade.draw_text(f"{i + 1}. {score}{wave_text}", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 15 - i * 28,
+                             arcade.color.LIGHT_GRAY, 16, anchor_x="center")
+
+        arcade.draw_text("Press ENTER to Play Again", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 160,
                          arcade.color.GRAY, 18, anchor_x="center")
 
     def on_key_press(self, symbol, modifiers):
         if symbol == arcade.key.ENTER:
-            from main import NeododgeGame
-            game = NeododgeGame()
+            game = VIEWS["game"]()
             game.setup()
             self.window.show_view(game)
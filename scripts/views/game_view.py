@@ -0,0 +1,550 @@
+import arcade
+import math
+import random
+import time
+from collections import deque
+
+# Characters
+from scripts.characters.player import Player
+
+# Orbs
+from scripts.mechanics.orbs.buff_orbs import BuffOrb
+from scripts.mechanics.orbs.debuff_orbs import DebuffOrb
+
+# Coins
+from scripts.mechanics.coins.coin import Coin
+from scripts.mechanics.bullet import set_bullet_glow
+
+# Collision
+from scripts.mechanics.collision import sprite_swept_hit, mark_checked, overlaps, collide_many
+from scripts.mechanics.flow_field import FlowField
+from scripts.mechanics.steering import FlockSteering
+from scripts.mechanics.sim_lod import SimLOD
+from scripts.mechanics.arena import Camera, ChunkCuller, CulledLayer, world_projection, draw_arena
+from scripts.mechanics.modifiers import apply_upgrade
+from scripts.mechanics.snapshot import save_snapshot, restore_snapshot, write_snapshot, read_snapshot
+
+# Mechanics
+from scripts.mechanics.wave_manager import WaveManager
+
+# Utilities
+from scripts.utils.constants import SCREEN_HEIGHT, ARENA_WIDTH, ARENA_HEIGHT
+from scripts.utils.registry import ARTIFACTS, VIEWS
+from scripts.utils.shaders import load_vision_shader, create_vision_geometry
+from scripts.utils.spawner import spawn_random_orb, spawn_dash_artifact
+from scripts.utils.pickup_text import update_pickup_texts
+from scripts.utils.hud import (
+    HudLayer,
+    HudState,
+    draw_pickup_texts,
+    draw_wave_message,
+    draw_wave_timer,
+    draw_wave_number,
+    draw_coin_count,
+)
+from scripts.utils.wave_text import fade_wave_message_alpha
+from scripts.utils.quality_governor import FrameGovernor
+from scripts.utils.telemetry import TelemetryRecorder
+from scripts.utils.gc_scheduler import gc_scheduler
+from scripts.utils.mixer import play_sfx
+from scripts.utils.music import play_music
+from scripts.utils.particles import particles, emit_particles
+from scripts.utils.save_store import get_store, SAVE_DIR
+from scripts.utils.display import RenderTarget
+from scripts.utils.input_queue import InputQueue
+from scripts.utils.pipeline import PIPELINED, SimPipeline, FrameRenderer, LazySpriteList
+
+
+QUICKSAVE_PATH = SAVE_DIR / "quicksave.ndss"
+REWIND_SECONDS = 10
+
+# Held arrow keys steer toward a point this far ahead of the player
+STEER_KEYS = {
+    arcade.key.LEFT: (-1, 0),
+    arcade.key.RIGHT: (1, 0),
+    arcade.key.UP: (0, 1),
+    arcade.key.DOWN: (0, -1),
+}
+STEER_LOOKAHEAD = 40
+ARTIFACT_KEYS = {
+    arcade.key.Q: 0,
+    arcade.key.W: 1,
+    arcade.key.E: 2,
+    arcade.key.R: 3,
+}
+
+
+class NeododgeGame(arcade.View):
+    def __init__(self):
+        super().__init__()
+        self.player = None
+        # Lazy so a pipelined simulation can fill them off the main thread
+        self.enemies = LazySpriteList()
+        self.orbs = LazySpriteList()
+        self.coins = LazySpriteList()
+        self.dash_artifact = None
+        self.pickup_texts = []
+        self.wave_duration = 20.0
+        self.level_timer = 0.0
+        self.orb_spawn_timer = random.uniform(4, 8)
+        self.artifact_spawn_timer = random.uniform(20, 30)
+        self.score = 0
+        self.wave_manager = None
+        self.in_wave = True
+        self.wave_pause_timer = 0.0
+        self.wave_message_alpha = 255
+        self.wave_message = ""
+        self.wave_pause = False
+        self.clones = []
+        self.vision_shader = None
+        self.vision_geometry = None
+        self.coins_to_spawn = 0
+        self.coin_spawn_timer = 0.0
+        self.store = None
+        self.governor = FrameGovernor()
+        self.hud_layer = None
+        self.render_target = None
+        self.sim_lod = SimLOD()
+        self.camera = Camera()
+        self.culler = ChunkCuller()
+        self.live_bullet_lists = []  # enemies' bullet lists with something in a live chunk
+        # Draw lists for the live orbs, coins and enemies, in that order
+        self.culled_layers = (CulledLayer(), CulledLayer(), CulledLayer())
+        self.telemetry = None
+        self.flow_field = None
+        self.steering = FlockSteering()
+        self.rewind_buffer = deque(maxlen=REWIND_SECONDS)
+        self.rewind_timer = 0.0
+        self.input_queue = InputQueue()
+        self.pipeline = None
+        self.frame_renderer = None
+
+    def on_show(self):
+        arcade.set_background_color(arcade.color.BLACK)
+        play_music("game")
+        self.vision_shader = load_vision_shader(self.window)
+        self.vision_geometry = create_vision_geometry(self.window)
+        if self.hud_layer is None:
+            self.hud_layer = HudLayer(self.window)
+        if self.render_target is None:
+            self.render_target = RenderTarget(self.window)
+        particles.attach(self.window.ctx)
+        if PIPELINED and self.pipeline is None:
+            if self.frame_renderer is None:
+                self.frame_renderer = FrameRenderer()
+            self.pipeline = SimPipeline(self.simulate, self.capture_frame)
+            self.pipeline.start()
+
+        if self.in_wave:
+            gc_scheduler.enter_wave()
+
+    def on_hide_view(self):
+        # Shown again after the shop with a fresh worker
+        if self.pipeline:
+            self.pipeline.stop()
+            self.pipeline = None
+        # Leaving for the shop or game over screen: a good moment to collect and write telemetry out
+        gc_scheduler.enter_pause()
+        if self.telemetry:
+            self.telemetry.flush()
+        # Key releases won't reach us while another view is up
+        self.input_queue.held.clear()
+
+    def setup(self):
+        self.player = Player(ARENA_WIDTH // 2, ARENA_HEIGHT // 2)
+        particles.clear()
+        self.player.window = self.window
+        self.player.parent_view = self
+        self.store = get_store()
+        self.player.coins = self.store.coins
+        for effect in self.store.upgrades:
+            apply_upgrade(self.player, effect)
+        self.player.current_hearts = float(self.player.max_slots)
+        self.telemetry = TelemetryRecorder.for_new_session()
+        self.camera.center_on(self.player.center_x, self.player.center_y)
+        self.culler.update(self.camera)
+        self.flow_field = FlowField(ARENA_WIDTH, ARENA_HEIGHT)
+        self.flow_field.update(self.player.center_x, self.player.center_y)
+        self.wave_manager = WaveManager(self.player, flow_field=self.flow_field)
+        self.wave_manager.spawn_enemies(self.enemies, ARENA_WIDTH, ARENA_HEIGHT)
+        self.dash_artifact = spawn_dash_artifact(ARENA_WIDTH, ARENA_HEIGHT)
+        self.orbs = LazySpriteList()
+
+    def on_draw(self):
+        if self.pipeline:
+            self.draw_frame(self.pipeline.front)
+            return
+        self.clear()
+
+        # --- World Layer (internal resolution, scrolled by the camera) ---
+        with self.render_target.activate(), world_projection(self.window.ctx, self.camera.left, self.camera.bottom):
+            draw_arena(self.culler.grid_lines())
+            self.player.draw()
+            # Only what's in the live chunks is drawn, as in capture_frame
+            visible = self.culler.visible
+            for layer, sprites in zip(self.culled_layers, (self.orbs, self.coins, self.enemies)):
+                layer.sync(visible(sprites))
+                layer.draw()
+            # Bullet lists entirely outside the live chunks aren't drawn at all
+            for bullets in self.live_bullet_lists:
+                bullets.draw()
+            if self.dash_artifact:
+                self.dash_artifact.draw()
+            particles.draw()
+
+            # Draw vision blur if active
+            if self.player.vision_blur:
+                self.draw_vision(self.player.center_x, self.player.center_y)
+        self.render_target.present()
+
+        # --- HUD Layer ---
+        self.hud_layer.draw(lambda: self.draw_hud(HudState(self)), time.perf_counter(),
+                            self.governor.settings["hud_refresh_hz"])
+        # Inputs applied in the last update are on screen once this frame is swapped in
+        self.input_queue.frame_presented()
+
+    def draw_frame(self, frame):
+        # Pipelined mode: the same layers, drawn from the tick the worker last handed over
+        self.clear()
+        with self.render_target.activate(), world_projection(self.window.ctx, *frame.camera):
+            draw_arena(frame.grid_lines)
+            self.frame_renderer.draw(frame)
+            particles.draw()
+            if frame.vision_center:
+                self.draw_vision(*frame.vision_center, camera=frame.camera)
+        self.render_target.present()
+        self.hud_layer.draw(lambda: self.draw_hud(frame.hud), time.perf_counter(),
+                            self.governor.settings["hud_refresh_hz"])
+        if frame.inputs:
+            self.input_queue.frame_presented(frame.inputs)
+            frame.inputs = []
+        # The next tick overlaps the buffer swap and whatever the pacer does until the next update
+        self.pipeline.release()
+
+    def capture_frame(self, frame):
+        # Only what's in the live chunks is copied out and drawn
+        visible = self.culler.visible
+        frame.sprites.clear()
+        if not self.player.invincible or self.player.blink_state:
+            frame.add_sprites((self.player,))
+        frame.add_sprites(visible(self.orbs))
+        frame.add_sprites(visible(self.coins))
+        frame.add_sprites(visible(self.enemies))
+        for bullets in self.live_bullet_lists:
+            frame.add_sprites(visible(bullets))
+        if self.dash_artifact and self.culler.is_live(self.dash_artifact.center_x, self.dash_artifact.center_y):
+            frame.add_sprites((self.dash_artifact,))
+        frame.camera = (self.camera.left, self.camera.bottom)
+        frame.grid_lines = self.culler.grid_lines()
+        frame.vision_center = (self.player.center_x, self.player.center_y) if self.player.vision_blur else None
+        frame.hud = HudState(self, detach=True)
+        frame.inputs = self.input_queue.take_applied()
+
+    def draw_vision(self, x, y, camera=None):
+        # The shader works in screen coordinates, so shift by where the world was drawn from
+        left, bottom = camera or (self.camera.left, self.camera.bottom)
+        self.vision_shader["resolution"] = (self.camera.width, self.camera.height)
+        self.vision_shader["center"] = (x - round(left), y - round(bottom))
+        self.vision_shader["radius"] = 130.0
+        self.vision_shader["smooth_edge"] = self.governor.settings["vision_smooth_edge"]
+        self.vision_geometry.render(self.vision_shader)
+
+    def draw_hud(self, hud):
+        hud.player.draw_hearts()
+        hud.player.draw_orb_status()
+        hud.player.draw_artifacts()
+        arcade.draw_text(f"Score: {int(hud.score)}", 30, SCREEN_HEIGHT - 60, arcade.color.WHITE, 16)
+        draw_pickup_texts(hud.pickup_texts, hud.camera)
+        draw_coin_count(hud.player.coins)
+
+        # Wave timer and message
+        if not hud.wave_pause:
+            draw_wave_timer(hud.level_timer, hud.wave_duration)
+        if not hud.in_wave and hud.wave_message:
+            draw_wave_message(hud.wave_message, hud.wave_message_alpha)
+
+        # Draw wave number
+        draw_wave_number(hud.wave)
+
+    def on_update(self, delta_time):
+        if self.pipeline:
+            self.pipeline.submit(delta_time)
+        else:
+            self.simulate(delta_time)
+        # Particles live on the GPU, so they always advance here on the main thread
+        particles.update(delta_time)
+
+    def simulate(self, delta_time):
+        if self.governor.record(delta_time):
+            self.apply_quality()
+        if self.telemetry:
+            self.telemetry.tick(delta_time, self)
+
+        # One snapshot a second for rewind
+        self.rewind_timer -= delta_time
+        if self.rewind_timer <= 0:
+            self.rewind_buffer.append(save_snapshot(self))
+            self.rewind_timer = 1.0
+
+        self.step_player(delta_time)
+        self.camera.follow(self.player.center_x, self.player.center_y, delta_time)
+        self.culler.update(self.camera)
+        self.flow_field.update(self.player.center_x, self.player.center_y)
+        self.orbs.update()
+        self.coins.update()
+        steps = self.update_enemies(delta_time)
+        self.steering.apply(self.enemies, delta_time, steps)
+        # Multiplier orbs and the shop's Multiplier scale every score award
+        self.score += delta_time * 10 * self.player.multiplier
+        self.orb_spawn_timer -= delta_time
+        self.artifact_spawn_timer -= delta_time
+        self.pickup_texts = update_pickup_texts(self.pickup_texts, delta_time)
+
+        for artifact in self.player.artifacts:
+            if hasattr(artifact, 'update'):
+                artifact.update(delta_time)
+
+        if self.in_wave:
+            self.level_timer += delta_time
+            if self.level_timer >= self.wave_duration:
+                self.in_wave = False
+                self.wave_pause_timer = 3.0
+                self.wave_message = f"Successfully survived Wave {self.wave_manager.wave}!"
+                self.wave_message_alpha = 255
+                print(self.wave_message)
+                print(self.input_queue.report())
+                print(self.sim_lod.report())
+                gc_scheduler.enter_pause()
+                if self.telemetry:
+                    self.telemetry.flush()
+        else:
+            self.wave_pause_timer -= delta_time
+            self.wave_message_alpha = fade_wave_message_alpha(self.wave_pause_timer)
+            if self.wave_pause_timer <= 0:
+                self.wave_manager.next_wave()
+                info = self.wave_manager.spawn_enemies(self.enemies, ARENA_WIDTH, ARENA_HEIGHT)
+                self.wave_manager.spawn_orbs(self.orbs, info["orbs"], ARENA_WIDTH, ARENA_HEIGHT)
+
+                # Set up the coin plan
+                self.coins_to_spawn = random.randint(1, 5)
+                self.coin_spawn_timer = random.uniform(3, 7) / self.player.coin_rate
+                print(f"🪙 Will spawn {self.coins_to_spawn} coins over time")
+
+                if info["artifact"]:
+                    artifact = self.wave_manager.maybe_spawn_artifact(
+                        self.player.artifacts,
+                        self.dash_artifact,
+                        ARENA_WIDTH,
+                        ARENA_HEIGHT
+                    )
+                    if artifact:
+                        self.dash_artifact = artifact
+                self.wave_duration = 20 + (self.wave_manager.wave - 1) * 5
+                self.level_timer = 0
+                self.in_wave = True
+                gc_scheduler.enter_wave()
+                print(f"🚀 Starting Wave {self.wave_manager.wave}")
+
+                # Check if it's time to go to the shop
+                if self.wave_manager.wave % 5 == 0:
+                    shop_view = VIEWS["shop"](self.player, self)
+                    self.window.show_view(shop_view)
+
+        if self.orb_spawn_timer <= 0:
+            self.orbs.append(spawn_random_orb(ARENA_WIDTH, ARENA_HEIGHT))
+            self.orb_spawn_timer = random.uniform(4, 8) / self.player.orb_rate
+        if self.artifact_spawn_timer <= 0 and not self.dash_artifact:
+            self.dash_artifact = spawn_dash_artifact(ARENA_WIDTH, ARENA_HEIGHT)
+            self.artifact_spawn_timer = random.uniform(20, 30)
+        if self.dash_artifact and overlaps(self.player, self.dash_artifact):
+            # Only add if not already collected
+            DashArtifact = ARTIFACTS["Dash"]
+            if not any(isinstance(a, DashArtifact) for a in self.player.artifacts):
+                self.player.artifacts.append(DashArtifact())
+                print("✨ Dash unlocked!")
+            else:
+                print("⚠️ Dash already unlocked.")
+            self.player.can_dash = True
+            self.dash_artifact = None
+
+        # Staggered coin spawning
+        if self.coins_to_spawn > 0:
+            self.coin_spawn_timer -= delta_time
+            if self.coin_spawn_timer <= 0:
+                x = random.randint(50, ARENA_WIDTH - 50)
+                y = random.randint(50, ARENA_HEIGHT - 50)
+                self.coins.append(Coin(x, y))
+                self.coins_to_spawn -= 1
+                self.coin_spawn_timer = random.uniform(3, 7) / self.player.coin_rate
+                print(f"🪙 Spawned a coin! Remaining: {self.coins_to_spawn}")
+
+        # Nothing outside the live chunks can reach the player: those only move this tick
+        is_live = self.culler.is_live
+        self.live_bullet_lists = []
+        for enemy in self.enemies:
+            live_bullets = False
+            for bullet in enemy.bullets:
+                bullet.update(delta_time)
+                if not is_live(bullet.center_x, bullet.center_y):
+                    mark_checked(bullet)
+                    continue
+                live_bullets = True
+                dist = arcade.get_distance_between_sprites(self.player, bullet)
+                if 10 < dist < 35:
+                    self.score += self.player.multiplier
+                    print(f"🌀 Close dodge! +{self.player.multiplier:g} score")
+                # Swept test so a frame hitch or a dash can't tunnel through a bullet
+                if bullet.age > 0.2 and not self.player.invincible and sprite_swept_hit(bullet, self.player):
+                    self.player.take_damage(0.5)
+                    enemy.bullets.remove(bullet)
+                mark_checked(bullet)
+            if live_bullets:
+                self.live_bullet_lists.append(enemy.bullets)
+            # Both bodies are swept, so the enemy's last position is kept even while it's culled
+            if (is_live(enemy.center_x, enemy.center_y) and not self.player.invincible
+                    and sprite_swept_hit(self.player, enemy)):
+                self.player.take_damage(1.0)
+            mark_checked(enemy)
+        mark_checked(self.player)
+        for orb in self.orbs:
+            orb.update(delta_time)
+        for orb in collide_many(self.player, self.orbs):
+            if orb.age > 0.5:
+                orb.apply_effect(self.player)
+                self.pickup_texts.append([orb.message, self.player.center_x, self.player.center_y, 1.0])
+
+                # Play orb sound
+                if isinstance(orb, BuffOrb):
+                    play_sfx("buff")
+                    emit_particles("buff", orb.center_x, orb.center_y)
+                elif isinstance(orb, DebuffOrb):
+                    play_sfx("debuff")
+                    emit_particles("debuff", orb.center_x, orb.center_y)
+
+                self.orbs.remove(orb)
+
+        for coin in self.coins:
+            coin.update_animation(delta_time)
+        for coin in collide_many(self.player, self.coins):
+            self.player.coins += coin.coin_value
+            self.store.save_coins(self.player.coins)
+            play_sfx("coin")
+            emit_particles("coin", coin.center_x, coin.center_y)
+            self.coins.remove(coin)
+
+    def skip_wave(self):
+        # Shop "Skip Wave": end the current wave now and pay out the points it would have given
+        if self.in_wave:
+            self.score += (self.wave_duration - self.level_timer) * 10 * self.player.multiplier
+            self.level_timer = self.wave_duration
+
+    def update_enemies(self, delta_time):
+        return self.sim_lod.update(self.enemies, self.player, delta_time, self.governor.settings["lod_scale"])
+
+    def apply_quality(self):
+        settings = self.governor.settings
+        set_bullet_glow(settings["bullet_glow"], [enemy.bullets for enemy in self.enemies])
+
+    def step_player(self, delta_time):
+        # Everything received since the last tick applies before the player moves: events are
+        # dispatched in a burst just before on_update, so their stamps can't place them in the tick
+        for event in self.input_queue.drain():
+            self.apply_input(event)
+            self.input_queue.applied(event)
+        self.advance_player(delta_time)
+
+    def advance_player(self, dt):
+        # Snapshot the held keys; key handlers may change the set mid-tick in pipelined mode
+        held = tuple(self.input_queue.held)
+        if held:
+            dx = sum(STEER_KEYS[key][0] for key in held)
+            dy = sum(STEER_KEYS[key][1] for key in held)
+            if dx or dy:
+                length = math.hypot(dx, dy)
+                self.player.set_target(self.player.center_x + dx / length * STEER_LOOKAHEAD,
+                                       self.player.center_y + dy / length * STEER_LOOKAHEAD)
+        self.player.update(dt)
+        # Keep the player inside the arena; the camera stops at its edges
+        player = self.player
+        if not (0 <= player.center_x <= ARENA_WIDTH and 0 <= player.center_y <= ARENA_HEIGHT):
+            player.center_x = min(max(player.center_x, 0), ARENA_WIDTH)
+            player.center_y = min(max(player.center_y, 0), ARENA_HEIGHT)
+
+    def apply_input(self, event):
+        if event.kind == "target":
+            self.player.set_target(event.x, event.y)
+        elif event.kind == "stop" or (event.kind == "steer" and not self.input_queue.held):
+            self.player.set_target(self.player.center_x, self.player.center_y)
+        elif event.kind == "dash":
+            self.player.try_dash()
+        elif event.kind == "artifact":
+            self.use_artifact(event.value)
+
+    def use_artifact(self, idx):
+        if idx < len(self.player.artifacts):
+            artifact = self.player.artifacts[idx]
+            name = artifact.__class__.__name__
+            if name == "MagnetPulseArtifact":
+                artifact.apply_effect(self.player, self.orbs)
+            elif name == "SlowFieldArtifact":
+                for enemy in self.enemies:
+                    for bullet in enemy.bullets:
+                        artifact.apply_effect(self.player, [bullet])
+            elif name == "BulletTimeArtifact":
+                artifact.apply_effect(self.enemies)
+            elif name == "CloneDashArtifact":
+                artifact.apply_effect(self.player, self.enemies)
+            elif name == "DashArtifact":
+                self.player.try_dash()
+
+    def on_mouse_press(self, x, y, button, modifiers):
+        if button == arcade.MOUSE_BUTTON_RIGHT:
+            self.input_queue.push("target", *self.camera.to_world(x, y))
+
+    def on_mouse_drag(self, x, y, dx, dy, buttons, modifiers):
+        # Holding the right button steers continuously
+        if buttons & arcade.MOUSE_BUTTON_RIGHT:
+            self.input_queue.push("target", *self.camera.to_world(x, y))
+
+    def on_key_press(self, symbol, modifiers):
+        if symbol == arcade.key.SPACE:
+            self.input_queue.push("dash")
+        elif symbol == arcade.key.S:
+            self.input_queue.push("stop")
+        elif symbol in STEER_KEYS:
+            self.input_queue.press(symbol)
+        elif symbol in ARTIFACT_KEYS:
+            self.input_queue.push("artifact", value=ARTIFACT_KEYS[symbol])
+        elif symbol == arcade.key.F5:
+            self.run_on_sim(self.quicksave)
+        elif symbol == arcade.key.F9 and QUICKSAVE_PATH.exists():
+            self.run_on_sim(self.quickload)
+        elif symbol == arcade.key.BACKSPACE and self.rewind_buffer:
+            self.run_on_sim(self.rewind)
+
+    def run_on_sim(self, fn):
+        # Saves and rewinds touch simulation state, so with a worker they wait for it between ticks
+        if self.pipeline:
+            self.pipeline.call(fn)
+        else:
+            fn()
+
+    def quicksave(self):
+        QUICKSAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        size = write_snapshot(QUICKSAVE_PATH, self)
+        print(f"💾 Quick-saved ({size} bytes)")
+
+    def quickload(self):
+        read_snapshot(QUICKSAVE_PATH, self)
+        print("📂 Quick-loaded")
+
+    def rewind(self):
+        if self.rewind_buffer:
+            restore_snapshot(self, self.rewind_buffer.pop())
+            self.rewind_timer = 1.0
+            print(f"⏪ Rewound ({len(self.rewind_buffer)}s of history left)")
+
+    def on_key_release(self, symbol, modifiers):
+        if symbol in STEER_KEYS:
+            self.input_queue.release(symbol)
+
@@ -1,24 +1,22 @@
 import arcade
 import random
 from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
-from scripts.utils.resource_helper import resource_path
-
-SHOP_MUSIC_PATH = "assets/audio/shop.mp3"
+from scripts.utils.music import play_music
+from scripts.utils.save_store import get_store
+from scripts.mechanics.modifiers import SET, apply_upgrade
 
 class ShopView(arcade.View):
     def __init__(self, player, return_view):
         super().__init__()
         self.player = player
         self.return_view = return_view
-        self.music = None
         self.items = []
         self.selected_item = None
         self.message = ""
 
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
-        self.music = arcade.load_sound(resource_path(SHOP_MUSIC_PATH))
-        arcade.play_sound(self.music, volume=0.5, looping=True)
+        play_music("shop")
         self.generate_shop_items()
 
     def generate_shop_items(self):
@@ -53,8 +51,10 @@ class ShopView(arcade.View):
             {"name": "Second Chance", "desc": "Revive with 1 Heart", "cost": 20, "type": "util", "effect": "revive"},
         ]
 
-        # Select 3 unique random items
-        self.items = random.sample(all_items, 3)
+        # Select 3 unique random items, leaving out permanent upgrades already owned
+        owned = set(get_store().upgrades)
+        available = [item for item in all_items if not (item["type"] == "perm" and item["effect"] in owned)]
+        self.items = random.sample(available, min(3, len(available)))
 
     def on_draw(self):
         self.clear()
@@ -82,10 +82,35 @@ class ShopView(arcade.View):
         if self.player.coins >= item["cost"]:
             self.player.coins -= item["cost"]
             self.message = f"✅ Bought {item['name']}!"
-            # TODO: Apply effect based on item["effect"]
+            store = get_store()
+            store.save_coins(self.player.coins)
+            if item["type"] == "perm":
+                store.add_upgrade(item["effect"], item["name"])
+                self.items.pop(idx)  # owned now, don't offer it twice
+            self.apply_item(item)
         else:
             self.message = "❌ Not enough coins!"
 
+    def apply_item(self, item):
+        effect = item["effect"]
+        player = self.player
+        if item["type"] == "perm":
+            apply_upgrade(player, effect)
+            if effect.startswith("hp_"):
+                # New heart slots come filled
+                player.current_hearts = min(player.current_hearts + int(effect[3:]), player.max_slots)
+        elif effect == "shield":
+            player.shield = True
+        elif effect == "multiplier":
+            waves = random.randint(1, 3)
+            player.stats.add("multiplier", SET, 2.0, "shop:multiplier",
+                             duration=waves * self.return_view.wave_duration, replace=True)
+            player.active_orbs.append(["Score x2", waves * self.return_view.wave_duration])
+        elif effect == "skip":
+            self.return_view.skip_wave()
+        elif effect == "revive":
+            player.revives += 1
+
     def on_mouse_press(self, x, y, button, modifiers):
-        arcade.stop_sound(self.music)
+        # The game view crossfades back to its own music when shown
         self.window.show_view(self.return_view)
@@ -1,32 +1,19 @@
 import arcade
 import pyglet
-from scripts.utils.resource_helper import resource_path
+from scripts.utils.registry import VIEWS
+from scripts.utils.gc_scheduler import gc_scheduler
+from scripts.utils.mixer import play_sfx
+from scripts.utils.music import play_music
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-SCREEN_TITLE = "Neododge"
 
 class StartView(arcade.View):
     def __init__(self):
         super().__init__()
-        self.music = None
-        self.media_player = None
 
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
-
-        # Load music
-        music_path = resource_path("assets/audio/themev1.mp3")
-        try:
-            self.music = arcade.load_sound(music_path)
-            self.media_player = arcade.play_sound(self.music, volume=0.4, looping=True)
-        except Exception as e:
-            print("Failed to load music:", e)
-
-    def on_hide_view(self):
-        # Stop music when view changes
-        if self.media_player:
-            self.media_player.pause()
+        play_music("start")
 
     def on_draw(self):
         self.clear()
@@ -36,18 +23,16 @@ class StartView(arcade.View):
                          arcade.color.LIGHT_GRAY, font_size=20, anchor_x="center")
 
     def start_game(self):
-        from main import NeododgeGame
-        game_view = NeododgeGame()
+        game_class = VIEWS["game"]
+        # Modules and assets are loaded now; freeze them before a game view or wave exists,
+        # since anything frozen is never collected
+        gc_scheduler.freeze_after_load()
+        game_view = game_class()
         game_view.setup()
 
-        # Stop title music
-        if self.media_player:
-            self.media_player.pause()
-
         # Play click sound and voice line
-        click_sound = arcade.load_sound(resource_path("assets/audio/start_click.wav"))
-        #voice_line = arcade.load_sound(resource_path("assets/audio/lets_go.wav"))
-        arcade.play_sound(click_sound)
+        play_sfx("start_click")
+        #voice_line = load_sound("assets/audio/lets_go.wav")
         #arcade.play_sound(voice_line)
 
         # Delay switching views using pyglet
@@ -6,9 +6,8 @@ from scripts.mechanics.artifacts.artifacts import (
     DashArtifact, MagnetPulseArtifact, SlowFieldArtifact,
     BulletTimeArtifact, CloneDashArtifact
 )
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
 SCREEN_TITLE = "Artifact Test View"
 
 ARTIFACT_COOLDOWNS = {
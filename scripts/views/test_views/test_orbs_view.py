@@ -3,13 +3,12 @@ import math
 from scripts.characters.player import Player
 from scripts.mechanics.orbs.buff_orbs import BuffOrb
 from scripts.mechanics.orbs.debuff_orbs import DebuffOrb
+from scripts.mechanics.collision import collide_many
 
 import arcade
-import arcade.gl
-import array
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from scripts.utils.shaders import gl_cache, load_vision_shader, create_vision_geometry
 
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
 SCREEN_TITLE = "Orb Test View"
 
 class OrbTestView(arcade.View):
@@ -27,60 +26,11 @@ class OrbTestView(arcade.View):
     def on_show(self):
         arcade.set_background_color(arcade.color.DARK_SLATE_GRAY)
         
-        self.fbo = self.window.ctx.framebuffer(
-            color_attachments=[self.window.ctx.texture((self.window.width, self.window.height))]
-        )
-
-        # Shader that cuts a circle around the player
-        self.vision_shader = self.window.ctx.program(
-            vertex_shader="""
-                #version 330
-                in vec2 in_vert;
-                in vec2 in_tex;
-                out vec2 uv;
-                void main() {
-                    gl_Position = vec4(in_vert, 0.0, 1.0);
-                    uv = in_tex;
-                }
-            """,
-            fragment_shader="""
-                #version 330
-                uniform vec2 resolution;
-                uniform vec2 center;
-                uniform float radius;
-                in vec2 uv;
-                out vec4 fragColor;
-
-                void main() {
-                    vec2 screen_pos = uv * resolution;
-                    float dist = distance(screen_pos, center);
-                    if (dist < radius) {
-                        discard;
-                    }
-                    fragColor = vec4(0, 0, 0, 0.9);  // semi-transparent black outside vision
-                }
-            """
-        )
-
-        # Define 2 triangles (full screen quad)
-        quad = array.array(
-            'f', [
-                -1.0, -1.0, 0.0, 0.0,  # bottom left
-                 1.0, -1.0, 1.0, 0.0,  # bottom right
-                -1.0,  1.0, 0.0, 1.0,  # top left
-
-                 1.0, -1.0, 1.0, 0.0,  # bottom right
-                 1.0,  1.0, 1.0, 1.0,  # top right
-                -1.0,  1.0, 0.0, 1.0   # top left
-            ]
-        )
-
-        vbo = self.window.ctx.buffer(data=quad)
-
-        # Tell OpenGL how to interpret the vertex data
-        self.vision_geometry = self.window.ctx.geometry(
-            [arcade.gl.BufferDescription(vbo, "2f 2f", ["in_vert", "in_tex"])]
-        )
+        # Shared with the game view: compiled once per context, however often this is shown
+        cache = gl_cache(self.window.ctx)
+        self.fbo = cache.framebuffer("orb_test", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.vision_shader = load_vision_shader(self.window)
+        self.vision_geometry = create_vision_geometry(self.window)
 
     def setup(self):
         start_x = SCREEN_WIDTH // 2
@@ -125,9 +75,10 @@ class OrbTestView(arcade.View):
 
         # 👁️ Apply vision blur AFTER drawing world, BEFORE HUD
         if self.player.vision_blur:
-            self.vision_shader["resolution"] = self.window.get_size()
+            self.vision_shader["resolution"] = (SCREEN_WIDTH, SCREEN_HEIGHT)
             self.vision_shader["center"] = (self.player.center_x, self.player.center_y)
             self.vision_shader["radius"] = 130.0
+            self.vision_shader["smooth_edge"] = False
             self.vision_geometry.render(self.vision_shader)
 
         # --- HUD Layer ---
@@ -152,7 +103,7 @@ class OrbTestView(arcade.View):
         # Bind texture and shader
         self.fbo.color_attachments[0].use()
         self.vision_shader["tex"] = 0
-        self.vision_shader["resolution"] = (self.window.width, self.window.height)
+        self.vision_shader["resolution"] = (SCREEN_WIDTH, SCREEN_HEIGHT)
         self.vision_shader["center"] = (self.player.center_x, self.player.center_y)
         self.vision_shader["radius"] = 150.0
 
@@ -164,10 +115,10 @@ class OrbTestView(arcade.View):
 
         for orb in self.orbs:
             orb.update(delta_time)
-            if arcade.check_for_collision(self.player, orb):
-                orb.apply_effect(self.player)
-                self.player.pickup_texts.append([orb.message, self.player.center_x, self.player.center_y, 1.0])
-                self.orbs.remove(orb)
+        for orb in collide_many(self.player, self.orbs):
+            orb.apply_effect(self.player)
+            self.player.pickup_texts.append([orb.message, self.player.center_x, self.player.center_y, 1.0])
+            self.orbs.remove(orb)
 
         for t in self.player.pickup_texts:
             t[3] -= delta_time
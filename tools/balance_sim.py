@@ -0,0 +1,439 @@
+"""
+Offline Monte Carlo balancing for WaveManager.
+
+Plays thousands of headless runs of the wave logic (same speeds, damage, timers and
+generate_wave tuning as the game, no sprites or window) in a multiprocessing pool,
+with a scripted player policy, and prints survival, damage and coin tables.
+
+    python -m tools.balance_sim --runs 2000 --policy flee
+    python -m tools.balance_sim --runs 500 --sweep shooter_wave=4,5,6 --sweep rest_every=5,6,8
+    python -m tools.balance_sim --policy mypackage.policies:cautious
+    python -m tools.balance_sim --check-motion
+
+--check-motion steps one bullet through both this model and the real game for one tick
+and fails if they disagree, so the speeds above can't silently drift apart.
+"""
+import argparse
+import importlib
+import itertools
+import math
+import random
+import statistics
+import time
+from multiprocessing import Pool, cpu_count
+
+from scripts.characters.enemy import ENEMY_SPEED, WANDER_SPEED
+from scripts.characters.player import PLAYER_SPEED
+from scripts.mechanics.bullet_patterns import BULLET_PATTERNS
+from scripts.mechanics.orbs.orb_pool import BUFF_ORBS, DEBUFF_ORBS
+from scripts.mechanics.wave_manager import WaveManager, WAVE_TUNING
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+TICK = 1 / 30
+PLAYER_RADIUS = 16
+ENEMY_RADIUS = 16
+BULLET_RADIUS = 5
+PICKUP_RADIUS = 25
+INVINCIBILITY = 1.0
+
+
+class SimPlayer:
+    def __init__(self):
+        self.x = SCREEN_WIDTH / 2
+        self.y = SCREEN_HEIGHT / 2
+        self.hearts = 3.0
+        self.max_slots = 3
+        self.gold_hearts = 0
+        self.speed_bonus = 1.0
+        self.radius = PLAYER_RADIUS
+        self.invincible_timer = 0.0
+        self.timed_effects = []  # [seconds_left, attribute, delta]
+
+    @property
+    def alive(self):
+        return self.hearts + self.gold_hearts > 0
+
+    def take_damage(self, amount):
+        if self.invincible_timer > 0:
+            return 0.0
+        self.invincible_timer = INVINCIBILITY
+        taken = 0.0
+        while amount > 0 and self.alive:
+            if self.gold_hearts > 0:
+                self.gold_hearts -= 1
+                amount -= 1
+            else:
+                self.hearts -= 0.5
+                amount -= 0.5
+            taken += 0.5
+        return taken
+
+
+class SimState:
+    """What a policy can see: the player plus plain lists of (x, y, ...) entities."""
+
+    def __init__(self):
+        self.player = SimPlayer()
+        self.enemies = []  # [x, y, behavior, dir_x, dir_y, bullet_timer, pattern, volleys_fired]
+        self.bullets = []  # [x, y, vx, vy, age]
+        self.orbs = []     # [x, y, is_debuff, orb_type]
+        self.coins = []    # [x, y]
+
+
+# --- Policies: state -> (target_x, target_y) or None to stand still ---
+
+def idle_policy(state):
+    return None
+
+
+def flee_policy(state):
+    # Move away from the sum of nearby threats, pulled gently back toward the centre
+    p = state.player
+    push_x = (SCREEN_WIDTH / 2 - p.x) * 0.002
+    push_y = (SCREEN_HEIGHT / 2 - p.y) * 0.002
+    for x, y, *_ in itertools.chain(state.enemies, state.bullets):
+        dx, dy = p.x - x, p.y - y
+        dist_sq = dx * dx + dy * dy
+        if 0 < dist_sq < 200 * 200:
+            push_x += dx / dist_sq * 100
+            push_y += dy / dist_sq * 100
+    return p.x + push_x * 100, p.y + push_y * 100
+
+
+def greedy_policy(state):
+    # Flee when something is close, otherwise walk to the nearest coin or buff-looking orb
+    p = state.player
+    threat = any(
+        (x - p.x) ** 2 + (y - p.y) ** 2 < 120 * 120 for x, y, *_ in itertools.chain(state.enemies, state.bullets)
+    )
+    if threat:
+        return flee_policy(state)
+    pickups = state.coins + [orb[:2] for orb in state.orbs]
+    if not pickups:
+        return flee_policy(state)
+    return min(pickups, key=lambda c: (c[0] - p.x) ** 2 + (c[1] - p.y) ** 2)[:2]
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "flee": flee_policy,
+    "greedy": greedy_policy,
+}
+
+
+def resolve_policy(name):
+    if name in POLICIES:
+        return POLICIES[name]
+    module_path, attr = name.split(":")
+    return getattr(importlib.import_module(module_path), attr)
+
+
+# --- Simulation ---
+
+def _random_point(rng):
+    return rng.randint(50, SCREEN_WIDTH - 50), rng.randint(50, SCREEN_HEIGHT - 50)
+
+
+def _spawn_orb(state, rng):
+    x, y = _random_point(rng)
+    is_debuff = rng.random() < 0.2
+    orb_type = rng.choice(DEBUFF_ORBS if is_debuff else BUFF_ORBS)
+    state.orbs.append([x, y, is_debuff, orb_type])
+
+
+def _apply_orb(player, orb_type):
+    # Only effects that change survival are modelled
+    if orb_type == "gray":
+        player.max_slots += 1
+    elif orb_type == "red" and player.hearts < player.max_slots:
+        player.hearts += 1
+    elif orb_type == "gold":
+        player.gold_hearts += 1
+    elif orb_type.startswith("speed_"):
+        bonus = int(orb_type.split("_")[1]) / 100
+        player.speed_bonus += bonus
+        player.timed_effects.append([45, "speed_bonus", -bonus])
+    elif orb_type == "slow":
+        player.speed_bonus -= 0.2
+        player.timed_effects.append([30, "speed_bonus", 0.2])
+    elif orb_type == "big_hitbox" and player.radius == PLAYER_RADIUS:
+        player.radius = PLAYER_RADIUS * 1.5
+        player.timed_effects.append([30, "radius", PLAYER_RADIUS - player.radius])
+
+
+def _step_player(state, policy, dt):
+    p = state.player
+    target = policy(state)
+    if target is not None:
+        dx, dy = target[0] - p.x, target[1] - p.y
+        dist = math.hypot(dx, dy)
+        if dist > 5:
+            step = min(dist, PLAYER_SPEED * p.speed_bonus * dt)
+            p.x = min(max(p.x + dx / dist * step, 0), SCREEN_WIDTH)
+            p.y = min(max(p.y + dy / dist * step, 0), SCREEN_HEIGHT)
+
+    p.invincible_timer = max(0.0, p.invincible_timer - dt)
+    for effect in p.timed_effects:
+        effect[0] -= dt
+        if effect[0] <= 0:
+            setattr(p, effect[1], getattr(p, effect[1]) + effect[2])
+    p.timed_effects = [e for e in p.timed_effects if e[0] > 0]
+
+
+def _step_enemies(state, dt):
+    p = state.player
+    for enemy in state.enemies:
+        behavior = enemy[2]
+        if behavior == "chaser":
+            dx, dy = p.x - enemy[0], p.y - enemy[1]
+            dist = math.hypot(dx, dy)
+            if dist > 1:
+                enemy[0] += dx / dist * ENEMY_SPEED * dt
+                enemy[1] += dy / dist * ENEMY_SPEED * dt
+        elif behavior == "wander":
+            enemy[0] += enemy[3] * WANDER_SPEED * dt
+            enemy[1] += enemy[4] * WANDER_SPEED * dt
+            if enemy[0] < ENEMY_RADIUS or enemy[0] > SCREEN_WIDTH - ENEMY_RADIUS:
+                enemy[3] = -enemy[3]
+            if enemy[1] < ENEMY_RADIUS or enemy[1] > SCREEN_HEIGHT - ENEMY_RADIUS:
+                enemy[4] = -enemy[4]
+        elif behavior == "shooter":
+            pattern = BULLET_PATTERNS[enemy[6]]
+            enemy[5] += dt
+            if enemy[5] >= pattern.wait(enemy[7]):
+                enemy[5] = 0
+                heading = math.atan2(p.y - enemy[1], p.x - enemy[0]) if pattern.aimed else 0.0
+                for vx, vy in pattern.velocities(heading + pattern.spin * enemy[7]):
+                    state.bullets.append([enemy[0], enemy[1], vx, vy, 0.0])
+                enemy[7] += 1
+
+
+def _resolve_hits(state, dt):
+    p = state.player
+    damage = 0.0
+    enemy_reach = (p.radius + ENEMY_RADIUS) ** 2
+    for x, y, *_ in state.enemies:
+        if (x - p.x) ** 2 + (y - p.y) ** 2 <= enemy_reach:
+            damage += p.take_damage(1.0)
+
+    bullet_reach = (p.radius + BULLET_RADIUS) ** 2
+    remaining = []
+    for bullet in state.bullets:
+        bullet[0] += bullet[2] * dt
+        bullet[1] += bullet[3] * dt
+        bullet[4] += dt
+        if bullet[4] > 0.2 and (bullet[0] - p.x) ** 2 + (bullet[1] - p.y) ** 2 <= bullet_reach and p.invincible_timer <= 0:
+            damage += p.take_damage(0.5)
+            continue
+        if -50 < bullet[0] < SCREEN_WIDTH + 50 and -50 < bullet[1] < SCREEN_HEIGHT + 50:
+            remaining.append(bullet)
+    state.bullets = remaining
+    return damage
+
+
+def check_bullet_motion(tol=0.01):
+    """Move one bullet a tick here and in NeododgeGame.simulate; True when the distances match."""
+    from scripts.characters.enemy import Enemy
+    from scripts.utils.display import GameWindow
+    from scripts.utils.registry import VIEWS
+
+    # Hidden; without a display, run with ARCADE_HEADLESS=1
+    window = GameWindow(SCREEN_WIDTH, SCREEN_HEIGHT, "Motion check", update_rate=None, visible=False)
+    game = VIEWS["game"]()
+    game.setup()
+    window.show_view(game)
+    game.player.take_damage = lambda amount: None
+    game.player.center_x, game.player.center_y = SCREEN_WIDTH - 50, SCREEN_HEIGHT / 2
+    game.enemies.clear()
+    shooter = Enemy(50, SCREEN_HEIGHT / 2, game.player, behavior="shooter")
+    game.enemies.append(shooter)
+
+    # The first tick fires the volley; the second is a plain step
+    shooter.bullet_timer = math.inf
+    game.simulate(TICK)
+    bullet = shooter.bullets[0]
+    start_x, start_y = bullet.center_x, bullet.center_y
+    game.simulate(TICK)
+    game_distance = math.hypot(bullet.center_x - start_x, bullet.center_y - start_y)
+    window.close()
+
+    state = SimState()
+    state.player.x, state.player.y = -1000, -1000
+    vx, vy = bullet.velocity
+    state.bullets.append([start_x, start_y, vx, vy, 0.0])
+    _resolve_hits(state, TICK)
+    sim_x, sim_y = state.bullets[0][:2]
+    sim_distance = math.hypot(sim_x - start_x, sim_y - start_y)
+
+    ok = abs(game_distance - sim_distance) <= tol
+    print(f"{'✅' if ok else '❌'} One {TICK * 1000:.1f} ms tick: bullet moves {game_distance:.2f}px in the game, "
+          f"{sim_distance:.2f}px in the sim")
+    return ok
+
+
+def _collect_pickups(state):
+    p = state.player
+    reach = PICKUP_RADIUS ** 2
+    coins = len(state.coins)
+    state.coins = [c for c in state.coins if (c[0] - p.x) ** 2 + (c[1] - p.y) ** 2 > reach]
+    kept = []
+    for orb in state.orbs:
+        if (orb[0] - p.x) ** 2 + (orb[1] - p.y) ** 2 <= reach:
+            _apply_orb(p, orb[3])
+        else:
+            kept.append(orb)
+    state.orbs = kept
+    return coins - len(state.coins)
+
+
+def simulate_run(tuning, policy_name, seed, max_waves):
+    """One full run; returns (waves_cleared, damage_per_wave, coins_per_wave)."""
+    rng = random.Random(seed)
+    random.seed(seed)  # generate_wave draws from the module-level generator
+    policy = resolve_policy(policy_name)
+    manager = WaveManager(None, tuning=tuning)
+    state = SimState()
+    damage_per_wave = []
+    coins_per_wave = []
+    orb_timer = rng.uniform(4, 8)
+
+    for wave in range(1, max_waves + 1):
+        info = manager.generate_wave(wave)
+        state.enemies = []
+        for behavior, pattern in zip(info["enemy_types"], info["patterns"]):
+            x, y = _random_point(rng)
+            dir_x, dir_y = rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+            state.enemies.append([x, y, behavior, dir_x, dir_y, 0.0, pattern or "aimed", 0])
+        for _ in range(info["orbs"]):
+            _spawn_orb(state, rng)
+
+        coins_to_spawn = rng.randint(1, 5) if wave > 1 else 0
+        coin_timer = rng.uniform(3, 7)
+        duration = 20 + (wave - 1) * 5
+        damage = 0.0
+        coins = 0
+
+        elapsed = 0.0
+        while elapsed < duration:
+            elapsed += TICK
+            _step_player(state, policy, TICK)
+            _step_enemies(state, TICK)
+            damage += _resolve_hits(state, TICK)
+            coins += _collect_pickups(state)
+
+            orb_timer -= TICK
+            if orb_timer <= 0:
+                _spawn_orb(state, rng)
+                orb_timer = rng.uniform(4, 8)
+            if coins_to_spawn > 0:
+                coin_timer -= TICK
+                if coin_timer <= 0:
+                    state.coins.append(list(_random_point(rng)))
+                    coins_to_spawn -= 1
+                    coin_timer = rng.uniform(3, 7)
+
+            if not state.player.alive:
+                damage_per_wave.append(damage)
+                coins_per_wave.append(coins)
+                return wave - 1, damage_per_wave, coins_per_wave
+
+        damage_per_wave.append(damage)
+        coins_per_wave.append(coins)
+        state.bullets = []
+
+    return max_waves, damage_per_wave, coins_per_wave
+
+
+def _run_task(args):
+    return args[0], simulate_run(*args[1:])
+
+
+def summarize(results, max_waves):
+    cleared = [r[0] for r in results]
+    survival = [sum(1 for c in cleared if c >= w) / len(cleared) for w in range(1, max_waves + 1)]
+
+    damage = []
+    coins = []
+    for w in range(max_waves):
+        reached = [r for r in results if len(r[1]) > w]
+        damage.append(statistics.fmean(r[1][w] for r in reached) if reached else 0.0)
+        coins.append(statistics.fmean(r[2][w] for r in reached) if reached else 0.0)
+
+    return {
+        "runs": len(results),
+        "median_cleared": statistics.median(cleared),
+        "mean_cleared": statistics.fmean(cleared),
+        "survival": survival,
+        "damage_per_wave": damage,
+        "coins_per_wave": coins,
+        "total_coins": statistics.fmean(sum(r[2]) for r in results),
+    }
+
+
+def print_wave_table(summary):
+    print(f"{'wave':>5} {'survive':>8} {'dmg':>6} {'coins':>6}")
+    for w, (s, d, c) in enumerate(zip(summary["survival"], summary["damage_per_wave"], summary["coins_per_wave"]), 1):
+        print(f"{w:>5} {s:>8.1%} {d:>6.2f} {c:>6.2f}")
+
+
+def parse_sweep(values):
+    axes = {}
+    for spec in values:
+        key, raw = spec.split("=", 1)
+        if key not in WAVE_TUNING:
+            raise SystemExit(f"Unknown tuning parameter {key!r}; choose from {', '.join(WAVE_TUNING)}")
+        axes[key] = [int(v) for v in raw.split(",")]
+    return [dict(zip(axes, combo)) for combo in itertools.product(*axes.values())] or [{}]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo balancing for WaveManager")
+    parser.add_argument("--runs", type=int, default=1000, help="Runs per tuning combination")
+    parser.add_argument("--waves", type=int, default=20, help="Stop a run after this many waves")
+    parser.add_argument("--policy", default="flee", help=f"{', '.join(POLICIES)} or module:function")
+    parser.add_argument("--sweep", action="append", default=[], metavar="PARAM=V1,V2",
+                        help="Tuning parameter values to sweep; repeat for a grid")
+    parser.add_argument("--workers", type=int, default=cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check-motion", action="store_true",
+                        help="Compare one tick of bullet motion with the real game and exit")
+    args = parser.parse_args()
+
+    if args.check_motion:
+        raise SystemExit(0 if check_bullet_motion() else 1)
+
+    resolve_policy(args.policy)  # fail fast on a bad name
+    combos = parse_sweep(args.sweep)
+    tasks = [
+        (i, combo, args.policy, args.seed + i * args.runs + run, args.waves)
+        for i, combo in enumerate(combos)
+        for run in range(args.runs)
+    ]
+
+    start = time.perf_counter()
+    results = [[] for _ in combos]
+    with Pool(args.workers) as pool:
+        for index, result in pool.imap_unordered(_run_task, tasks, chunksize=max(1, len(tasks) // (args.workers * 8))):
+            results[index].append(result)
+    elapsed = time.perf_counter() - start
+    print(f"🎲 {len(tasks)} runs ({len(combos)} tunings x {args.runs}) with policy '{args.policy}' "
+          f"in {elapsed:.1f}s on {args.workers} workers")
+
+    summaries = [summarize(r, args.waves) for r in results]
+    if len(combos) == 1:
+        print_wave_table(summaries[0])
+        print(f"Median waves cleared: {summaries[0]['median_cleared']}, "
+              f"coins per run: {summaries[0]['total_coins']:.1f}")
+        return
+
+    checkpoints = [w for w in (5, 10, 15, 20) if w <= args.waves]
+    header = " ".join(f"{'S(' + str(w) + ')':>7}" for w in checkpoints)
+    print(f"{'tuning':<40} {'median':>6} {header} {'coins':>6}")
+    for combo, summary in sorted(zip(combos, summaries), key=lambda cs: -cs[1]["mean_cleared"]):
+        label = ", ".join(f"{k}={v}" for k, v in combo.items())
+        survival = " ".join(f"{summary['survival'][w - 1]:>7.1%}" for w in checkpoints)
+        print(f"{label:<40} {summary['median_cleared']:>6} {survival} {summary['total_coins']:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Build step for bundled releases: packs everything under assets/ into a single
+indexed archive (assets.pack) that the game memory-maps at runtime.
+
+    python -m tools.build_asset_pack
+    pyinstaller ... --add-data "assets.pack:."
+"""
+import argparse
+from pathlib import Path
+
+from scripts.utils.asset_pack import AssetPack, build_pack
+from scripts.utils.resource_helper import ASSET_PACK_NAME
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack assets/ into a memory-mappable archive")
+    parser.add_argument("--source", type=Path, default=ROOT / "assets")
+    parser.add_argument("--output", type=Path, default=ROOT / ASSET_PACK_NAME)
+    args = parser.parse_args()
+
+    names = build_pack(args.source, args.output)
+
+    pack = AssetPack(args.output)
+    corrupt = pack.verify()
+    pack.close()
+    if corrupt:
+        raise SystemExit(f"❌ Digest mismatch after packing: {', '.join(corrupt)}")
+
+    size_kb = args.output.stat().st_size / 1024
+    print(f"📦 Packed {len(names)} assets into {args.output} ({size_kb:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Cold-start import benchmark.
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter a few times and
+reports the total import cost plus the slowest modules. Results can be appended to a
+JSON history file so regressions in startup time show up between commits.
+
+    python -m tools.import_time_benchmark --runs 5 --history bench_import_time.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_importtime(target="main"):
+    """Import `target` in a clean interpreter and return {module: (self_us, cumulative_us)}."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{result.stderr}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def summarize(runs, top):
+    totals = [run["main"][1] for run in runs if "main" in run]
+    last = runs[-1]
+    game_modules = sorted(name for name in last if name == "main" or name.startswith("scripts"))
+    slowest = sorted(last.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        "timestamp": time.time(),
+        "runs": len(runs),
+        "total_us_median": int(statistics.median(totals)),
+        "total_us_min": min(totals),
+        "module_count": len(last),
+        "game_modules": game_modules,
+        "slowest_self_us": [[name, us[0]] for name, us in slowest],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of main.py")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="How many of the slowest modules to list")
+    parser.add_argument("--history", type=Path, help="Append the result to this JSON file")
+    args = parser.parse_args()
+
+    runs = [run_importtime() for _ in range(args.runs)]
+    summary = summarize(runs, args.top)
+
+    print(f"⏱ import main: median {summary['total_us_median'] / 1000:.1f} ms, "
+          f"best {summary['total_us_min'] / 1000:.1f} ms over {summary['runs']} runs "
+          f"({summary['module_count']} modules)")
+    print(f"🎮 Game modules loaded at startup: {', '.join(summary['game_modules'])}")
+    print("🐢 Slowest modules (self time):")
+    for name, us in summary["slowest_self_us"]:
+        print(f"   {us / 1000:8.2f} ms  {name}")
+
+    if args.history:
+        history = json.loads(args.history.read_text()) if args.history.exists() else []
+        if history:
+            previous = history[-1]["total_us_median"]
+            delta = (summary["total_us_median"] - previous) / previous * 100
+            print(f"📈 Change vs previous entry: {delta:+.1f}%")
+        history.append(summary)
+        args.history.write_text(json.dumps(history, indent=2))
+
+
+if __name__ == "__main__":
+    main()
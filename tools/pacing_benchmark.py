@@ -0,0 +1,53 @@
+"""
+Runs a live game for a few seconds in each frame pacing mode and prints a jitter table,
+to pick the lowest-latency mode that stays smooth on this machine.
+
+    python -m tools.pacing_benchmark
+    python -m tools.pacing_benchmark --seconds 10 --modes limiter vsync
+    python -m tools.pacing_benchmark --headless   # no display; vsync then behaves like uncapped
+"""
+import argparse
+import os
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0, help="run time per mode")
+    parser.add_argument("--modes", nargs="+", default=["vsync", "uncapped", "limiter"])
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    # Benchmark runs shouldn't leave telemetry files behind
+    os.environ.setdefault("NEODODGE_TELEMETRY", "0")
+    import pyglet
+    if args.headless:
+        pyglet.options["headless"] = True
+
+    from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    from scripts.utils.display import GameWindow
+    from scripts.utils.frame_pacing import FramePacer
+    from scripts.utils.registry import VIEWS
+
+    window = GameWindow(SCREEN_WIDTH, SCREEN_HEIGHT, "Pacing benchmark", update_rate=None)
+    results = []
+    for mode in args.modes:
+        game = VIEWS["game"]()
+        game.setup()
+        game.player.take_damage = lambda amount: None  # keep the run going for the whole window
+        window.show_view(game)
+        pacer = FramePacer(window, mode)
+        pacer.run(duration=args.seconds)
+        results.append((mode, pacer.stats.summary()))
+
+    print(f"{'mode':<10} {'fps':>7} {'mean':>7} {'jitter':>7} {'p99':>7} {'max':>7} {'hitches':>8}")
+    for mode, s in results:
+        if s is None:
+            print(f"{mode:<10} {'-':>7}")
+            continue
+        print(f"{mode:<10} {s['fps']:>7.1f} {s['mean_ms']:>7.2f} {s['jitter_ms']:>7.2f} "
+              f"{s['p99_ms']:>7.2f} {s['max_ms']:>7.2f} {s['hitches']:>8}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
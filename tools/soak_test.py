@@ -0,0 +1,264 @@
+"""
+Long-run soak test: plays 100+ waves of the real game loop headless with a scripted
+player, takes a tracemalloc snapshot at every wave boundary and attributes memory growth
+to the functions that allocated it (Enemy._shoot, spawn_random_orb, ...). Only allocations
+made under the game's own code are counted, so the harness doesn't measure itself.
+
+The player chases pickups, fires its artifacts and gets its hearts refilled after every
+hit, so damage, pickups, clones and the shop/game-over transitions all run without the
+run ending. Artifact waves drop a bare artifact object where the game's pickup test
+expects a sprite, which crashes the game, so the harness skips those drops and counts
+them. Waves are shortened to --wave-seconds. Enemy counts level off by wave 20, so
+after --warmup waves the live set should be flat; the slope of traced memory over the
+remaining waves is the retained growth per wave, and the run exits with status 1 when
+it goes over --max-growth-kb.
+
+    python -m tools.soak_test
+    python -m tools.soak_test --waves 200 --max-growth-kb 32 --draw-every 0
+"""
+import argparse
+import ast
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from functools import lru_cache
+from pathlib import Path
+
+from scripts.utils.constants import ARENA_WIDTH, ARENA_HEIGHT
+
+ROOT = Path(__file__).resolve().parent.parent
+TRACE_FILTERS = [
+    # Only allocations with a game frame in their traceback count. The harness's own (Path
+    # objects in owner(), snapshot comparisons, parsing) would otherwise read as growth.
+    tracemalloc.Filter(True, str(ROOT / "scripts" / "*"), all_frames=True),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+RETARGET_INTERVAL = 0.25  # seconds of game time between scripted inputs
+ARTIFACT_INTERVAL = 2.0
+
+
+@lru_cache(maxsize=None)
+def _function_spans(filename):
+    try:
+        tree = ast.parse(Path(filename).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        return []
+    spans = []
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                name = prefix + child.name
+                if not isinstance(child, ast.ClassDef):
+                    spans.append((child.lineno, child.end_lineno, name))
+                visit(child, name + ".")
+            else:
+                visit(child, prefix)
+
+    visit(tree, "")
+    return spans
+
+
+def function_at(filename, lineno):
+    """Qualified name of the innermost function containing the line, like Enemy._shoot."""
+    best = None
+    for start, end, name in _function_spans(filename):
+        if start <= lineno <= end and (best is None or start >= best[0]):
+            best = (start, name)
+    return best[1] if best else "<module>"
+
+
+def index_game_sources():
+    # Parsed before tracing starts, so the span cache doesn't show up as growth itself
+    for path in (ROOT / "scripts").rglob("*.py"):
+        _function_spans(str(path))
+
+
+def owner(traceback):
+    """(file, function) of the innermost game frame of an allocation, else its innermost line."""
+    for frame in reversed(traceback):
+        path = Path(frame.filename).resolve()
+        if path.is_relative_to(ROOT / "scripts"):
+            return str(path.relative_to(ROOT)), function_at(str(path), frame.lineno)
+    frame = traceback[-1]
+    return frame.filename, f"line {frame.lineno}"
+
+
+def take_snapshot():
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+    return snapshot, sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def growth_by_function(snapshot, baseline):
+    growth = {}
+    for diff in snapshot.compare_to(baseline, "traceback"):
+        if diff.size_diff:
+            key = owner(diff.traceback)
+            growth[key] = growth.get(key, 0) + diff.size_diff
+    return sorted(growth.items(), key=lambda item: -item[1])
+
+
+def slope(points):
+    """Least-squares slope of (x, y) points."""
+    n = len(points)
+    if n < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x if var_x else 0.0
+
+
+def script_player(game, rng):
+    """Head for the nearest pickup, or somewhere random when there's nothing to collect."""
+    player = game.player
+    pickups = list(game.coins) + [orb for orb in game.orbs if orb.age > 0.5]
+    if game.dash_artifact:
+        pickups.append(game.dash_artifact)
+    if pickups:
+        target = min(pickups, key=lambda s: (s.center_x - player.center_x) ** 2 + (s.center_y - player.center_y) ** 2)
+        game.input_queue.push("target", target.center_x, target.center_y)
+    elif rng.random() < 0.2:
+        game.input_queue.push("target", rng.uniform(50, ARENA_WIDTH - 50), rng.uniform(50, ARENA_HEIGHT - 50))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--waves", type=int, default=100)
+    parser.add_argument("--wave-seconds", type=float, default=6.0, help="game time per wave")
+    parser.add_argument("--tick", type=float, default=1 / 60, help="simulation step in seconds")
+    parser.add_argument("--warmup", type=int, default=20, help="waves before growth is measured")
+    parser.add_argument("--max-growth-kb", type=float, default=64.0, help="fail above this retained growth per wave")
+    parser.add_argument("--draw-every", type=int, default=30, help="draw a frame every N ticks, 0 to never draw")
+    parser.add_argument("--frames", type=int, default=12,
+                        help="traceback depth recorded per allocation; it must reach a game frame to count")
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.environ.setdefault("NEODODGE_TELEMETRY", "0")
+    import pyglet
+    pyglet.options["headless"] = True
+    import arcade
+
+    from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    from scripts.utils.display import GameWindow
+    from scripts.utils.registry import VIEWS
+
+    class SoakWindow(GameWindow):
+        # The game view stays up for the whole run; shop visits and deaths are only counted
+        def __init__(self, *a, **kw):
+            super().__init__(*a, **kw)
+            self.skipped_views = {}
+            self.skipped_drops = 0
+
+        def show_view(self, new_view):
+            if self.current_view is None:
+                super().show_view(new_view)
+            else:
+                name = type(new_view).__name__
+                self.skipped_views[name] = self.skipped_views.get(name, 0) + 1
+
+    rng = random.Random(args.seed)
+    random.seed(args.seed)
+    window = SoakWindow(SCREEN_WIDTH, SCREEN_HEIGHT, "Soak test", update_rate=None)
+    game = VIEWS["game"]()
+    game.setup()
+    window.show_view(game)
+
+    spawn_artifact = game.wave_manager.maybe_spawn_artifact
+
+    def field_artifact(*a, **kw):
+        artifact = spawn_artifact(*a, **kw)
+        if artifact is not None and not isinstance(artifact, arcade.Sprite):
+            window.skipped_drops += 1
+            return None
+        return artifact
+    game.wave_manager.maybe_spawn_artifact = field_artifact
+
+    player = game.player
+    take_damage = player.take_damage
+
+    def survive(amount):
+        take_damage(amount)
+        player.current_hearts = float(player.max_slots)
+    player.take_damage = survive
+
+    index_game_sources()
+    tracemalloc.start(args.frames)
+    previous, total = take_snapshot()
+    warmup_snapshot = None
+    history = []  # (wave, traced bytes)
+    wave = game.wave_manager.wave
+    retarget = artifact_timer = 0.0
+    ticks = 0
+    start = time.perf_counter()
+
+    print(f"{'wave':>5} {'traced KB':>10} {'delta KB':>9} {'enemies':>8} {'bullets':>8} {'orbs':>5} "
+          f"{'coins':>6} {'clones':>7}  top grower")
+    while wave <= args.waves:
+        if game.in_wave:
+            game.wave_duration = min(game.wave_duration, args.wave_seconds)
+        retarget -= args.tick
+        if retarget <= 0:
+            script_player(game, rng)
+            retarget = RETARGET_INTERVAL
+        artifact_timer -= args.tick
+        if artifact_timer <= 0 and player.artifacts:
+            game.input_queue.push("artifact", value=rng.randrange(len(player.artifacts)))
+            artifact_timer = ARTIFACT_INTERVAL
+
+        game.on_update(args.tick)
+        ticks += 1
+        if args.draw_every and ticks % args.draw_every == 0:
+            game.on_draw()
+            # As in the real loop: the flip also frees GL objects of sprite lists that died
+            window.flip()
+
+        if game.wave_manager.wave == wave:
+            continue
+        snapshot, traced = take_snapshot()
+        top = growth_by_function(snapshot, previous)[:1]
+        top_text = f"{top[0][0][1]} +{top[0][1] / 1024:.1f} KB" if top and top[0][1] > 0 else ""
+        print(f"{wave:>5} {traced / 1024:>10.1f} {(traced - total) / 1024:>+9.1f} {len(game.enemies):>8} "
+              f"{sum(len(e.bullets) for e in game.enemies):>8} {len(game.orbs):>5} {len(game.coins):>6} "
+              f"{len(game.clones):>7}  {top_text}")
+        history.append((wave, traced))
+        if wave == args.warmup:
+            warmup_snapshot = snapshot
+        previous, total = snapshot, traced
+        wave = game.wave_manager.wave
+
+    elapsed = time.perf_counter() - start
+    print(f"\n{ticks} ticks ({ticks * args.tick / 60:.1f} game minutes) in {elapsed:.0f} s; "
+          f"skipped views: {window.skipped_views or 'none'}, skipped artifact drops: {window.skipped_drops}")
+
+    measured = [(w, traced) for w, traced in history if w >= args.warmup]
+    growth_kb = slope(measured) / 1024
+    if warmup_snapshot is not None:
+        print(f"\nGrowth by function since wave {args.warmup}:")
+        for (filename, function), size in growth_by_function(previous, warmup_snapshot)[:args.top]:
+            print(f"  {size / 1024:>+9.1f} KB  {function}  ({filename})")
+
+    window.close()
+    if len(measured) < 2:
+        print(f"⚠️ Not enough waves after warmup ({args.warmup}) to measure growth")
+        return 0
+    if growth_kb > args.max_growth_kb:
+        print(f"❌ Retained growth {growth_kb:.1f} KB/wave over waves {args.warmup}-{args.waves} "
+              f"(limit {args.max_growth_kb:.0f} KB/wave)")
+        return 1
+    print(f"✅ Retained growth {growth_kb:.1f} KB/wave over waves {args.warmup}-{args.waves} "
+          f"(limit {args.max_growth_kb:.0f} KB/wave)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Cost of one FlockSteering pass at 25, 250 and 2 500 enemies, against a brute-force
+O(n^2) neighbour scan. The arena grows with the count so enemy density stays at the
+level of a normal 25-enemy wave on an 800x600 screen.
+
+    python -m tools.steering_benchmark
+    python -m tools.steering_benchmark --counts 25 250 2500 10000 --no-brute-force
+"""
+import argparse
+import math
+import random
+import time
+
+from scripts.characters.enemy import Enemy
+from scripts.mechanics.steering import FlockSteering, NEIGHBOUR_RADIUS
+from scripts.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+BASE_COUNT = 25
+
+
+class _Target:
+    center_x = 0.0
+    center_y = 0.0
+
+
+def make_enemies(count, rng):
+    scale = math.sqrt(count / BASE_COUNT)
+    width, height = SCREEN_WIDTH * scale, SCREEN_HEIGHT * scale
+    target = _Target()
+    enemies = []
+    for _ in range(count):
+        enemy = Enemy(rng.uniform(0, width), rng.uniform(0, height), target, behavior=rng.choice(["chaser", "wander"]))
+        enemy.velocity_x = rng.uniform(-100, 100)
+        enemy.velocity_y = rng.uniform(-100, 100)
+        enemies.append(enemy)
+    return enemies
+
+
+def brute_force_pass(enemies, radius=NEIGHBOUR_RADIUS):
+    radius_sq = radius * radius
+    pairs = 0
+    for enemy in enemies:
+        for other in enemies:
+            if other is not enemy:
+                dx = enemy.center_x - other.center_x
+                dy = enemy.center_y - other.center_y
+                if dx * dx + dy * dy < radius_sq:
+                    pairs += 1
+    return pairs
+
+
+def time_it(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark grid-backed flocking")
+    parser.add_argument("--counts", type=int, nargs="+", default=[25, 250, 2500])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--no-brute-force", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'enemies':>8} {'grid ms':>9} {'us/enemy':>9} {'brute ms':>9}")
+    for count in args.counts:
+        enemies = make_enemies(count, rng)
+        steering = FlockSteering()
+        # dt=0 keeps positions fixed so every repeat measures the same layout
+        grid_ms = time_it(lambda: steering.apply(enemies, 0.0), args.repeats)
+        brute = "-"
+        if not args.no_brute_force:
+            brute = f"{time_it(lambda: brute_force_pass(enemies), 1):9.2f}"
+        print(f"{count:>8} {grid_ms:>9.3f} {grid_ms * 1000 / count:>9.2f} {brute:>9}")
+
+
+if __name__ == "__main__":
+    main()